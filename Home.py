@@ -1,306 +1,328 @@
 import streamlit as st
-from streamlit_option_menu import option_menu
-from datetime import datetime
-from PIL import Image
-import base64
-from io import BytesIO
-from streamlit_extras.let_it_rain import rain
+import os
 from streamlit_extras.stylable_container import stylable_container
 
-# Custom color palette
-colors = {
-    'primary': '#bf8065',
-    'secondary': '#541f1f',
-    'accent': '#901f3b',
-    'background': '#ffffff',
-    'light': '#ffdbdb',
-    'medium': '#ff9d9d',
-    'dark': '#ffc0c0'
-}
+from portfolio import analytics, memory, metrics, warmup
+from portfolio.assets import cv_cache, image_path_for, image_url, read_file, use_static_images
+from portfolio.content import load_content
+from portfolio.embeds import EMBEDS, embed_src
+from portfolio.fragments import cached_html
+from portfolio.metrics import section, timed
+from portfolio.pages import PAGES
+from portfolio.search import search_index
+from portfolio.styles import inject_styles, register_style
+from portfolio.theme import load_themes, register_theme, toggle_html
+from portfolio.ui import gallery_html
 
+AVATAR_PATH = "./image/maomao.jpg"
+CV_PATH = "./Hafidzahidah_CV.pdf"
 
-def get_experience(year):
+
+def cherry_blossom_animation(budget=24):
     """
-    Retrieve experiences for a given year.
+    Generate HTML/JS for the cherry blossom header animation.
+
+    Draws a fixed pool of petals on a single canvas and recycles each petal
+    once it falls out of view, so no DOM nodes or timers are created while it
+    runs. The loop stops while the header is scrolled out of view, while the
+    tab is hidden, and entirely when the user prefers reduced motion.
 
     Args:
-    year (int): The year to get experiences for.
+    budget (int): Number of petals in the pool.
 
     Returns:
-    dict: A dictionary of experiences for the given year.
+    str: HTML document for st.iframe.
     """
-    experiences = {
-        2017: {
-            "October": "🏅 Completed my SPM with results of 5As and 4Bs."
-        },
-        2018: {
-            "April": "🎓 Started my journey at Selangor College Matriculation."
-                     "\n\n- First exposure to programming(Java), leading to pursuit of IT-related degree."
-        },
-        2019: {
-            "April": "🏅 Graduated from Selangor College Matriculation with a CGPA of 3.84.",
-            "August": "🎓 Began my studies at Universiti Teknologi MARA (UiTM) pursuing a Bachelor of Information Systems (Hons.) in Intelligent Systems Engineering."
-                      "\n\n- This program offers two specializations: Big Data and Intelligent Computing that covers disciplines like Business Intelligence, Analytics, Enterprise Resource Planning, and Software Development."
-        },
-        2020: {
-            "January": "🦉 Began learning the German language as it is a requirement to take a third language subject at UiTM."
-        },
-        2021: {},
-        2022: {
-            "July": "💻 Completed my Final Year Project titled 'Sentiment Analysis on COVID-19 Booster Vaccines'.",
-            "September": "💼 Started my internship at Xeersoft Sdn. Bhd as a Software Developer Intern."
-                         "\n\n- Full-stack developer role contributing to Xeersoft ERP system development, enhancement, and debugging using PHP, JavaScript, and SQL."
-        },
-        2023: {
-            "January": "🏅 Completed internship at Xeersoft Sdn. Bhd."
-                       "\n\n🏅 Graduated from UiTM with First Class Honours in Information Systems (Hons.) Intelligent Systems Engineering.",
-            "February": "💼 Returned to Xeersoft Sdn. Bhd. as a Junior Software Developer."
-                        "\n\n- Worked on developing and enhancing the Xeersoft ERP system, focusing on various modules such as Inventory and Accounting using PHP, JavaScript, and SQL."
-                        "\n\n- Contributed to API development in Slim framework."
-                        "\n\n- Collaborated with cross-functional teams to deliver high-quality software solutions."
-                        "\n\n- Optimized application performance and ensured code quality through rigorous testing and debugging."
-                        "\n\n- Redesigned the system dashboard to improve user engagement and enable more informed business decisions."
-        },
-        2024: {
-            "March": "🦉 Began learning the Japanese language for the love of 'The Apothecary Diaries' 🔥🔥🔥.",
-            "May": "🎓 Joined the Yayasan Peneraju - Peneraju Teknologi Fullstack Java Professional Train and Upskill Program."
-                   "\n\n- This program provides comprehensive training in full-stack development using Java, hands-on experience with Spring Boot, and preparation for obtaining Oracle Certified Foundation Associate and Oracle Certified Professional Java Developer certifications."
+    return """
+    <style>
+    html, body { margin: 0; overflow: hidden; background: transparent; }
+    #petals { display: block; width: 100%%; height: 100vh; }
+    </style>
+    <canvas id="petals"></canvas>
+    <script>
+    (() => {
+        const BUDGET = %d;
+        const canvas = document.getElementById('petals');
+        const ctx = canvas.getContext('2d');
+        const reducedMotion = window.matchMedia('(prefers-reduced-motion: reduce)');
+        const petals = [];
+        let width = 0, height = 0, frame = null, last = 0, inView = true;
+
+        function resize() {
+            const ratio = window.devicePixelRatio || 1;
+            width = canvas.clientWidth;
+            height = canvas.clientHeight;
+            canvas.width = width * ratio;
+            canvas.height = height * ratio;
+            ctx.setTransform(ratio, 0, 0, ratio, 0, 0);
+        }
+
+        function reset(petal, anywhere) {
+            petal.size = Math.random() * 10 + 5;
+            petal.x = Math.random() * width;
+            petal.y = anywhere ? Math.random() * height : -petal.size;
+            // Fall the full height in 5-10 s, like the original CSS animation.
+            petal.speed = height / (Math.random() * 5 + 5);
+            petal.angle = Math.random() * Math.PI * 2;
+            petal.spin = (Math.random() * 2 + 1) * (Math.random() < 0.5 ? -1 : 1);
+        }
+
+        function tick(now) {
+            const dt = Math.min((now - last) / 1000, 0.1);
+            last = now;
+            ctx.clearRect(0, 0, width, height);
+            ctx.fillStyle = '#FFB7C5';
+            for (const petal of petals) {
+                petal.y += petal.speed * dt;
+                petal.angle += petal.spin * dt;
+                if (petal.y > height + petal.size) reset(petal, false);
+                ctx.save();
+                ctx.translate(petal.x, petal.y);
+                ctx.rotate(petal.angle);
+                ctx.beginPath();
+                ctx.ellipse(0, 0, petal.size / 2, petal.size / 4, 0, 0, Math.PI * 2);
+                ctx.fill();
+                ctx.restore();
+            }
+            frame = requestAnimationFrame(tick);
         }
+
+        function update() {
+            const run = inView && !document.hidden && !reducedMotion.matches;
+            if (run && frame === null) {
+                last = performance.now();
+                frame = requestAnimationFrame(tick);
+            } else if (!run && frame !== null) {
+                cancelAnimationFrame(frame);
+                frame = null;
+                if (reducedMotion.matches) ctx.clearRect(0, 0, width, height);
+            }
+        }
+
+        resize();
+        for (let i = 0; i < BUDGET; i++) {
+            const petal = {};
+            reset(petal, true);
+            petals.push(petal);
+        }
+        new IntersectionObserver(entries => {
+            inView = entries[entries.length - 1].isIntersecting;
+            update();
+        }).observe(canvas);
+        document.addEventListener('visibilitychange', update);
+        reducedMotion.addEventListener('change', update);
+        window.addEventListener('resize', resize);
+        update();
+    })();
+    </script>
+    """ % budget
+
+
+# Body CSS. Streamlit's own theme only follows the system preference, so
+# the app background and text follow the portfolio theme instead.
+register_style("base", """
+    @import url('https://fonts.googleapis.com/css2?family=Quicksand:wght@300;400;700&display=swap');
+
+    .stApp, [data-testid="stHeader"] {
+        background-color: var(--color-background);
+        color: var(--color-text);
+    }
+    h1, h2, h3, h4, h5, h6 {
+        font-family: 'Quicksand', sans-serif;
+        color: var(--color-secondary);
     }
-    return experiences.get(year, {})
+    .big-font {
+        font-size: 40px !important; 
+        font-weight: bold; 
+        font-family: 'Comfortaa', cursive;
+        color: var(--color-primary);
+        text-align: center;
+    }
+    .medium-font {
+        font-size: 30px !important; 
+        font-family: 'Pacifico', cursive;
+        color: var(--color-secondary);
+        text-align: center;
+    }
+    .small-font {
+        font-size: 16px !important; 
+        font-family: 'Quicksand', sans-serif;
+        color: var(--color-secondary);
+    }
+    .job-font {
+        font-size: 20px !important; 
+        font-family: 'Comfortaa', cursive;
+        color: var(--color-secondary);
+        text-align: center;
+    }
+    .stButton>button {
+        background-color: var(--color-light);
+        color: var(--color-secondary);
+        border: 2px solid var(--color-primary);
+        border-radius: 20px;
+        padding: 10px 20px;
+    }
+    .stSidebar {
+        background-color: var(--color-light);
+    }
+    .card {
+        background-color: var(--color-background);
+        border-radius: 10px;
+        padding: 20px;
+        box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2);
+        margin: 20px;
+        transition: transform 0.3s ease, box-shadow 0.3s ease;
+    }
+    .card:hover {
+        transform: translateY(-5px);
+        box-shadow: 0 8px 16px rgba(0, 0, 0, 0.3);
+    }
+    .centered {
+        text-align: center;
+    }
+""")
+
+
+@timed()
+def setup_page_config():
+    """Set up the page configuration."""
+    st.set_page_config(page_title="Hafidzahidah Binti Wangit", layout="wide")
+    st.iframe(cherry_blossom_animation(), height=50)
+
+    register_theme()
+    inject_styles()
 
 
-def style_image(image_path, max_width="100%"):
+def avatar_html():
     """
-    Apply styling to an image.
+    Build an <img> for the sidebar avatar from its static URL.
 
-    Args:
-    image_path (str): Path to the image file.
-    max_width="100%" : size of the image container.
+    A static URL keeps the image out of Streamlit's media file manager, which
+    would otherwise hold a copy registered for every session. It is used as
+    is, relative like the embed icons' URLs, so it resolves under
+    server.baseUrlPath; st.image would only take it with a leading slash.
 
     Returns:
-    str: HTML string with styled image.
+    str or None: HTML, or None if images aren't served statically or the
+        avatar has no pre-encoded variant.
     """
-    img = Image.open(image_path)
-    buffered = BytesIO()
-    img.save(buffered, format="PNG")
-    img_str = base64.b64encode(buffered.getvalue()).decode()
+    url = image_url(AVATAR_PATH, "jpeg", width=320) if use_static_images() else None
+    if url is None:
+        return None
+    return f'<img class="sidebar-avatar" src="{url}" alt="">'
 
-    html = f'''
-    <style>
-        .img-container {{
-            transition: transform 0.3s ease, box-shadow 0.3s ease;
-            max-width: {max_width};
-            width: 100%;
-            height: auto;
-            border-radius: 10px;
-            overflow: hidden;
-            box-shadow: 0 4px 8px 0 rgba(0, 0, 0, 0.2);
-            display: flex;
-            justify-content: center;
-            align-items: center;
-        }}
-        .img-container:hover {{
-            transform: translateY(-5px);
-            box-shadow: 0 10px 20px rgba(0,0,0,0.2);
-        }}
-        .rounded-img {{
-            width: 100%;
-            height: auto;
-            object-fit: cover;
-            border-radius: 15px;
-            transition: all 0.3s ease;
-        }}
-        .rounded-img:hover {{
-            filter: brightness(1.1);
-        }}
-    </style>
-    <div class="img-container">
-        <img src="data:image/png;base64,{img_str}" class="rounded-img">
-    </div>
-    '''
-    return html
 
+register_style("avatar", """
+    .sidebar-avatar {
+        display: block;
+        width: 100%;
+        height: auto;
+    }
+""")
 
-def create_skill_tags(skills, title=None):
-    """
-    Create skill tags with styling.
 
-    Args:
-    skills (list): List of skill names.
-    title (str, optional): Title for the skills section.
+def social_links_html(profile, icons):
     """
-    st.markdown(f"""
-    <style>
-        .skill-container {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 8px;
-            margin-bottom: 15px;
-        }}
-        .skill-tag {{
-            background-color: {colors['light']};
-            color: {colors['secondary']};
-            padding: 5px 10px;
-            border-radius: 15px;
-            font-size: 0.8em;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            transition: all 0.3s ease;
-        }}
-        .skill-tag:hover {{
-            background-color: {colors['medium']};
-            box-shadow: 0 4px 8px rgba(0,0,0,0.15);
-            transform: translateY(-2px);
-        }}
-    </style>
-    """, unsafe_allow_html=True)
+    Build the sidebar's LinkedIn and GitHub links.
 
-    if title:
-        st.subheader(title)
+    Args:
+    profile (Profile): The profile from the content model.
+    icons (tuple): src of the LinkedIn icon and of the GitHub icon.
 
-    tags_html = "".join([f'<div class="skill-tag">{skill}</div>' for skill in skills])
-    st.markdown(f'<div class="skill-container">{tags_html}</div>', unsafe_allow_html=True)
+    Returns:
+    tuple: HTML for the LinkedIn link and for the GitHub link.
+    """
+    return tuple(f'''
+        <a href="{href}" target="_blank">
+            <img src="{src}" width="30" height="30">
+        </a>
+        ''' for href, src in zip((profile.linkedin, profile.github), icons))
 
 
-def cherry_blossom_animation():
-    """Generate HTML/CSS for cherry blossom header animation."""
-    return """
-    <style>
-    .petal {
-        position: absolute;
-        background-color: #FFB7C5;
-        border-radius: 150% 0 150% 0;
-        animation: falling 10s infinite;
-    }
-    @keyframes falling {
-        0% { top: -10%; transform: rotate(0deg); }
-        100% { top: 100%; transform: rotate(720deg); }
+register_style("nav", """
+    [data-testid="stPageLink-NavLink"] {
+        font-size: 16px;
     }
-    </style>
-    <div id="petals"></div>
-    <script>
-    function createPetal() {
-        const petal = document.createElement('div');
-        petal.classList.add('petal');
-        petal.style.left = Math.random() * 100 + '%';
-        petal.style.width = Math.random() * 10 + 5 + 'px';
-        petal.style.height = Math.random() * 10 + 5 + 'px';
-        petal.style.animationDuration = Math.random() * 5 + 5 + 's';
-        document.getElementById('petals').appendChild(petal);
-        setTimeout(() => petal.remove(), 10000);
+    [data-testid="stPageLink-NavLink"]:hover {
+        background-color: var(--color-medium);
     }
-    setInterval(createPetal, 300);
-    </script>
-    """
+""")
 
 
-def setup_page_config():
-    """Set up the page configuration."""
-    st.set_page_config(page_title="Hafidzahidah Binti Wangit", layout="wide")
-    st.components.v1.html(cherry_blossom_animation(), height=50)
+# Document kind -> label shown next to a search result
+SEARCH_KINDS = {"experience": "My Journey", "project": "Project", "skill": "Skill"}
 
-    # Body CSS
-    st.markdown(f"""
-    <style>
-        @import url('https://fonts.googleapis.com/css2?family=Quicksand:wght@300;400;700&display=swap');
-
-        h1, h2, h3, h4, h5, h6 {{
-            font-family: 'Quicksand', sans-serif;
-            color: {colors['secondary']};
-        }}
-        .big-font {{
-            font-size: 40px !important; 
-            font-weight: bold; 
-            font-family: 'Comfortaa', cursive;
-            color: {colors['primary']};
-            text-align: center;
-        }}
-        .medium-font {{
-            font-size: 30px !important; 
-            font-family: 'Pacifico', cursive;
-            color: {colors['secondary']};
-            text-align: center;
-        }}
-        .small-font {{
-            font-size: 16px !important; 
-            font-family: 'Quicksand', sans-serif;
-            color: {colors['secondary']};
-        }}
-        .job-font {{
-            font-size: 20px !important; 
-            font-family: 'Comfortaa', cursive;
-            color: {colors['secondary']};
-            text-align: center;
-        }}
-        .stButton>button {{
-            background-color: {colors['light']};
-            color: {colors['secondary']};
-            border: 2px solid {colors['primary']};
-            border-radius: 20px;
-            padding: 10px 20px;
-        }}
-        .stSidebar {{
-            background-color: {colors['light']};
-        }}
-        .card {{
-            background-color: {colors['background']};
-            border-radius: 10px;
-            padding: 20px;
-            box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2);
-            margin: 20px;
-            transition: transform 0.3s ease, box-shadow 0.3s ease;
-        }}
-        .card:hover {{
-            transform: translateY(-5px);
-            box-shadow: 0 8px 16px rgba(0, 0, 0, 0.3);
-        }}
-        .centered {{
-            text-align: center;
-        }}
-    </style>
-    """, unsafe_allow_html=True)
 
+@st.fragment
+@timed()
+def search_box(pages):
+    """
+    Render the search box and its results.
+
+    Runs as a fragment so a query only reruns the results. Queries go to the
+    process-wide index (portfolio/search.py), built once per content version.
+
+    Args:
+    pages (dict): st.Page entries by url path, for linking results to the
+        page that shows them.
+    """
+    query = st.text_input("Search", placeholder="Search projects, skills, journey",
+                          label_visibility="collapsed")
+    if not query.strip():
+        return
+    results = search_index(load_content()).search(query, limit=8)
+    if not results:
+        st.caption("No matches.")
+    for result in results:
+        document = result.document
+        st.page_link(pages[document.page], label=f"{document.title} · {SEARCH_KINDS[document.kind]}")
+
+
+@timed()
+def sidebar(pages):
+    """
+    Create and populate the sidebar.
+
+    The sidebar is the shell every page shares, so it runs on every rerun:
+    everything in it is either a cheap widget or HTML built once per process.
 
-def sidebar():
-    """Create and populate the sidebar."""
+    Args:
+    pages (list): The st.Page entries to link to, in menu order.
+    """
     with st.sidebar:
         col1, col2, col3 = st.columns(3)
         with col2:
-            st.image("./image/maomao.jpg")
+            avatar = avatar_html()
+            if avatar is None:
+                st.image(image_path_for(AVATAR_PATH, width=320))
+            else:
+                st.markdown(avatar, unsafe_allow_html=True)
 
         # Navigation
-        selected = option_menu(
-            menu_title=None,
-            options=["About", "Projects"],
-            icons=["person", "code-slash"],
-            menu_icon="cast",
-            default_index=0,
-            styles={
-                "container": {"padding": "5!important", "background-color": colors['light']},
-                "icon": {"color": colors['secondary'], "font-size": "25px"},
-                "nav-link": {"font-size": "16px", "text-align": "left", "margin": "0px",
-                             "--hover-color": colors['medium']},
-                "nav-link-selected": {"background-color": colors['medium']},
-            }
-        )
+        for page in pages:
+            st.page_link(page)
+        search_box({spec.url_path: page for spec, page in zip(PAGES, pages)})
+
+        # Switches themes in the browser (portfolio/theme.py), without a rerun
+        themes = load_themes()
+        st.html(cached_html("theme-toggle", lambda: toggle_html(themes), themes),
+                unsafe_allow_javascript=True)
 
         # Contact details
         st.sidebar.header("Contact Details")
-        st.sidebar.write("Email: hafidzahidah@gmail.com")
+        profile = load_content().profile
+        st.sidebar.write(f"Email: {profile.email}")
 
         # Social media icons
         col1, col2, col3, col4, col5, col6 = st.sidebar.columns(6)
-        linkedin_html = '''
-        <a href="https://www.linkedin.com/in/hafidzahidah-w-098670198/" target="_blank">
-            <img src="https://content.linkedin.com/content/dam/me/business/en-us/amp/brand-site/v2/bg/LI-Bug.svg.original.svg" width="30" height="30">
-        </a>
-        '''
+        # Icons are fetched and cached server-side (portfolio/embeds.py). The
+        # key holds the src each one resolved to, so the links switch from
+        # the fallback to the fetched icon (and follow its refreshes).
+        static = use_static_images()
+        icons = tuple(embed_src(name, static) for name in ("linkedin", "github"))
+        linkedin_html, github_html = cached_html("socials", lambda: social_links_html(profile, icons),
+                                                 profile.linkedin, profile.github, icons)
         col2.markdown(linkedin_html, unsafe_allow_html=True)
-        github_html = '''
-        <a href="https://github.com/23Hafid" target="_blank">
-            <img src="https://github.githubassets.com/images/modules/logos_page/GitHub-Mark.png" width="30" height="30">
-        </a>
-        '''
         col4.markdown(github_html, unsafe_allow_html=True)
 
         st.sidebar.markdown("---")
@@ -308,319 +330,82 @@ def sidebar():
         # Download CV
         st.subheader("Download CV 📄")
         st.caption("Download My professional CV")
-        with open("./Hafidzahidah_CV.pdf", "rb") as file:
-            with stylable_container(
-                    key="download_button",
-                    css_styles="""
-                    button {
-                        background-color: #ff9d9d;
-                        color: white;
-                        border-color: #ff9d9d;
-                        border-radius: 10px;
-                    }
-                    """,
+        with stylable_container(
+                key="download_button",
+                css_styles="""
+                button {
+                    background-color: var(--color-medium);
+                    color: white;
+                    border-color: var(--color-medium);
+                    border-radius: 10px;
+                }
+                """,
+        ):
+            if st.download_button(
+                    label="Download",
+                    # Deferred: the bytes are read (once per process) and handed
+                    # to the media file manager only when the button is clicked,
+                    # instead of being registered for every session on every rerun.
+                    data=lambda: read_file(CV_PATH, cv_cache),
+                    file_name=os.path.basename(CV_PATH)
             ):
-                if st.download_button(
-                        label="Download",
-                        data=file,
-                        file_name="Hafidzahidah_CV.pdf"
-                ):
-                    st.toast('Resume Downloded!', icon="😍")
+                analytics.track("cv_download")
+                st.toast('Resume Downloded!', icon="😍")
 
         # Disclaimer
         st.sidebar.markdown("---")
         st.sidebar.caption(
             "Disclaimer: This portfolio is for streamlit demonstration purposes only.")
 
-    return selected
-
-
-def about_page():
-    """Render the About page content."""
-    st.markdown('<p class="medium-font">Hi! I am,</p>', unsafe_allow_html=True)
-    st.markdown('<p class="big-font">🌸Hafidzahidah Binti Wangit🌸</p>', unsafe_allow_html=True)
-    st.markdown('<p class="job-font">Software Developer</p>', unsafe_allow_html=True)
-
-    st.subheader("About Me")
-    st.markdown(
-        '<div class="small-font">I am a dedicated and hardworking software developer with knowledge and skills in various programming languages and technologies, who is eager to contribute to the success of the company and self-advancement.\n\nI have experience in PHP software development, machine learning projects in Python and created management system project in Java.</div>',
-        unsafe_allow_html=True)
-
-    st.markdown("---")
-
-    st.subheader("My Journey")
-
-    timeline_year = st.select_slider("Select Year", options=range(2017, 2025))
-    monthly_experiences = get_experience(timeline_year)
-
-    if not monthly_experiences:
-        st.markdown(f"""
-            <div style="background-color: {colors['light']}; padding: 10px; border-radius: 5px; color: {colors['secondary']};">
-                💤 No specific experiences recorded for {timeline_year}.
-            </div>
-            """, unsafe_allow_html=True)
-    else:
-        for month, experience in monthly_experiences.items():
-            st.markdown(f"""
-                <div style="background-color: {colors['light']}; padding: 10px; border-radius: 5px; margin-bottom: 10px;">
-                    <strong style="color: {colors['secondary']};">{month}:</strong>
-                    <div style="color: {colors['accent']};">{experience}</div>
-                </div>
-                """, unsafe_allow_html=True)
-
-    st.markdown(
-        "<p style='text-align: center; color: #888; font-style: italic;'>Check out this year's journey for cute suprise!</p>",
-        unsafe_allow_html=True
-    )
-
-    # Cherry blossom emoji rain
-    if timeline_year == datetime.now().year:
-        rain(
-            emoji="🌸",
-            font_size=15,
-            falling_speed=5,
-            animation_length="infinite",
-        )
-
-    st.markdown("---")
-
-    st.subheader("Skills")
-
-    # First row of skills
-    st.markdown(f"""
-        <div style='display: flex; justify-content: space-around;'>
-            <div style='background: {colors['light']}; padding: 20px; border-radius: 10px; box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2); text-align: center; width: 18%;border: 2px solid {colors['primary']};'>
-                <p style='font-size: 14px; color: {colors['secondary']};'>Python 🐍</p>
-            </div>
-            <div style='background: {colors['background']}; padding: 20px; border-radius: 10px; box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2); text-align: center; width: 18%;border: 2px solid {colors['primary']};'>
-                <p style='font-size: 14px; color: {colors['secondary']};'>Java ☕</p>
-            </div>
-            <div style='background: {colors['light']}; padding: 20px; border-radius: 10px; box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2); text-align: center; width: 18%;border: 2px solid {colors['primary']};'>
-                <p style='font-size: 14px; color: {colors['secondary']};'>PHP 🐘</p>
-            </div>
-            <div style='background: {colors['background']}; padding: 20px; border-radius: 10px; box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2); text-align: center; width: 18%;border: 2px solid {colors['primary']};'>
-                <p style='font-size: 14px; color: {colors['secondary']};'>SQL 🗄️</p>
-            </div>
-            <div style='background: {colors['light']}; padding: 20px; border-radius: 10px; box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2); text-align: center; width: 18%;border: 2px solid {colors['primary']};'>
-                <p style='font-size: 14px; color: {colors['secondary']};'>HTML/CSS 🌐</p>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-
-    # Second row of skills
-    st.markdown(f"""
-        <div style='display: flex; justify-content: space-around; margin-top: 20px;'>
-            <div style='background: {colors['background']}; padding: 20px; border-radius: 10px; box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2); text-align: center; width: 18%;border: 2px solid {colors['primary']};'>
-                <p style='font-size: 14px; color: {colors['secondary']};'>JavaScript 📜</p>
-            </div>
-            <div style='background: {colors['light']}; padding: 20px; border-radius: 10px; box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2); text-align: center; width: 18%;border: 2px solid {colors['primary']};'>
-                <p style='font-size: 14px; color: {colors['secondary']};'>Spring Boot 🍃</p>
-            </div>
-            <div style='background: {colors['background']}; padding: 20px; border-radius: 10px; box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2); text-align: center; width: 18%;border: 2px solid {colors['primary']};'>
-                <p style='font-size: 14px; color: {colors['secondary']};'>MySQL 🐬</p>
-            </div>
-            <div style='background: {colors['light']}; padding: 20px; border-radius: 10px; box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2); text-align: center; width: 18%;border: 2px solid {colors['primary']};'>
-                <p style='font-size: 14px; color: {colors['secondary']};'>MongoDB 🍃</p>
-            </div>
-            <div style='background: {colors['background']}; padding: 20px; border-radius: 10px; box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2); text-align: center; width: 18%;border: 2px solid {colors['primary']};'>
-                <p style='font-size: 14px; color: {colors['secondary']};'>SQLyog 🐬</p>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-
-    # Third row of skills
-    st.markdown(f"""
-        <div style='display: flex; justify-content: space-around; margin-top: 20px;'>
-            <div style='background: {colors['light']}; padding: 20px; border-radius: 10px; box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2); text-align: center; width: 18%;border: 2px solid {colors['primary']};'>
-                <p style='font-size: 14px; color: {colors['secondary']};'>Git 🧰</p>
-            </div>
-            <div style='background: {colors['background']}; padding: 20px; border-radius: 10px; box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2); text-align: center; width: 18%;border: 2px solid {colors['primary']};'>
-                <p style='font-size: 14px; color: {colors['secondary']};'>Github 🐙</p>
-            </div>
-            <div style='background: {colors['light']}; padding: 20px; border-radius: 10px; box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2); text-align: center; width: 18%;border: 2px solid {colors['primary']};'>
-                <p style='font-size: 14px; color: {colors['secondary']};'>Selenium 🤖</p>
-            </div>
-            <div style='background: {colors['background']}; padding: 20px; border-radius: 10px; box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2); text-align: center; width: 18%;border: 2px solid {colors['primary']};'>
-                <p style='font-size: 14px; color: {colors['secondary']};'>Power BI 📊</p>
-            </div>
-            <div style='background: {colors['light']}; padding: 20px; border-radius: 10px; box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2); text-align: center; width: 18%;border: 2px solid {colors['primary']};'>
-                <p style='font-size: 14px; color: {colors['secondary']};'>Figma 🎨</p>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-
-    st.markdown("---")
-
-    st.subheader("Language")
-
-    # CSS for card styling
-    st.markdown(f"""
-        <style>
-            .language-card {{
-                padding: 20px;
-                border-radius: 10px;
-                margin-bottom: 20px;
-                box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-                transition: all 0.3s ease;
-                cursor: pointer;
-                background-color: {colors['light']};
-            }}
-            .language-card:hover {{
-                transform: translateY(-5px);
-                box-shadow: 0 8px 12px rgba(0, 0, 0, 0.2);
-                background-color: {colors['dark']};
-            }}
-            .language-name {{
-                font-size: 22px;
-                font-weight: bold;
-                margin-bottom: 15px;
-                color: {colors['secondary']};
-                transition: color 0.3s ease;
-            }}
-            .language-card:hover .language-name {{
-                color: {colors['accent']};
-            }}
-            .proficiency-bar {{
-                height: 20px;
-                border-radius: 10px;
-                margin-bottom: 15px;
-                transition: all 0.3s ease;
-            }}
-            .language-card:hover .proficiency-bar {{
-                height: 22px;
-            }}
-            .proficiency-text {{
-                font-size: 16px;
-                color: {colors['primary']};
-                transition: color 0.3s ease;
-            }}
-            .language-card:hover .proficiency-text {{
-                color: {colors['secondary']};
-            }}
-        </style>
-        """, unsafe_allow_html=True)
-
-    col1, col2 = st.columns(2)
-
-    languages = {
-        "Malay": {"Speaking": "Native", "Writing": "Native", "Score": 100},
-        "English": {"Speaking": "Fluent", "Writing": "Fluent", "Score": 80},
-        "Japanese": {"Speaking": "Beginner", "Writing": "Beginner", "Score": 20},
-        "German": {"Speaking": "Beginner", "Writing": "Beginner", "Score": 10}
-    }
 
-    for i, (language, data) in enumerate(languages.items()):
-        with col1 if i % 2 == 0 else col2:
-            st.markdown(f"""
-                <div class="language-card">
-                    <div class="language-name">{language}</div>
-                    <div class="proficiency-bar" style="background-color: {colors['accent']}; width: {data['Score']}%;"></div>
-                    <div class="proficiency-text">Speaking : {data['Speaking']}</div>
-                    <div class="proficiency-text">Writing : {data['Writing']}</div>
-                </div>
-                """, unsafe_allow_html=True)
-
-    st.markdown("---")
-
-    st.subheader("Areas of Interest")
-    st.markdown(
-        '<div class="small-font">\n\n - I love EXO 💖.'
-        '\n - Ongoing self-study of Japanese🏯 and German languages through Duolingo and YouTube. '
-        '\n - Connect with me on Duolingo and motivate each other! @\_Kay___'
-        '\n - Appreciation for diverse television genres, with a particular affinity for science fiction, action, fantasy, dystopian narratives, and historical dramas.'
-        '\n - Favorite anime selections include Kimi Ni Todoke, Au Haru Ride, and The Apothecary Diaries.'
-        '\n - Avid gaming enthusiast: Genshin Impact, Mobile Legends, Play Together</div>',
-        unsafe_allow_html=True)
-
-    # From GitHub KevzPeter / Duolingo-Stats-Card
-    st.markdown("""
-        <div style="display: flex; justify-content: center;">
-            <img src="https://duolingo-stats-card.vercel.app/api?username=_Kay___&theme=dracula" alt="Duolingo Stats"/>
-        </div>
-        """, unsafe_allow_html=True)
-
-    st.markdown("<br>", unsafe_allow_html=True)
-
-    st.markdown("---")
-
-    st.subheader("Gallery")
-
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.markdown(style_image("./image/exo.JPG"), unsafe_allow_html=True)
-    with col2:
-        st.markdown(style_image("./image/play_together.JPG"), unsafe_allow_html=True)
-    with col3:
-        st.markdown(style_image("./image/kiminitodoke.jpg"), unsafe_allow_html=True)
-
-    st.markdown("<br>", unsafe_allow_html=True)
-
-    st.markdown(
-        "<p style='text-align: center; color: #888; font-style: italic;'>Have a nice day!</p>",
-        unsafe_allow_html=True
-    )
-
-
-def projects_page():
-    """Render the Projects page content."""
-    st.title("Projects 🌟")
-
-    st.caption(
-        "Here are some of the projects I've worked on. For more projects and information, please [click here](https://drive.google.com/drive/folders/19y3QbREaLSkC-R5D7zhEChK0XPsMqsmT?usp=sharing)")
-
-    # Project 1
-    st.subheader("Project 1: Sentiment Analysis on COVID-19 Booster Vaccines, 2022")
-    skills = ["Python", "NLTK", "Excel", "Power BI", "snscrape", "BeautifulSoup", "Selenium", "Data Analysis",
-              "Machine Learning", "Visualization"]
-    create_skill_tags(skills)
-    st.write(
-        "A machine learning project focused on sentiment analysis of public opinion on COVID-19 booster vaccines using Twitter data.")
-    st.write(
-        "\n - Analyzed over 80,000 data using Python (NLTK) and Excel"
-        "\n - Conducted sentiment analysis, exploratory data analysis, and machine learning modeling"
-        "\n - Leveraged Microsoft Power BI to transform raw data into visually appealing and meaningful representations to discover trends and insights."
-        "\n - Created Python scripts that utilized snscrape and BeautifulSoup to collect data from Twitter, Shopee, and LinkedIn as well as used Selenium for handling dynamic content.")
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.markdown(style_image("./image/sentiment1.jpg"), unsafe_allow_html=True)
-    with col2:
-        st.markdown(style_image("./image/sentiment2.jpg"), unsafe_allow_html=True)
-    with col3:
-        st.markdown(style_image("./image/sentiment3.jpg"), unsafe_allow_html=True)
-
-    st.markdown("<br>", unsafe_allow_html=True)
-
-    # Project 2
-    st.subheader("Project 2: Pet Adoption Management System, 2024")
-    skills = ["Java", "Spring Boot", "MySQL", "Spring Data JPA", "Spring Security", "Maven", "Thymeleaf"]
-    create_skill_tags(skills)
-    st.write(
-        "A user-friendly, efficient pet adoption management system that streamlines the adoption process for both users and administrators, improving the overall experience and increasing successful pet adoptions."
-        "\n\nThis was a group project task as required for Yayasan Peneraju Java Professional Program.")
-    st.write(
-        "\n - Engineered robust RESTful APIs"
-        "\n - Implemented comprehensive features including login, signup, pet listings, adoption applications, application dashboards, and administrative functions"
-        "\n - Utilized Thymeleaf templating engine, integrated MySQL database, and designed intuitive user and admin interfaces")
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.markdown(style_image("./image/pet_adoption2.jpg"), unsafe_allow_html=True)
-    with col2:
-        st.markdown(style_image("./image/pet_adoption1.jpg"), unsafe_allow_html=True)
-    with col3:
-        st.markdown(style_image("./image/pet_adoption3.jpg"), unsafe_allow_html=True)
-
-    st.markdown("<br>", unsafe_allow_html=True)
+def warm_up_tasks():
+    """
+    List the cache fills the pages depend on, for portfolio.warmup.
+
+    Returns:
+    list: (name, zero-argument callable) pairs.
+    """
+    def galleries():
+        from portfolio.pages.projects import PER_PAGE
+
+        # Only the first catalog page; the rest are encoded when visited.
+        content = load_content()
+        for paths in [content.profile.gallery] + [project.images for project in content.projects[:PER_PAGE]]:
+            gallery_html([f"./{path}" for path in paths])
+
+    return [
+        ("content", load_content),
+        ("pages", lambda: [page.load() for page in PAGES]),
+        ("cv", lambda: read_file(CV_PATH, cv_cache)),
+        ("avatar", lambda: image_path_for(AVATAR_PATH, width=320)),
+        ("galleries", galleries),
+        ("search", lambda: search_index(load_content())),
+        ("embeds", lambda: [embed_src(name, use_static_images()) for name in EMBEDS]),
+    ]
 
 
 def main():
     """Main function to run the Streamlit app."""
-    setup_page_config()
-    selected = sidebar()
-
-    if selected == "About":
-        about_page()
-    elif selected == "Projects":
-        projects_page()
+    metrics.install()
+    memory.install()
+    warmup.start(warm_up_tasks)
+    memory.begin_run()
+    with section("rerun"):
+        pages = [st.Page(page.script, title=page.title, icon=page.icon, url_path=page.url_path,
+                         default=index == 0)
+                 for index, page in enumerate(PAGES)]
+        current = st.navigation(pages, position="hidden")
+        # Import the page's module before the shell injects the stylesheet,
+        # so the CSS it registers is part of it on the first visit too.
+        spec = PAGES[pages.index(current)]
+        spec.load()
+        analytics.page_view(spec.url_path)
+        setup_page_config()
+        sidebar(pages)
+        current.run()
+    memory.end_run()
+    metrics.debug_panel()
+    memory.debug_panel()
 
 
 if __name__ == "__main__":
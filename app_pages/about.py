@@ -0,0 +1,3 @@
+from portfolio.pages.about import about_page
+
+about_page()
@@ -0,0 +1,3 @@
+from portfolio.pages.analytics import analytics_page
+
+analytics_page()
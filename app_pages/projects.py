@@ -0,0 +1,3 @@
+from portfolio.pages.projects import projects_page
+
+projects_page()
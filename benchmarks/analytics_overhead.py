@@ -0,0 +1,131 @@
+"""
+Measure what visitor analytics cost the script thread.
+
+- Per call: the latency of Tracker.track() while the background writer is
+  flushing to SQLite.
+- Per rerun: the analytics work Home.py does on every full rerun
+  (analytics.page_view), timed inside AppTest script runs that switch pages.
+- Backpressure: a burst far larger than the queue against a writer that
+  doesn't get to run, showing events are dropped and counted while track()
+  stays fast.
+- Writer throughput: events per second flushed in batches.
+
+Every tracker writes to a temporary database.
+
+Usage::
+
+    python benchmarks/analytics_overhead.py [--events 200000] [--reruns 200]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+RERUN_SCRIPT = f"""
+import sys
+import time
+sys.path.insert(0, {ROOT!r})
+import streamlit as st
+from portfolio import analytics
+
+page = ("about", "projects")[st.session_state.get("turn", 0) % 2]
+st.session_state.turn = st.session_state.get("turn", 0) + 1
+start = time.perf_counter_ns()
+analytics.page_view(page)
+st.session_state.samples = st.session_state.get("samples", []) + [time.perf_counter_ns() - start]
+"""
+
+
+def summary(samples):
+    """Format nanosecond samples as p50/p99/max microseconds."""
+    ordered = sorted(samples)
+    p50 = ordered[len(ordered) // 2] / 1000
+    p99 = ordered[min(int(len(ordered) * 0.99), len(ordered) - 1)] / 1000
+    return f"p50 {p50:.2f} us, p99 {p99:.2f} us, max {ordered[-1] / 1000:.1f} us"
+
+
+def per_call(directory, events):
+    """Time every track() call while the writer flushes in the background."""
+    from portfolio.analytics import Tracker
+
+    # Room for every event, so the run measures queueing rather than dropping.
+    tracker = Tracker(os.path.join(directory, "calls.sqlite3"), max_queue=events, interval=0.05)
+    samples = []
+    for i in range(events):
+        start = time.perf_counter_ns()
+        tracker.track("page_view", "about", "session")
+        samples.append(time.perf_counter_ns() - start)
+    tracker.flush()
+    print(f"track() x {events}: {summary(samples)}")
+    print(f"  written {tracker.written}, dropped {tracker.dropped}")
+
+
+def per_rerun(directory, reruns):
+    """Time analytics.page_view() inside real script runs."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_string(RERUN_SCRIPT, default_timeout=60)
+    at.run()  # imports, and the writer thread starting on the first event
+    at.session_state.samples = []
+    for _ in range(reruns):
+        at.run()
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+    print(f"page_view() per rerun x {reruns}: {summary(at.session_state.samples)}")
+
+
+def backpressure(directory, events):
+    """Flood a small queue whose writer never gets to flush."""
+    from portfolio.analytics import Tracker
+
+    # The writer only wakes for a full batch or after an hour, so it stays asleep.
+    tracker = Tracker(os.path.join(directory, "burst.sqlite3"), max_queue=1000, batch_size=events + 1,
+                      interval=3600)
+    samples = []
+    for i in range(events):
+        start = time.perf_counter_ns()
+        tracker.track("page_view", "about", "session")
+        samples.append(time.perf_counter_ns() - start)
+    stats = tracker.stats()
+    print(f"burst of {events} into a queue of {tracker.max_queue}: {summary(samples)}")
+    print(f"  queued {stats['queued']}, dropped {stats['dropped']}")
+
+
+def throughput(directory, events):
+    """Measure how fast queued events are written."""
+    from portfolio.analytics import BATCH_SIZE, Tracker
+
+    tracker = Tracker(os.path.join(directory, "throughput.sqlite3"), max_queue=events, batch_size=events + 1,
+                      interval=3600)
+    for i in range(events):
+        tracker.track("page_view", "about", "session")
+    tracker.batch_size = BATCH_SIZE
+    start = time.perf_counter()
+    written = tracker.flush()
+    elapsed = time.perf_counter() - start
+    print(f"writer: {written} events in {elapsed * 1000:.0f} ms "
+          f"({written / elapsed:,.0f} events/s, batches of {tracker.batch_size})")
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Measure the script-thread cost of visitor analytics.")
+    parser.add_argument("--events", type=int, default=200000)
+    parser.add_argument("--reruns", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, ROOT)
+    with tempfile.TemporaryDirectory() as directory:
+        # Read by portfolio.settings on import, for the app's own tracker.
+        os.environ["PORTFOLIO_ANALYTICS"] = os.path.join(directory, "reruns.sqlite3")
+        per_call(directory, args.events)
+        per_rerun(directory, args.reruns)
+        backpressure(directory, args.events)
+        throughput(directory, args.events)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Build a browser benchmark page for the header animation.
+
+Writes a standalone HTML page that runs the original setInterval petal
+spawner and the current canvas animation one after the other, each in its
+own iframe at the size Streamlit gives it, and reports per variant:
+
+- frame time (mean / p95 / max of requestAnimationFrame intervals),
+- main-thread time lost to long tasks (> 50 ms),
+- live DOM nodes at the end of the run.
+
+Browsers don't expose CPU time to pages, so frame time and long-task time
+are the proxies; for CPU figures, record the page with the browser's
+performance profiler while it runs.
+
+Usage::
+
+    python benchmarks/animation_benchmark.py [--seconds 30] [--budget 24]
+    # then open benchmarks/animation_benchmark.html in a browser
+"""
+import argparse
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from Home import cherry_blossom_animation  # noqa: E402
+
+# cherry_blossom_animation() before the canvas rewrite.
+LEGACY = """
+<style>
+.petal {
+    position: absolute;
+    background-color: #FFB7C5;
+    border-radius: 150% 0 150% 0;
+    animation: falling 10s infinite;
+}
+@keyframes falling {
+    0% { top: -10%; transform: rotate(0deg); }
+    100% { top: 100%; transform: rotate(720deg); }
+}
+</style>
+<div id="petals"></div>
+<script>
+function createPetal() {
+    const petal = document.createElement('div');
+    petal.classList.add('petal');
+    petal.style.left = Math.random() * 100 + '%';
+    petal.style.width = Math.random() * 10 + 5 + 'px';
+    petal.style.height = Math.random() * 10 + 5 + 'px';
+    petal.style.animationDuration = Math.random() * 5 + 5 + 's';
+    document.getElementById('petals').appendChild(petal);
+    setTimeout(() => petal.remove(), 10000);
+}
+setInterval(createPetal, 300);
+</script>
+"""
+
+# Appended to each variant; reports back to the host page via postMessage.
+PROBE = """
+<script>
+(() => {
+    const frames = [];
+    let longTasks = 0, previous = performance.now();
+    new PerformanceObserver(list => {
+        for (const entry of list.getEntries()) longTasks += entry.duration;
+    }).observe({entryTypes: ['longtask']});
+    function frame(now) {
+        frames.push(now - previous);
+        previous = now;
+        requestAnimationFrame(frame);
+    }
+    requestAnimationFrame(frame);
+    window.addEventListener('message', () => {
+        frames.sort((a, b) => a - b);
+        const mean = frames.reduce((a, b) => a + b, 0) / frames.length;
+        parent.postMessage({
+            frames: frames.length,
+            meanFrameMs: mean,
+            p95FrameMs: frames[Math.floor(frames.length * 0.95)],
+            maxFrameMs: frames[frames.length - 1],
+            longTaskMs: longTasks,
+            domNodes: document.getElementsByTagName('*').length,
+        }, '*');
+    });
+})();
+</script>
+"""
+
+PAGE = """<!doctype html>
+<html>
+<head><meta charset="utf-8"><title>Header animation benchmark</title></head>
+<body style="font-family: sans-serif">
+<h1>Header animation benchmark</h1>
+<p>Each variant runs for %(seconds)d s. Keep this tab visible.</p>
+<div id="stage"></div>
+<pre id="results">running...</pre>
+<script>
+const VARIANTS = %(variants)s;
+const SECONDS = %(seconds)d;
+const results = {};
+
+function run(names) {
+    if (!names.length) {
+        document.getElementById('results').textContent = JSON.stringify(results, null, 2);
+        return;
+    }
+    const name = names[0];
+    const frame = document.createElement('iframe');
+    frame.style.cssText = 'width: 100%%; height: 50px; border: 1px solid #ccc';
+    frame.srcdoc = VARIANTS[name];
+    document.getElementById('stage').replaceChildren(frame);
+    setTimeout(() => {
+        window.addEventListener('message', function handler(event) {
+            window.removeEventListener('message', handler);
+            results[name] = event.data;
+            document.getElementById('results').textContent =
+                JSON.stringify(results, null, 2) + '\\nrunning...';
+            run(names.slice(1));
+        });
+        frame.contentWindow.postMessage('report', '*');
+    }, SECONDS * 1000);
+}
+run(Object.keys(VARIANTS));
+</script>
+</body>
+</html>
+"""
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Write the animation benchmark page.")
+    parser.add_argument("--seconds", type=int, default=30, help="run time per variant")
+    parser.add_argument("--budget", type=int, default=24, help="petal budget for the canvas variant")
+    parser.add_argument("--output", default=os.path.join(ROOT, "benchmarks", "animation_benchmark.html"))
+    args = parser.parse_args(argv)
+
+    variants = {
+        "legacy": LEGACY + PROBE,
+        "canvas": cherry_blossom_animation(args.budget) + PROBE,
+    }
+    # "</" is escaped so the variants' own </script> tags can't end ours.
+    variants_js = json.dumps(variants).replace("</", "<\\/")
+    with open(args.output, "w", encoding="utf-8") as f:
+        f.write(PAGE % {"seconds": args.seconds, "variants": variants_js})
+    print(f"Wrote {args.output}; open it in a browser to run the benchmark.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""
+Measure Projects page render time and payload against catalog size.
+
+Builds catalogs of N projects by repeating the projects in content.toml,
+then renders the Projects page with AppTest, once through the paginated
+catalog and once rendering every project (what the page did before), and
+reports the median script run time and the websocket payload of each.
+
+Usage::
+
+    python benchmarks/catalog_scaling.py [--sizes 2 20 100 500] [--runs 5]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCRIPT = f"""
+import sys
+sys.path.insert(0, {ROOT!r})
+import streamlit as st
+from portfolio.pages import projects
+from benchmarks.catalog_scaling import catalog
+
+content = catalog(st.session_state.size)
+if st.session_state.eager:
+    for position, project in enumerate(content.projects):
+        projects.project_section(position + 1, project)
+else:
+    projects.project_catalog(content)
+"""
+
+_catalogs = {}
+
+
+def catalog(size):
+    """
+    Build a content model with a given number of projects.
+
+    Args:
+    size (int): Number of projects.
+
+    Returns:
+    Content: content.toml with its projects repeated up to size.
+    """
+    if size not in _catalogs:
+        try:
+            import tomllib
+        except ImportError:  # Python < 3.11
+            import toml as tomllib
+
+        from portfolio.content import CONTENT_PATH, parse_content
+
+        with open(CONTENT_PATH, encoding="utf-8") as f:
+            data = tomllib.loads(f.read())
+        originals = data["projects"]
+        data["projects"] = [dict(originals[i % len(originals)], title=f"{originals[i % len(originals)]['title']} #{i}")
+                            for i in range(size)]
+        _catalogs[size] = parse_content(data)
+    return _catalogs[size]
+
+
+def measure(size, eager, runs):
+    """
+    Render the catalog and measure it.
+
+    Args:
+    size (int): Number of projects.
+    eager (bool): Render every project instead of one catalog page.
+    runs (int): Number of runs to take the median of.
+
+    Returns:
+    tuple: Median run time in milliseconds, payload bytes of one run.
+    """
+    from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
+    from streamlit.testing.v1 import AppTest
+
+    sent = {"bytes": 0}
+    enqueue = ForwardMsgQueue.enqueue
+
+    def counting_enqueue(self, msg):
+        sent["bytes"] += msg.ByteSize()
+        return enqueue(self, msg)
+
+    at = AppTest.from_string(SCRIPT, default_timeout=600)
+    at.session_state.size = size
+    at.session_state.eager = eager
+    at.run()  # warm the caches
+    samples = []
+    ForwardMsgQueue.enqueue = counting_enqueue
+    try:
+        for _ in range(runs):
+            sent["bytes"] = 0
+            start = time.perf_counter()
+            at.run()
+            samples.append(time.perf_counter() - start)
+            if at.exception:
+                raise RuntimeError(at.exception[0].message)
+    finally:
+        ForwardMsgQueue.enqueue = enqueue
+    return statistics.median(samples) * 1000, sent["bytes"]
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Measure Projects page cost against catalog size.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[2, 20, 100, 500])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+    print(f"{'projects':>8} {'catalog ms':>11} {'catalog B':>10} {'all ms':>9} {'all B':>10}")
+    for size in args.sizes:
+        paged_ms, paged_bytes = measure(size, False, args.runs)
+        eager_ms, eager_bytes = measure(size, True, args.runs)
+        print(f"{size:>8} {paged_ms:>11.1f} {paged_bytes:>10} {eager_ms:>9.1f} {eager_bytes:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Import-time profile of Home.py.
+
+Runs ``python -X importtime -c "import Home"`` in fresh interpreters and
+reports the cumulative import time of each module Home.py pulls in directly
+(median over the runs), plus which heavy optional modules got loaded at all.
+The report is written to benchmarks/import_time.txt, which is checked in so
+changes to cold start show up in review.
+
+Usage::
+
+    python benchmarks/import_time.py [--runs 7] [--output benchmarks/import_time.txt]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that should only be imported when the code needing them runs. Page
+# modules are imported on the first visit to their page.
+DEFERRED = ["PIL.Image", "portfolio.pages.about", "portfolio.pages.projects"]
+
+PROBE = "import sys, Home; print(','.join(m for m in {deferred!r} if m in sys.modules))"
+
+
+def profile_once():
+    """
+    Import Home in a fresh interpreter.
+
+    Returns:
+    tuple: ({module: cumulative microseconds} for Home's direct imports,
+        Home's own cumulative microseconds, list of deferred modules loaded).
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE.format(deferred=DEFERRED)],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    # Children are printed before their parent, so Home's direct imports are
+    # the depth-1 entries between the previous top-level entry and Home.
+    children, direct, total = {}, {}, 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth == 1:
+            children[name.strip()] = int(cumulative)
+        elif depth == 0:
+            if name.strip() == "Home":
+                direct, total = children, int(cumulative)
+            children = {}
+    loaded = [m for m in result.stdout.strip().split(",") if m]
+    return direct, total, loaded
+
+
+def report(runs):
+    """
+    Profile Home's imports several times and format the result.
+
+    Args:
+    runs (int): Number of fresh interpreters to sample.
+
+    Returns:
+    str: Plain-text report.
+    """
+    samples = [profile_once() for _ in range(runs)]
+    names = samples[-1][0]
+    rows = []
+    for name in names:
+        values = [direct[name] for direct, _, _ in samples if name in direct]
+        rows.append((statistics.median(values) / 1000, name))
+    rows.sort(reverse=True)
+    total = statistics.median(total for _, total, _ in samples) / 1000
+    streamlit = next((ms for ms, name in rows if name == "streamlit"), 0.0)
+
+    lines = [
+        f"Import time of Home.py, median of {runs} fresh interpreters",
+        f"({sys.implementation.name} {sys.version.split()[0]}, generated by benchmarks/import_time.py)",
+        "",
+        f"{'cumulative ms':>14}  module",
+    ]
+    lines += [f"{ms:>14.1f}  {name}" for ms, name in rows if ms >= 0.5]
+    lines += [
+        "",
+        f"{total:>14.1f}  total (import Home)",
+        f"{total - streamlit:>14.1f}  total excluding streamlit",
+        "",
+        "Deferred modules loaded by `import Home`: " + (", ".join(samples[-1][2]) or "none"),
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Profile the import time of Home.py.")
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--output", default=os.path.join(ROOT, "benchmarks", "import_time.txt"))
+    args = parser.parse_args(argv)
+    text = report(args.runs)
+    with open(args.output, "w") as f:
+        f.write(text)
+    print(text, end="")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
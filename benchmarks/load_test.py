@@ -0,0 +1,345 @@
+"""
+Concurrent-session load test for Home.py.
+
+Simulates N visitors at once. Each one opens the About page, changes the
+skills filter a few times and then opens the Projects page. (The "My
+Journey" timeline runs in the browser and causes no reruns.) Two drivers are
+available:
+
+- AppTest (default): runs the sessions in this process with Streamlit's
+  testing API. Reports rerun latency, delta payload bytes, CPU and RSS.
+- End-to-end (--url): headless websocket clients against a running
+  ``streamlit run Home.py``, speaking Streamlit's protobuf protocol.
+  Reports latency and bytes received, plus server CPU/RSS when --pid is
+  given (Linux only).
+
+Results are written as JSON so runs on different commits can be compared
+with --compare.
+
+Usage::
+
+    python benchmarks/load_test.py [--sessions 8] [--filter-changes 5]
+    python benchmarks/load_test.py --url ws://127.0.0.1:8501 --pid <server pid>
+    python benchmarks/load_test.py --compare benchmarks/results/old.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+
+PROJECTS_PAGE = "app_pages/projects.py"
+
+
+def percentiles(samples):
+    """
+    Summarize latency samples.
+
+    Args:
+    samples (list): Durations in seconds.
+
+    Returns:
+    dict: p50/p95/p99/mean/max in milliseconds.
+    """
+    ordered = sorted(samples)
+
+    def pick(q):
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000, 2)
+
+    return {
+        "p50": pick(0.50),
+        "p95": pick(0.95),
+        "p99": pick(0.99),
+        "mean": round(sum(ordered) / len(ordered) * 1000, 2),
+        "max": round(ordered[-1] * 1000, 2),
+    }
+
+
+def rss_bytes(pid="self"):
+    """
+    Get the resident set size of a process (Linux).
+
+    Args:
+    pid (str or int): Process ID, or "self".
+
+    Returns:
+    int: RSS in bytes.
+    """
+    with open(f"/proc/{pid}/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def cpu_seconds(pid):
+    """
+    Get the user+system CPU time of a process (Linux).
+
+    Args:
+    pid (int): Process ID.
+
+    Returns:
+    float: CPU seconds.
+    """
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def run_apptest(sessions, filter_changes):
+    """
+    Run concurrent sessions in-process with AppTest.
+
+    Args:
+    sessions (int): Number of concurrent sessions.
+    filter_changes (int): Skills filter reruns per session.
+
+    Returns:
+    dict: Benchmark results.
+    """
+    from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
+    from streamlit.testing.v1 import AppTest
+
+    lock = threading.Lock()
+    sent = {"bytes": 0}
+    latencies = []
+    errors = []
+    enqueue = ForwardMsgQueue.enqueue
+
+    def counting_enqueue(self, msg):
+        size = msg.ByteSize()
+        with lock:
+            sent["bytes"] += size
+        return enqueue(self, msg)
+
+    def timed(run):
+        start = time.perf_counter()
+        at = run()
+        elapsed = time.perf_counter() - start
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+        with lock:
+            latencies.append(elapsed)
+        return at
+
+    def session():
+        try:
+            at = timed(AppTest.from_file(os.path.join(ROOT, "Home.py"), default_timeout=120).run)
+            categories = list(at.pills[0].options)
+            for i in range(filter_changes):
+                timed(at.pills[0].set_value([categories[i % len(categories)]]).run)
+            timed(at.switch_page(PROJECTS_PAGE).run)
+        except Exception as e:  # reported, not fatal for the other sessions
+            with lock:
+                errors.append(repr(e))
+
+    # Warm the process (imports, caches) so the numbers reflect steady state.
+    AppTest.from_file(os.path.join(ROOT, "Home.py"), default_timeout=120).run()
+
+    ForwardMsgQueue.enqueue = counting_enqueue
+    rss_before = rss_bytes()
+    cpu_before = time.process_time()
+    start = time.perf_counter()
+    threads = [threading.Thread(target=session) for _ in range(sessions)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - start
+    cpu = time.process_time() - cpu_before
+    rss_after = rss_bytes()
+    ForwardMsgQueue.enqueue = enqueue
+
+    reruns = len(latencies)
+    return {
+        "driver": "apptest",
+        "reruns": reruns,
+        "errors": errors,
+        "wall_seconds": round(wall, 3),
+        "latency_ms": percentiles(latencies),
+        "payload_bytes_per_rerun": sent["bytes"] // max(reruns, 1),
+        "cpu_ms_per_rerun": round(cpu / max(reruns, 1) * 1000, 2),
+        "rss_mb": {
+            "before": round(rss_before / 2**20, 1),
+            "after": round(rss_after / 2**20, 1),
+            "per_session": round((rss_after - rss_before) / sessions / 2**20, 2),
+        },
+    }
+
+
+async def e2e_session(url, filter_changes, latencies, received):
+    """
+    Drive one session over Streamlit's websocket protocol.
+
+    Args:
+    url (str): Websocket URL of the server, e.g. ws://127.0.0.1:8501.
+    filter_changes (int): Skills filter reruns to perform.
+    latencies (list): Collects rerun durations in seconds.
+    received (list): Collects bytes received per rerun.
+    """
+    import websockets
+    from streamlit.proto.BackMsg_pb2 import BackMsg
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+    async with websockets.connect(f"{url.rstrip('/')}/_stcore/stream",
+                                  subprotocols=["streamlit"], max_size=None) as ws:
+
+        # url path -> page script hash, from the server's navigation message
+        pages = {}
+
+        async def rerun(widget=None, value=None, fragment_id="", page=None):
+            msg = BackMsg()
+            msg.rerun_script.SetInParent()
+            if page is not None:
+                msg.rerun_script.page_script_hash = pages[page]
+            if widget is not None:
+                state = msg.rerun_script.widget_states.widgets.add()
+                state.id = widget
+                if isinstance(value, str):
+                    state.json_value = value
+                else:
+                    state.string_array_value.data.extend(value)
+            if fragment_id:
+                msg.rerun_script.fragment_id = fragment_id
+            start = time.perf_counter()
+            await ws.send(msg.SerializeToString())
+            size, elements = 0, {}
+            while True:
+                data = await ws.recv()
+                size += len(data)
+                forward = ForwardMsg()
+                forward.ParseFromString(data)
+                kind = forward.WhichOneof("type")
+                if kind == "delta" and forward.delta.WhichOneof("type") == "new_element":
+                    element = forward.delta.new_element
+                    elements[element.WhichOneof("type")] = (element, forward.delta.fragment_id)
+                elif kind == "navigation":
+                    pages.update((p.url_pathname, p.page_script_hash) for p in forward.navigation.app_pages)
+                elif kind == "script_finished":
+                    break
+            latencies.append(time.perf_counter() - start)
+            received.append(size)
+            return elements
+
+        elements = await rerun()
+        element, fragment_id = elements["button_group"]
+        pills = element.button_group
+        for i in range(filter_changes):
+            option = pills.options[i % len(pills.options)].content
+            await rerun(pills.id, [option], fragment_id)
+        await rerun(page="projects")
+
+
+def run_e2e(url, sessions, filter_changes, pid=None):
+    """
+    Run concurrent websocket sessions against a live server.
+
+    Args:
+    url (str): Websocket URL of the server.
+    sessions (int): Number of concurrent sessions.
+    filter_changes (int): Skills filter reruns per session.
+    pid (int, optional): Server process ID for CPU/RSS figures.
+
+    Returns:
+    dict: Benchmark results.
+    """
+    latencies, received = [], []
+
+    async def main():
+        await asyncio.gather(*(e2e_session(url, filter_changes, latencies, received)
+                               for _ in range(sessions)))
+
+    cpu_before = cpu_seconds(pid) if pid else None
+    rss_before = rss_bytes(pid) if pid else None
+    start = time.perf_counter()
+    asyncio.run(main())
+    wall = time.perf_counter() - start
+
+    results = {
+        "driver": "websocket",
+        "reruns": len(latencies),
+        "errors": [],
+        "wall_seconds": round(wall, 3),
+        "latency_ms": percentiles(latencies),
+        "payload_bytes_per_rerun": sum(received) // max(len(received), 1),
+    }
+    if pid:
+        rss_after = rss_bytes(pid)
+        results["cpu_ms_per_rerun"] = round((cpu_seconds(pid) - cpu_before) / len(latencies) * 1000, 2)
+        results["rss_mb"] = {
+            "before": round(rss_before / 2**20, 1),
+            "after": round(rss_after / 2**20, 1),
+            "per_session": round((rss_after - rss_before) / sessions / 2**20, 2),
+        }
+    return results
+
+
+def git_commit():
+    """Get the short hash of HEAD, or "unknown" outside a git checkout."""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(old, new):
+    """
+    Print the change of each headline metric between two result files.
+
+    Args:
+    old (dict): Baseline results.
+    new (dict): Current results.
+    """
+    rows = [
+        ("latency p50 (ms)", old["latency_ms"]["p50"], new["latency_ms"]["p50"]),
+        ("latency p95 (ms)", old["latency_ms"]["p95"], new["latency_ms"]["p95"]),
+        ("latency p99 (ms)", old["latency_ms"]["p99"], new["latency_ms"]["p99"]),
+        ("payload B/rerun", old["payload_bytes_per_rerun"], new["payload_bytes_per_rerun"]),
+    ]
+    if "cpu_ms_per_rerun" in old and "cpu_ms_per_rerun" in new:
+        rows.append(("CPU ms/rerun", old["cpu_ms_per_rerun"], new["cpu_ms_per_rerun"]))
+    print(f"{'metric':<20} {old['commit']:>12} {new['commit']:>12} {'change':>8}")
+    for name, before, after in rows:
+        change = f"{(after - before) / before * 100:+.1f}%" if before else "n/a"
+        print(f"{name:<20} {before:>12} {after:>12} {change:>8}")
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for Home.py.")
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--filter-changes", type=int, default=5)
+    parser.add_argument("--url", help="websocket URL of a running server (end-to-end mode)")
+    parser.add_argument("--pid", type=int, help="server process ID, for CPU/RSS in end-to-end mode")
+    parser.add_argument("--output", help="result file (default: benchmarks/results/load_test-<commit>.json)")
+    parser.add_argument("--compare", help="earlier result file to compare against")
+    args = parser.parse_args(argv)
+
+    if args.url:
+        results = run_e2e(args.url, args.sessions, args.filter_changes, args.pid)
+    else:
+        results = run_apptest(args.sessions, args.filter_changes)
+    results.update(commit=git_commit(), sessions=args.sessions, filter_changes=args.filter_changes,
+                   timestamp=time.strftime("%Y-%m-%dT%H:%M:%S"))
+
+    output = args.output or os.path.join(RESULTS_DIR, f"load_test-{results['driver']}-{results['commit']}.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+        f.write("\n")
+    print(json.dumps(results, indent=2))
+    print(f"Wrote {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), results)
+    return 1 if results["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
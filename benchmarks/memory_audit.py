@@ -0,0 +1,108 @@
+"""
+Per-session memory audit over many reruns.
+
+Drives one AppTest session of Home.py through hundreds of reruns (plain
+reruns and skills filter changes) with PORTFOLIO_MEMORY_AUDIT=1, and checks
+that the session's footprint stays flat: the audit's per-source numbers (see
+portfolio/memory.py) must not grow after the warm-up runs, and the Python
+heap, traced with tracemalloc, must grow by less than --max-growth-kb.
+Exits non-zero if either check fails.
+
+Usage::
+
+    python benchmarks/memory_audit.py [--reruns 300] [--max-growth-kb 1024]
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Read by portfolio.settings at import time.
+os.environ["PORTFOLIO_MEMORY_AUDIT"] = "1"
+sys.path.insert(0, ROOT)
+
+# Enough filter changes to visit every category before measuring.
+WARMUP_RUNS = 20
+
+
+def footprint(report):
+    """
+    Sum the sources a session holds on to.
+
+    Args:
+    report (dict): A portfolio.memory report.
+
+    Returns:
+    int: Emitted delta bytes + media bytes + session state bytes.
+    """
+    return report["emitted_total"] + (report["media"] or 0) + (report["widget_state"] or 0)
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Check that per-session memory stays flat over reruns.")
+    parser.add_argument("--reruns", type=int, default=300)
+    parser.add_argument("--max-growth-kb", type=int, default=1024,
+                        help="allowed Python heap growth after the warm-up runs")
+    args = parser.parse_args(argv)
+
+    from streamlit.testing.v1 import AppTest
+
+    from portfolio import memory
+
+    os.chdir(ROOT)
+    at = AppTest.from_file(os.path.join(ROOT, "Home.py"), default_timeout=120)
+    categories = None
+
+    def rerun(i):
+        nonlocal categories
+        if categories is None or i % 2 == 0:
+            at.run()
+        else:
+            at.pills[0].set_value([categories[i % len(categories)]]).run()
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+        categories = list(at.pills[0].options)
+        return next(reversed(memory.reports.values()))
+
+    warmup_largest = 0
+    for i in range(WARMUP_RUNS):
+        baseline = rerun(i)
+        warmup_largest = max(warmup_largest, footprint(baseline))
+    gc.collect()
+    tracemalloc.start()
+    heap_start = tracemalloc.get_traced_memory()[0]
+    largest = 0
+    for i in range(WARMUP_RUNS, WARMUP_RUNS + args.reruns):
+        report = rerun(i)
+        largest = max(largest, footprint(report))
+    gc.collect()
+    heap_growth = tracemalloc.get_traced_memory()[0] - heap_start
+    tracemalloc.stop()
+
+    print(f"{'source':<24} {'after warm-up':>14} {'after last run':>14}")
+    for kind in sorted(set(baseline["emitted"]) | set(report["emitted"])):
+        print(f"{'delta: ' + kind:<24} {baseline['emitted'].get(kind, 0):>14} {report['emitted'].get(kind, 0):>14}")
+    for source in ("media", "widget_state", "fragments"):
+        print(f"{source:<24} {str(baseline[source]):>14} {str(report[source]):>14}")
+    print(f"{'footprint (bytes)':<24} {footprint(baseline):>14} {footprint(report):>14}")
+    print(f"largest footprint: {warmup_largest} bytes during warm-up, "
+          f"{largest} bytes over the next {args.reruns} reruns")
+    print(f"Python heap growth: {heap_growth / 1024:.1f} KiB")
+
+    # The filter changes which skills are emitted, so compare against the
+    # largest footprint seen while the warm-up runs went through the categories.
+    failures = []
+    if largest > warmup_largest:
+        failures.append("session footprint grew")
+    if heap_growth > args.max_growth_kb * 1024:
+        failures.append(f"heap grew by more than {args.max_growth_kb} KiB")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""
+Measure the websocket payload of a rerun, per image mode.
+
+Counts the serialized size of every ForwardMsg the script enqueues while
+AppTest drives the app, i.e. what the server would push over the websocket.
+Each mode runs in its own subprocess because settings are read at import.
+
+Usage::
+
+    python benchmarks/rerun_payload.py [--reruns 5]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODES = ("inline", "static")
+
+
+def measure(reruns):
+    """
+    Drive the app in this process and measure payload bytes per rerun.
+
+    Args:
+    reruns (int): Number of full reruns to average over.
+
+    Returns:
+    dict: Bytes for the first run and the mean bytes per full rerun.
+    """
+    from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
+    from streamlit.testing.v1 import AppTest
+
+    sent = {"bytes": 0}
+    enqueue = ForwardMsgQueue.enqueue
+
+    def counting_enqueue(self, msg):
+        sent["bytes"] += msg.ByteSize()
+        return enqueue(self, msg)
+
+    ForwardMsgQueue.enqueue = counting_enqueue
+
+    at = AppTest.from_file(os.path.join(ROOT, "Home.py"), default_timeout=60).run()
+    first_run = sent["bytes"]
+
+    sent["bytes"] = 0
+    for _ in range(reruns):
+        at.run()
+    return {"first_run_bytes": first_run, "rerun_bytes": sent["bytes"] // reruns}
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--reruns", type=int, default=5)
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.mode:
+        print(json.dumps(measure(args.reruns)))
+        return 0
+
+    results = {}
+    for mode in MODES:
+        env = dict(os.environ, PORTFOLIO_IMAGE_MODE=mode)
+        out = subprocess.run(
+            [sys.executable, __file__, "--mode", mode, "--reruns", str(args.reruns)],
+            cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+        ).stdout
+        results[mode] = json.loads(out.strip().splitlines()[-1])
+
+    print(f"{'mode':<8} {'first run':>12} {'per rerun':>12}")
+    for mode, result in results.items():
+        print(f"{mode:<8} {result['first_run_bytes']:>10} B {result['rerun_bytes']:>10} B")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""
+Measure search query latency against corpus size.
+
+Builds synthetic corpora of experiences, projects and skills from the words
+in content.toml (plus generated words, so the vocabulary grows with the
+corpus like real content does), indexes each with portfolio.search, and
+times a fixed mix of queries: whole words, two- and three-letter prefixes,
+multi-word queries and misses. Each query runs once against a fresh index,
+so the candidate cache only helps queries repeating an earlier driving
+token, as typing does. A linear scan that substring-matches every document
+is timed alongside for comparison.
+
+Usage::
+
+    python benchmarks/search_latency.py [--sizes 100 1000 5000 20000] [--queries 500]
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from portfolio.content import load_content  # noqa: E402
+from portfolio.search import Document, SearchIndex, content_documents, tokenize  # noqa: E402
+
+KINDS = (("experience", "about"), ("project", "projects"), ("skill", "about"))
+
+
+def corpus(size, rng):
+    """
+    Generate a synthetic corpus.
+
+    Args:
+    size (int): Number of documents.
+    rng (random.Random): Random source.
+
+    Returns:
+    list: Document entries.
+    """
+    seed_words = sorted({token for document in content_documents(load_content())
+                         for token in tokenize(f"{document.title} {document.body} {' '.join(document.tags)}")})
+    # One new word per ten documents, drawn less often than the real ones.
+    extra = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 10)))
+             for _ in range(size // 10)]
+    vocabulary = seed_words + extra
+    # Zipf-like: earlier words are much more common.
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+
+    def words(n):
+        return " ".join(rng.choices(vocabulary, weights, k=n))
+
+    documents = []
+    for _ in range(size):
+        kind, page = rng.choice(KINDS)
+        documents.append(Document(kind, words(rng.randint(2, 6)), page, body=words(rng.randint(10, 60)),
+                                  tags=tuple(words(1) for _ in range(rng.randint(0, 5)))))
+    return documents
+
+
+def queries(documents, count, rng):
+    """
+    Build a query mix from a corpus.
+
+    Args:
+    documents (list): The corpus.
+    count (int): Number of queries.
+    rng (random.Random): Random source.
+
+    Returns:
+    list: Query strings.
+    """
+    result = []
+    for i in range(count):
+        words = tokenize(rng.choice(documents).body)
+        word = rng.choice(words)
+        kind = i % 5
+        if kind == 0:
+            result.append(word)
+        elif kind == 1:
+            result.append(word[:2])
+        elif kind == 2:
+            result.append(word[:3])
+        elif kind == 3:
+            result.append(" ".join(rng.sample(words, min(2, len(words)))))
+        else:
+            result.append(f"{word[:3]}zzq")
+    return result
+
+
+def scan(documents, query):
+    """Baseline: substring-match every query word against every document."""
+    words = query.lower().split()
+    texts = (f"{d.title} {d.body} {' '.join(d.tags)}".lower() for d in documents)
+    return [i for i, text in enumerate(texts) if all(word in text for word in words)][:10]
+
+
+def timings(search, query_list):
+    """
+    Time each query once.
+
+    Returns:
+    tuple: p50, p95 and p99 in microseconds.
+    """
+    samples = []
+    for query in query_list:
+        start = time.perf_counter()
+        search(query)
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return tuple(samples[min(int(len(samples) * q), len(samples) - 1)] * 1e6 for q in (0.5, 0.95, 0.99))
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Measure search query latency against corpus size.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000, 20000])
+    parser.add_argument("--queries", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    print(f"{'documents':>9} {'terms':>7} {'build ms':>9} {'p50 us':>8} {'p95 us':>8} {'p99 us':>8}"
+          f" {'scan p50 us':>12}")
+    for size in args.sizes:
+        rng = random.Random(size)
+        documents = corpus(size, rng)
+        start = time.perf_counter()
+        index = SearchIndex(documents)
+        build = (time.perf_counter() - start) * 1000
+        # The first full collection after the build walks the whole index;
+        # a long-running server has paid for it long before a query arrives.
+        gc.collect()
+        query_list = queries(documents, args.queries, rng)
+        p50, p95, p99 = timings(index.search, query_list)
+        scan_p50 = timings(lambda query: scan(documents, query), query_list[:50])[0]
+        print(f"{size:>9} {len(index._terms):>7} {build:>9.1f} {p50:>8.1f} {p95:>8.1f} {p99:>8.1f}"
+              f" {scan_p50:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Supporting modules for the Streamlit portfolio app (Home.py)."""
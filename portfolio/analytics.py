@@ -0,0 +1,280 @@
+"""
+Batched visitor analytics: page views and CV downloads.
+
+Recording an event on the script thread only appends a tuple to an
+in-memory queue; a background thread wakes up every FLUSH_INTERVAL seconds
+(or as soon as BATCH_SIZE events are waiting) and writes the queue to a
+SQLite database in WAL mode, one transaction per batch. A rerun never waits
+for the disk.
+
+The queue is bounded: when the writer can't keep up (slow disk, locked
+database) new events are dropped and counted instead of blocking reruns or
+growing memory. A lock timeout puts the batch back at the head of the queue
+and the writer waits for a backoff before trying again; any other SQLite or
+filesystem error turns the tracker off for the rest of the process, like the
+on-disk asset cache.
+
+The "My Journey" year slider runs in the browser without talking to the
+server (portfolio/timeline.py), so the years visitors pick are not recorded.
+
+With ``PORTFOLIO_ANALYTICS_REPORT=1`` an Analytics page shows the counts;
+``python -m portfolio.analytics`` prints them.
+
+Usage::
+
+    python -m portfolio.analytics [--db .cache/analytics.sqlite3]
+"""
+import argparse
+import atexit
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+
+import streamlit as st
+from streamlit.runtime.scriptrunner_utils.script_run_context import get_script_run_ctx
+
+from portfolio import settings
+from portfolio.assets import ROOT
+from portfolio.disk_cache import MAX_BACKOFF, MIN_BACKOFF, is_busy
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    time REAL NOT NULL,
+    kind TEXT NOT NULL,
+    value TEXT NOT NULL,
+    session TEXT NOT NULL
+)
+"""
+
+# Events kept in memory before new ones are dropped.
+QUEUE_SIZE = 10000
+# Most events written per transaction; this many waiting also wakes the writer.
+BATCH_SIZE = 500
+FLUSH_INTERVAL = 1.0
+
+
+class Tracker:
+    """
+    Bounded in-memory event queue drained to SQLite by a background thread.
+
+    Args:
+    path (str): Database file. Its directory is created if missing.
+    max_queue (int): Events kept in memory before new ones are dropped.
+    batch_size (int): Most events written per transaction.
+    interval (float): Seconds between flushes when the queue is quiet.
+    """
+
+    def __init__(self, path, max_queue=QUEUE_SIZE, batch_size=BATCH_SIZE, interval=FLUSH_INTERVAL):
+        self.path = path
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.interval = interval
+        self.written = 0
+        self.dropped = 0
+        self.errors = 0
+        self.busy = 0
+        self.disabled = False
+        self._backoff = 0.0
+        self._retry_at = 0.0
+        # deque.append and popleft are atomic, so producers take no lock.
+        self._queue = deque()
+        self._wake = threading.Event()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._thread = None
+
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(SCHEMA)
+            self._local.connection = connection
+        return connection
+
+    def _start(self):
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="portfolio-analytics", daemon=True)
+            self._thread.start()
+        atexit.register(self.flush)
+
+    def _run(self):
+        while not self.disabled:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            self.flush()
+
+    def track(self, kind, value="", session=""):
+        """
+        Queue an event without blocking.
+
+        Args:
+        kind (str): Event type, e.g. "page_view".
+        value (str): Event detail, e.g. the page's url path.
+        session (str): Streamlit session id.
+
+        Returns:
+        bool: False if the event was dropped (queue full or tracker off).
+        """
+        if self.disabled:
+            return False
+        if len(self._queue) >= self.max_queue:
+            with self._lock:
+                self.dropped += 1
+            return False
+        self._queue.append((time.time(), kind, value, session))
+        if self._thread is None:
+            self._start()
+        if len(self._queue) >= self.batch_size:
+            self._wake.set()
+        return True
+
+    def flush(self):
+        """
+        Write every queued event, a batch per transaction.
+
+        Does nothing while backing off from a lock timeout.
+
+        Returns:
+        int: Number of events written.
+        """
+        written = 0
+        with self._flush_lock:
+            while self._queue and not self.disabled and time.monotonic() >= self._retry_at:
+                batch = []
+                while self._queue and len(batch) < self.batch_size:
+                    batch.append(self._queue.popleft())
+                try:
+                    with self._connection() as connection:
+                        connection.execute("BEGIN IMMEDIATE")
+                        connection.executemany("INSERT INTO events VALUES (?, ?, ?, ?)", batch)
+                except (sqlite3.Error, OSError) as e:
+                    if is_busy(e):
+                        # Nothing was written; keep the batch, in order, for the next try.
+                        self._queue.extendleft(reversed(batch))
+                        with self._lock:
+                            self.busy += 1
+                        self._backoff = min(max(self._backoff * 2, MIN_BACKOFF), MAX_BACKOFF)
+                        self._retry_at = time.monotonic() + self._backoff
+                        break
+                    with self._lock:
+                        self.errors += 1
+                        self.dropped += len(batch)
+                    self.disabled = True
+                    break
+                self._backoff = 0.0
+                written += len(batch)
+        with self._lock:
+            self.written += written
+        return written
+
+    def stats(self):
+        """
+        Get the tracker counters.
+
+        Returns:
+        dict: queued, written, dropped, errors and lock timeouts (busy).
+        """
+        return {"queued": len(self._queue), "written": self.written, "dropped": self.dropped,
+                "errors": self.errors, "busy": self.busy}
+
+    def counts(self, since=0.0):
+        """
+        Count the written events by kind and value.
+
+        Args:
+        since (float): Only count events after this Unix time.
+
+        Returns:
+        list: (kind, value, events, sessions) rows, most events first.
+        """
+        if self.disabled:
+            return []
+        try:
+            return self._connection().execute(
+                "SELECT kind, value, COUNT(*), COUNT(DISTINCT session) FROM events WHERE time > ? "
+                "GROUP BY kind, value ORDER BY COUNT(*) DESC, kind, value", (since,)).fetchall()
+        except (sqlite3.Error, OSError):
+            return []
+
+    def daily(self, kind, days=30):
+        """
+        Count the written events of one kind per day.
+
+        Args:
+        kind (str): Event type.
+        days (int): Number of days to go back.
+
+        Returns:
+        list: (date, events) rows, oldest first, in local time.
+        """
+        if self.disabled:
+            return []
+        try:
+            return self._connection().execute(
+                "SELECT date(time, 'unixepoch', 'localtime') AS day, COUNT(*) FROM events "
+                "WHERE kind = ? AND time > ? GROUP BY day ORDER BY day",
+                (kind, time.time() - days * 86400)).fetchall()
+        except (sqlite3.Error, OSError):
+            return []
+
+
+tracker = Tracker(os.path.join(ROOT, settings.ANALYTICS)) if settings.ANALYTICS else None
+# Session state key holding the url path of the last page viewed.
+LAST_PAGE_KEY = "analytics_last_page"
+
+
+def track(kind, value=""):
+    """
+    Record an event for the current session. Does nothing when analytics are off.
+
+    Args:
+    kind (str): Event type, e.g. "cv_download".
+    value (str): Event detail.
+    """
+    if tracker is None:
+        return
+    ctx = get_script_run_ctx(suppress_warning=True)
+    tracker.track(kind, value, ctx.session_id if ctx else "")
+
+
+def page_view(page):
+    """
+    Record a page view when the session lands on a page it wasn't on.
+
+    Reruns on the same page (widget changes, fragment reruns) don't count.
+    The last page is kept in st.session_state, which lives as long as the
+    session; ctx.session_state is a wrapper each script run creates anew.
+
+    Args:
+    page (str): The page's url path.
+    """
+    ctx = get_script_run_ctx(suppress_warning=True)
+    if tracker is None or ctx is None or st.session_state.get(LAST_PAGE_KEY) == page:
+        return
+    st.session_state[LAST_PAGE_KEY] = page
+    tracker.track("page_view", page, ctx.session_id)
+
+
+def main(argv=None):
+    """Print the event counts."""
+    parser = argparse.ArgumentParser(description="Print visitor analytics.")
+    parser.add_argument("--db", default=settings.ANALYTICS,
+                        help="database file, relative to the repository root")
+    args = parser.parse_args(argv)
+
+    rows = Tracker(os.path.join(ROOT, args.db)).counts()
+    print(f"{'event':<14} {'value':<20} {'count':>8} {'sessions':>9}")
+    for kind, value, events, sessions in rows:
+        print(f"{kind:<14} {value:<20} {events:>8} {sessions:>9}")
+
+
+if __name__ == "__main__":
+    main()
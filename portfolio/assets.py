@@ -0,0 +1,384 @@
+"""
+Process-wide cache for derived image assets.
+
+Streamlit reruns the whole script on every interaction, so anything derived
+from the files under ``image/`` (decoded, re-encoded, base64'd) would otherwise
+be recomputed for every session on every rerun. Entries are keyed on the file's
+path, mtime and size so that editing an image invalidates its cached payload.
+
+When ``python -m portfolio.optimize_images`` has been run, images are served
+from the pre-encoded variants listed in its manifest; originals that are
+missing from the manifest (or changed since it was built) are transcoded on
+demand as before.
+"""
+import base64
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from io import BytesIO
+
+from portfolio import settings
+from portfolio.disk_cache import DiskCache
+from portfolio.optimize_images import MANIFEST_NAME, OUTPUT_DIR, file_hash
+
+# Repository root; manifest keys and variant paths are relative to it.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MANIFEST_PATH = os.path.join(OUTPUT_DIR, MANIFEST_NAME)
+
+
+class AssetCache:
+    """
+    Thread-safe bounded LRU cache with hit/miss counters.
+
+    Args:
+    maxsize (int): Maximum number of entries kept before the least recently
+        used entry is evicted.
+    """
+
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_create(self, key, factory):
+        """
+        Return the cached value for key, computing it with factory on a miss.
+
+        Args:
+        key (hashable): Cache key.
+        factory (callable): Zero-argument function producing the value.
+
+        Returns:
+        object: The cached or freshly computed value.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        # Compute outside the lock so a slow encode doesn't block lookups.
+        value = factory()
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def stats(self):
+        """
+        Get cache counters.
+
+        Returns:
+        dict: Hits, misses, evictions, current size and maximum size.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+    def clear(self):
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+# Shared by every session in this Streamlit process.
+image_cache = AssetCache(maxsize=64)
+file_cache = AssetCache(maxsize=8)
+# The CV on its own, so its misses count exactly how often the PDF was read.
+cv_cache = AssetCache(maxsize=1)
+# Shared by every Streamlit process on the host; image_cache misses fall
+# through to it before encoding anything.
+disk_cache = (DiskCache(os.path.join(ROOT, settings.DISK_CACHE),
+                        max_bytes=int(settings.DISK_CACHE_MB * 2**20))
+              if settings.DISK_CACHE else None)
+
+
+def file_key(path, *extra):
+    """
+    Build a cache key that changes whenever the file on disk changes.
+
+    Args:
+    path (str): Path to the file.
+    *extra: Additional values that affect the derived output.
+
+    Returns:
+    tuple: (absolute path, mtime in ns, size in bytes, *extra).
+    """
+    stat = os.stat(path)
+    return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size) + extra
+
+
+def read_file(path, cache=None):
+    """
+    Read a file's bytes once per process, re-reading only when it changes.
+
+    Handing Streamlit the same bytes object on every rerun also keeps the
+    media file ID (a hash of the content) stable, so the media file manager
+    reuses its existing entry instead of registering a new one. The cache's
+    misses count the reads that went to disk.
+
+    Args:
+    path (str): Path to the file.
+    cache (AssetCache, optional): Cache to keep the bytes in; file_cache by
+        default.
+
+    Returns:
+    bytes: File contents.
+    """
+    def factory():
+        with open(path, "rb") as f:
+            return f.read()
+
+    return (cache or file_cache).get_or_create(file_key(path), factory)
+
+
+_json_files = {}
+_json_lock = threading.Lock()
+
+
+def load_json(path):
+    """
+    Load a JSON file, re-reading it only when it changes.
+
+    Args:
+    path (str): Path to the JSON file.
+
+    Returns:
+    object or None: The parsed JSON, or None if the file doesn't exist.
+    """
+    try:
+        key = file_key(path)
+    except OSError:
+        return None
+    with _json_lock:
+        cached = _json_files.get(path)
+        if cached is None or cached[0] != key:
+            with open(path) as f:
+                cached = (key, json.load(f))
+            _json_files[path] = cached
+        return cached[1]
+
+
+def load_manifest():
+    """
+    Load the image manifest.
+
+    Returns:
+    dict: Mapping of source image path (relative to ROOT) to manifest entry.
+        Empty if the pipeline has not been run.
+    """
+    manifest = load_json(MANIFEST_PATH)
+    return manifest["images"] if manifest else {}
+
+
+_source_hashes = {}
+_source_hash_lock = threading.Lock()
+
+
+def source_hash(image_path):
+    """
+    Hash a source image like the image pipeline does, once per file version.
+
+    Args:
+    image_path (str): Path to the original image.
+
+    Returns:
+    str: optimize_images.file_hash() of the file's contents.
+    """
+    key = file_key(image_path)
+    with _source_hash_lock:
+        cached = _source_hashes.get(key[0])
+        if cached is not None and cached[0] == key:
+            return cached[1]
+    with open(image_path, "rb") as f:
+        digest = file_hash(f.read())
+    with _source_hash_lock:
+        _source_hashes[key[0]] = (key, digest)
+    return digest
+
+
+def manifest_entry(image_path):
+    """
+    Look up the manifest entry for a source image.
+
+    Args:
+    image_path (str): Path to the original image.
+
+    Returns:
+    dict or None: The entry, or None if the image is not in the manifest or
+        its contents have changed since the manifest was built.
+    """
+    rel = os.path.relpath(os.path.abspath(image_path), ROOT).replace(os.sep, "/")
+    entry = load_manifest().get(rel)
+    # The size check is free and catches most edits before hashing.
+    if (entry is None or entry["bytes"] != os.stat(image_path).st_size
+            or entry["hash"] != source_hash(image_path)):
+        return None
+    return entry
+
+
+def image_variant(image_path, fmt="webp", width=None):
+    """
+    Pick a pre-encoded variant of an image.
+
+    Args:
+    image_path (str): Path to the original image.
+    fmt (str): Variant format, "webp" or "jpeg".
+    width (int, optional): Smallest acceptable width in pixels. Defaults to
+        the largest variant available.
+
+    Returns:
+    dict or None: The variant (with an added "path" key), or None if there
+        is no usable manifest entry.
+    """
+    entry = manifest_entry(image_path)
+    if entry is None:
+        return None
+    variants = sorted((v for v in entry["variants"] if v["format"] == fmt),
+                      key=lambda v: v["width"])
+    if not variants:
+        return None
+    chosen = variants[-1]
+    if width is not None:
+        chosen = next((v for v in variants if v["width"] >= width), chosen)
+    return dict(chosen, path=os.path.join(OUTPUT_DIR, chosen["file"]))
+
+
+def image_path_for(image_path, fmt="jpeg", width=None):
+    """
+    Get the file path to serve for an image, preferring a pre-encoded variant.
+
+    Args:
+    image_path (str): Path to the original image.
+    fmt (str): Preferred variant format.
+    width (int, optional): Smallest acceptable width in pixels.
+
+    Returns:
+    str: Path of the variant, or image_path if there is none.
+    """
+    variant = image_variant(image_path, fmt, width)
+    return variant["path"] if variant else image_path
+
+
+def image_url(image_path, fmt="webp", width=None):
+    """
+    Get the static URL of a pre-encoded image variant.
+
+    Args:
+    image_path (str): Path to the original image.
+    fmt (str): Variant format, "webp" or "jpeg".
+    width (int, optional): Smallest acceptable width in pixels.
+
+    Returns:
+    str or None: URL under settings.STATIC_URL, or None if the image has no
+        usable variant.
+    """
+    variant = image_variant(image_path, fmt, width)
+    if variant is None:
+        return None
+    return f"{settings.STATIC_URL}/img/{variant['file']}"
+
+
+def use_static_images():
+    """
+    Decide whether images are referenced by URL rather than inlined.
+
+    Returns:
+    bool: True for PORTFOLIO_IMAGE_MODE=static, or when the mode is unset and
+        Streamlit's static file serving is enabled.
+    """
+    if settings.IMAGE_MODE:
+        return settings.IMAGE_MODE == "static"
+    import streamlit as st
+
+    return bool(st.get_option("server.enableStaticServing"))
+
+
+def encode_image(image_path):
+    """
+    Encode an image file as a data URI.
+
+    Uses the largest pre-encoded WebP variant when one exists, and otherwise
+    transcodes the original to PNG.
+
+    Args:
+    image_path (str): Path to the image file.
+
+    Returns:
+    str: "data:<mime>;base64,..." URI.
+    """
+    variant = image_variant(image_path, "webp")
+    if variant is not None:
+        with open(variant["path"], "rb") as f:
+            data, mime = f.read(), "image/webp"
+    else:
+        # Only images missing from the manifest need PIL; importing it here
+        # keeps it off the startup path.
+        from PIL import Image
+
+        img = Image.open(image_path)
+        buffered = BytesIO()
+        img.save(buffered, format="PNG")
+        data, mime = buffered.getvalue(), "image/png"
+    return f"data:{mime};base64,{base64.b64encode(data).decode()}"
+
+
+def content_key(image_path):
+    """
+    Identify the bytes encode_image() would produce for an image.
+
+    Args:
+    image_path (str): Path to the image file.
+
+    Returns:
+    str: Hash of the pre-encoded variant, or of the original's contents.
+    """
+    variant = image_variant(image_path, "webp")
+    if variant is not None:
+        return f"webp:{variant['hash']}"
+    with open(image_path, "rb") as f:
+        return f"png:{hashlib.sha256(f.read()).hexdigest()}"
+
+
+def cached_image(image_path):
+    """
+    Get an image's data URI from the process-wide cache.
+
+    The key includes the manifest's own mtime/size so rebuilding the variants
+    invalidates payloads derived from the previous build. On a miss the data
+    URI is looked up in the shared on-disk cache (keyed on content_key())
+    before the image is encoded.
+
+    Args:
+    image_path (str): Path to the image file.
+
+    Returns:
+    str: The data URI.
+    """
+    def factory():
+        if disk_cache is None:
+            return encode_image(image_path)
+        return disk_cache.get_or_create(f"data-uri:{content_key(image_path)}",
+                                        lambda: encode_image(image_path))
+
+    try:
+        manifest_key = file_key(MANIFEST_PATH)[1:]
+    except OSError:
+        manifest_key = None
+    return image_cache.get_or_create(file_key(image_path, manifest_key), factory)
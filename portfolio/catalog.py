@@ -0,0 +1,60 @@
+"""
+Paging and tag filtering for record catalogs such as the Projects page.
+
+Filtering works on record positions from a precomputed tag index (see
+Content.by_project_skill), and a page is just a slice of those positions, so
+only the records on the visible page reach the renderer: render time,
+payload and image encoding depend on the page size, not on the size of the
+catalog.
+"""
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogPage:
+    """
+    One page of a filtered catalog.
+
+    positions index the full record list, so records keep their numbering
+    under any filter; number is 1-based and count is at least 1.
+    """
+    positions: tuple
+    number: int
+    count: int
+    total: int
+
+
+def matching(index, tags, size):
+    """
+    Find the records carrying any of the given tags.
+
+    Args:
+    index (Mapping): Tag -> positions of the records carrying it.
+    tags (iterable): Selected tags; none selects every record.
+    size (int): Number of records.
+
+    Returns:
+    tuple: Matching positions in ascending order.
+    """
+    tags = tuple(tags)
+    if not tags:
+        return tuple(range(size))
+    return tuple(sorted(set().union(*(index.get(tag, ()) for tag in tags))))
+
+
+def page(positions, number, per_page):
+    """
+    Slice one page out of a list of positions.
+
+    Args:
+    positions (tuple): Record positions, in display order.
+    number (int): Requested page, 1-based; clamped to the pages that exist.
+    per_page (int): Records per page.
+
+    Returns:
+    CatalogPage: The page.
+    """
+    count = max(1, -(-len(positions) // per_page))
+    number = min(max(number, 1), count)
+    start = (number - 1) * per_page
+    return CatalogPage(positions[start:start + per_page], number, count, len(positions))
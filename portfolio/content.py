@@ -0,0 +1,180 @@
+"""
+Immutable content model loaded from content.toml.
+
+Experiences, skills, languages and projects live in a single TOML file so
+content edits don't need a code change. The file is parsed once and kept
+until its mtime or size changes; every lookup the pages do afterwards is a
+dictionary access on frozen data.
+"""
+import os
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import toml as tomllib
+
+from portfolio.assets import ROOT, file_key
+
+CONTENT_PATH = os.path.join(ROOT, "content.toml")
+
+
+@dataclass(frozen=True, slots=True)
+class Profile:
+    """About page header, intro, interests and contact links; about/interests are Markdown."""
+    name: str
+    role: str
+    about: str
+    email: str = ""
+    linkedin: str = ""
+    github: str = ""
+    interests: tuple = ()
+    gallery: tuple = ()
+
+
+@dataclass(frozen=True, slots=True)
+class Experience:
+    """One "My Journey" timeline entry."""
+    year: int
+    month: str
+    text: str
+
+
+@dataclass(frozen=True, slots=True)
+class Skill:
+    """A skill card on the About page."""
+    name: str
+    icon: str = ""
+    category: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class Language:
+    """A spoken language card; score is the proficiency bar width in percent."""
+    name: str
+    speaking: str
+    writing: str
+    score: int
+
+
+@dataclass(frozen=True, slots=True)
+class Project:
+    """A project on the Projects page."""
+    title: str
+    year: int
+    skills: tuple
+    description: str
+    highlights: tuple = ()
+    images: tuple = ()
+
+
+@dataclass(frozen=True, slots=True)
+class Content:
+    """
+    All portfolio content plus precomputed indexes.
+
+    by_year maps every year from the first to the last experience (including
+    years without entries) to a tuple of that year's experiences, in file
+    order; years is that range in ascending order. skill_categories lists
+    the distinct skill categories in order of first appearance.
+    by_project_skill maps every skill tag used by a project to the positions
+    (in projects) of the projects using it; project_skills lists those tags
+    in order of first appearance.
+    """
+    profile: Profile
+    experiences: tuple
+    skills: tuple
+    languages: tuple
+    projects: tuple
+    by_year: MappingProxyType
+    years: tuple
+    skill_categories: tuple
+    by_project_skill: MappingProxyType
+    project_skills: tuple
+
+    def experiences_for(self, year):
+        """
+        Get the experiences for a year.
+
+        Args:
+        year (int): The year to look up.
+
+        Returns:
+        tuple: Experience entries, empty if there are none.
+        """
+        return self.by_year.get(year, ())
+
+
+def parse_content(data):
+    """
+    Build a Content object from parsed TOML data.
+
+    Args:
+    data (dict): Parsed content.toml.
+
+    Returns:
+    Content: The immutable content model.
+    """
+    experiences = tuple(Experience(**entry) for entry in data.get("experiences", ()))
+    projects = tuple(
+        Project(**dict(entry,
+                       skills=tuple(entry.get("skills", ())),
+                       highlights=tuple(entry.get("highlights", ())),
+                       images=tuple(entry.get("images", ()))))
+        for entry in data.get("projects", ())
+    )
+
+    by_year = {}
+    if experiences:
+        first = min(e.year for e in experiences)
+        last = max(e.year for e in experiences)
+        for year in range(first, last + 1):
+            by_year[year] = tuple(e for e in experiences if e.year == year)
+
+    by_project_skill = {}
+    for position, project in enumerate(projects):
+        for skill in dict.fromkeys(project.skills):
+            by_project_skill.setdefault(skill, []).append(position)
+
+    skills = tuple(Skill(**entry) for entry in data.get("skills", ()))
+    profile = data["profile"]
+    return Content(
+        profile=Profile(**dict(profile,
+                               interests=tuple(profile.get("interests", ())),
+                               gallery=tuple(profile.get("gallery", ())))),
+        experiences=experiences,
+        skills=skills,
+        languages=tuple(Language(**entry) for entry in data.get("languages", ())),
+        projects=projects,
+        by_year=MappingProxyType(by_year),
+        years=tuple(by_year),
+        skill_categories=tuple(dict.fromkeys(s.category for s in skills if s.category)),
+        by_project_skill=MappingProxyType({skill: tuple(positions)
+                                           for skill, positions in by_project_skill.items()}),
+        project_skills=tuple(by_project_skill),
+    )
+
+
+_loaded = {"key": None, "content": None}
+_lock = threading.Lock()
+
+
+def load_content(path=CONTENT_PATH):
+    """
+    Get the content model, re-parsing the file only when it has changed.
+
+    Args:
+    path (str): Path to the TOML content file.
+
+    Returns:
+    Content: The immutable content model.
+    """
+    key = file_key(path)
+    with _lock:
+        if _loaded["key"] != key:
+            with open(path, encoding="utf-8") as f:
+                _loaded["content"] = parse_content(tomllib.loads(f.read()))
+            _loaded["key"] = key
+        return _loaded["content"]
@@ -0,0 +1,214 @@
+"""
+On-disk cache shared by every Streamlit process on a host.
+
+The in-process caches in portfolio.assets are per worker, so each process
+behind a load balancer would otherwise re-derive the same payloads (base64
+data URIs, transcoded originals). This cache sits underneath them as a second
+level: a single SQLite database in WAL mode that any number of processes can
+read and write concurrently. Keys are content hashes, so entries never go
+stale; the database is kept under a size cap by evicting the least recently
+used entries.
+
+A lock timeout (another process holding the write lock longer than
+``timeout``) is a miss: the cache is skipped for a backoff that doubles while
+the lock stays contended, then tried again. Any other SQLite or filesystem
+error (read-only disk, corrupt database) turns the cache into a pass-through
+for the rest of the process rather than failing the page.
+"""
+import os
+import sqlite3
+import threading
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+)
+"""
+
+# Entries read more recently than this aren't re-stamped, so hot reads don't
+# turn into a write per rerun.
+TOUCH_INTERVAL = 60.0
+
+# Seconds the database is left alone after a lock timeout; doubled on each
+# further timeout up to MAX_BACKOFF and reset by the next success.
+MIN_BACKOFF = 1.0
+MAX_BACKOFF = 60.0
+
+
+def is_busy(error):
+    """
+    Tell whether a database error is a lock timeout rather than a real failure.
+
+    Args:
+    error (Exception): The error raised by sqlite3 or the filesystem.
+
+    Returns:
+    bool: True for "database is locked" and "database table is locked".
+    """
+    return isinstance(error, sqlite3.OperationalError) and "is locked" in str(error)
+
+
+class DiskCache:
+    """
+    Size-capped LRU cache of str/bytes values in a SQLite database.
+
+    Args:
+    path (str): Database file. Its directory is created if missing.
+    max_bytes (int): Total value size kept before the least recently used
+        entries are evicted.
+    timeout (float): Seconds to wait for another process's write lock.
+    """
+
+    def __init__(self, path, max_bytes=64 * 2**20, timeout=5.0):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.errors = 0
+        self.busy = 0
+        self.disabled = False
+        self._backoff = 0.0
+        self._retry_at = 0.0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _count(self, counter, n=1):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + n)
+
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(SCHEMA)
+            self._local.connection = connection
+        return connection
+
+    def _waiting(self):
+        return time.monotonic() < self._retry_at
+
+    def _failed(self, error):
+        with self._lock:
+            if is_busy(error):
+                self.busy += 1
+                self._backoff = min(max(self._backoff * 2, MIN_BACKOFF), MAX_BACKOFF)
+                self._retry_at = time.monotonic() + self._backoff
+                return
+            self.errors += 1
+        self.disabled = True
+
+    def _succeeded(self):
+        if self._backoff:
+            with self._lock:
+                self._backoff = 0.0
+
+    def get(self, key):
+        """
+        Look up a value.
+
+        Args:
+        key (str): Cache key.
+
+        Returns:
+        str or bytes or None: The cached value, or None on a miss.
+        """
+        if self.disabled:
+            return None
+        if self._waiting():
+            self._count("misses")
+            return None
+        try:
+            connection = self._connection()
+            row = connection.execute("SELECT value, accessed FROM entries WHERE key = ?",
+                                     (key,)).fetchone()
+            if row is None:
+                self._count("misses")
+                return None
+            now = time.time()
+            if now - row[1] > TOUCH_INTERVAL:
+                connection.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+        except (sqlite3.Error, OSError) as e:
+            self._failed(e)
+            if not self.disabled:
+                self._count("misses")
+            return None
+        self._succeeded()
+        self._count("hits")
+        return row[0]
+
+    def set(self, key, value):
+        """
+        Store a value and evict least recently used entries over the size cap.
+
+        Args:
+        key (str): Cache key.
+        value (str or bytes): Value to store. Values larger than the whole cap
+            are not stored.
+        """
+        size = len(value.encode() if isinstance(value, str) else value)
+        if self.disabled or self._waiting() or size > self.max_bytes:
+            return
+        try:
+            connection = self._connection()
+            with connection:
+                connection.execute("BEGIN IMMEDIATE")
+                connection.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                                   (key, value, size, time.time()))
+                evicted = connection.execute("""
+                    DELETE FROM entries WHERE key IN (
+                        SELECT key FROM (
+                            SELECT key, SUM(size) OVER (ORDER BY accessed DESC, key) AS total
+                            FROM entries
+                        ) WHERE total > ?
+                    )
+                """, (self.max_bytes,)).rowcount
+        except (sqlite3.Error, OSError) as e:
+            self._failed(e)
+            return
+        self._succeeded()
+        self._count("evictions", evicted)
+
+    def get_or_create(self, key, factory):
+        """
+        Return the cached value for key, computing and storing it on a miss.
+
+        Args:
+        key (str): Cache key.
+        factory (callable): Zero-argument function producing a str or bytes.
+
+        Returns:
+        str or bytes: The cached or freshly computed value.
+        """
+        value = self.get(key)
+        if value is None:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def stats(self):
+        """
+        Get the cache counters.
+
+        Returns:
+        dict: hits, misses, evictions, errors, lock timeouts (busy), entries
+            and bytes stored.
+        """
+        entries = size = 0
+        if not self.disabled and not self._waiting():
+            try:
+                entries, size = self._connection().execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+            except (sqlite3.Error, OSError) as e:
+                self._failed(e)
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "errors": self.errors, "busy": self.busy, "entries": entries, "bytes": size,
+                "max_bytes": self.max_bytes}
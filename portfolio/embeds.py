@@ -0,0 +1,295 @@
+"""
+Server-side fetch-and-cache layer for third-party images.
+
+The Duolingo stats card and the social icons used to be hotlinked, so every
+page view depended on three external hosts. EmbedCache fetches them on the
+server instead, stores them under ``static/embeds/`` with content-hashed
+names and serves them from our own origin:
+
+- fresh copies (younger than the TTL) are served as is,
+- stale copies are served immediately while a background thread refetches
+  them (stale-while-revalidate),
+- if there is no copy yet, or upstream is down, a bundled fallback image is
+  served and the fetch is retried after ``retry_after`` seconds.
+
+Fetches never happen on the script thread, so a slow upstream can't delay a
+rerun.
+
+Fetched SVGs are sanitized before they are stored (sanitize_svg). The copies
+are served from our origin, and an SVG opened directly is a document that
+runs its scripts, so upstream markup must not carry any.
+"""
+import base64
+import hashlib
+import http.client
+import json
+import mimetypes
+import os
+import threading
+import time
+import urllib.request
+import xml.etree.ElementTree as ElementTree
+
+from portfolio import settings
+from portfolio.assets import ROOT, read_file
+
+CACHE_DIR = os.path.join(ROOT, "static", "embeds")
+FALLBACK_DIR = os.path.join(ROOT, "static", "fallback")
+
+# name -> (upstream URL, fallback file in FALLBACK_DIR)
+EMBEDS = {
+    "duolingo": ("https://duolingo-stats-card.vercel.app/api?username=_Kay___&theme=dracula",
+                 "duolingo.svg"),
+    "linkedin": ("https://content.linkedin.com/content/dam/me/business/en-us/amp/brand-site/v2/bg/LI-Bug.svg.original.svg",
+                 "linkedin.svg"),
+    "github": ("https://github.githubassets.com/images/modules/logos_page/GitHub-Mark.png",
+               "github.svg"),
+}
+# What a failed fetch can raise: network and HTTP errors (urllib's are
+# OSErrors), protocol errors from a misbehaving upstream, and bad URLs.
+FETCH_ERRORS = (OSError, http.client.HTTPException, ValueError)
+SVG_NS = "http://www.w3.org/2000/svg"
+# SVG elements that run script or embed other documents.
+UNSAFE_ELEMENTS = {"script", "foreignObject", "handler", "listener"}
+# Animation elements, which can set a link to a javascript: URL.
+ANIMATION_ELEMENTS = {"set", "animate"}
+# What a link in a stored SVG may point to.
+SAFE_LINKS = ("#", "data:image/", "https://", "http://")
+# Serialize sanitized SVGs with their usual prefixes rather than ns0/ns1.
+ElementTree.register_namespace("", SVG_NS)
+ElementTree.register_namespace("xlink", "http://www.w3.org/1999/xlink")
+EXTENSIONS = {"image/svg+xml": ".svg", "image/png": ".png", "image/jpeg": ".jpg",
+              "image/webp": ".webp", "image/gif": ".gif"}
+
+
+def _local_name(name):
+    return name.rpartition("}")[2]
+
+
+def _is_link(name):
+    return _local_name(name) == "href"
+
+
+def sanitize_svg(data):
+    """
+    Strip everything that can run script from an SVG document.
+
+    Elements outside the SVG namespace (an XHTML <script> runs in an SVG
+    document too), script, foreignObject and handler elements, on* event
+    attributes, links other than fragments, images and http(s) URLs, and
+    animations of links are removed. Documents with a DTD are rejected
+    rather than parsed, so entities can't smuggle anything in.
+
+    Args:
+    data (bytes): SVG document.
+
+    Returns:
+    bytes: The sanitized document.
+
+    Raises:
+    ValueError: If data has a DTD, isn't well-formed XML or isn't an SVG.
+    """
+    if b"<!doctype" in data.lower() or b"<!entity" in data.lower():
+        raise ValueError("SVG with a DTD")
+    try:
+        root = ElementTree.fromstring(data)
+    except ElementTree.ParseError as e:
+        raise ValueError(f"malformed SVG: {e}") from None
+    if root.tag != f"{{{SVG_NS}}}svg":
+        raise ValueError(f"expected an SVG document, got <{root.tag}>")
+
+    def unsafe(element):
+        namespace, _, name = element.tag.rpartition("}")
+        if namespace != f"{{{SVG_NS}" or name in UNSAFE_ELEMENTS:
+            return True
+        return name in ANIMATION_ELEMENTS and _is_link(element.get("attributeName", ""))
+
+    for element in root.iter():
+        for child in [child for child in element if unsafe(child)]:
+            element.remove(child)
+        for attribute, value in list(element.attrib.items()):
+            link = "".join(value.split()).lower()
+            if (_local_name(attribute).lower().startswith("on")
+                    or _is_link(attribute) and not link.startswith(SAFE_LINKS)):
+                del element.attrib[attribute]
+    return ElementTree.tostring(root)
+
+
+class EmbedCache:
+    """
+    Disk-backed cache of remote images with TTL and stale-while-revalidate.
+
+    Args:
+    sources (dict): Mapping of embed name to (upstream URL, fallback file).
+    cache_dir (str): Directory cached files and their metadata live in.
+    fallback_dir (str): Directory holding the fallback files.
+    ttl (float): Seconds a fetched copy counts as fresh.
+    timeout (float): Upstream request timeout in seconds.
+    retry_after (float): Seconds to wait before retrying a failed fetch.
+    max_bytes (int): Largest response accepted.
+    """
+
+    def __init__(self, sources, cache_dir=CACHE_DIR, fallback_dir=FALLBACK_DIR,
+                 ttl=3600, timeout=5, retry_after=60, max_bytes=1024 * 1024):
+        self.sources = sources
+        self.cache_dir = cache_dir
+        self.fallback_dir = fallback_dir
+        self.ttl = ttl
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._failed_at = {}
+
+    def _meta_path(self, name):
+        return os.path.join(self.cache_dir, f"{name}.json")
+
+    def metadata(self, name):
+        """
+        Read the metadata of the cached copy.
+
+        Args:
+        name (str): Embed name.
+
+        Returns:
+        dict or None: {"file", "content_type", "fetched_at"}, or None if
+            nothing has been cached, the cached file is missing or it is an
+            SVG stored before SVGs were sanitized.
+        """
+        try:
+            with open(self._meta_path(name)) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if meta["content_type"] == "image/svg+xml" and not meta.get("sanitized"):
+            return None
+        if not os.path.exists(os.path.join(self.cache_dir, meta["file"])):
+            return None
+        return meta
+
+    def fetch(self, name):
+        """
+        Fetch an embed from upstream and store it, synchronously.
+
+        Args:
+        name (str): Embed name.
+
+        Returns:
+        dict: Metadata of the stored copy.
+
+        Raises:
+        OSError: If upstream is unreachable, times out or returns something
+            other than an image within max_bytes.
+        http.client.HTTPException: If upstream breaks the HTTP protocol.
+        ValueError: If upstream returns an SVG sanitize_svg() rejects.
+        """
+        url = self.sources[name][0]
+        request = urllib.request.Request(url, headers={"User-Agent": "streamlit-portfolio"})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            content_type = response.headers.get_content_type()
+            data = response.read(self.max_bytes + 1)
+        if content_type not in EXTENSIONS:
+            raise OSError(f"{url} returned {content_type}, expected an image")
+        if len(data) > self.max_bytes:
+            raise OSError(f"{url} returned more than {self.max_bytes} bytes")
+        if content_type == "image/svg+xml":
+            data = sanitize_svg(data)
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        digest = hashlib.sha256(data).hexdigest()[:12]
+        filename = f"{name}-{digest}{EXTENSIONS[content_type]}"
+        self._write_atomic(filename, data)
+
+        previous = self.metadata(name)
+        meta = {"file": filename, "content_type": content_type, "fetched_at": time.time()}
+        if content_type == "image/svg+xml":
+            meta["sanitized"] = True
+        self._write_atomic(f"{name}.json", json.dumps(meta).encode())
+        if previous and previous["file"] != filename:
+            try:
+                os.remove(os.path.join(self.cache_dir, previous["file"]))
+            except OSError:
+                pass
+        return meta
+
+    def _write_atomic(self, filename, data):
+        path = os.path.join(self.cache_dir, filename)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def refresh(self, name):
+        """
+        Refetch an embed on a background thread, unless one is already running
+        or the last attempt failed less than retry_after seconds ago.
+
+        Args:
+        name (str): Embed name.
+
+        Returns:
+        threading.Thread or None: The started thread, if any.
+        """
+        with self._lock:
+            failed_at = self._failed_at.get(name)
+            if name in self._refreshing or (failed_at and time.time() - failed_at < self.retry_after):
+                return None
+            self._refreshing.add(name)
+
+        def run():
+            failed_at = time.time()
+            try:
+                self.fetch(name)
+                failed_at = None
+            except FETCH_ERRORS:
+                pass
+            finally:
+                # Whatever happened, a later resolve() may try again.
+                with self._lock:
+                    self._failed_at[name] = failed_at
+                    self._refreshing.discard(name)
+
+        thread = threading.Thread(target=run, name=f"embed-refresh-{name}", daemon=True)
+        thread.start()
+        return thread
+
+    def resolve(self, name):
+        """
+        Pick the file to serve for an embed, scheduling a refresh if needed.
+
+        Args:
+        name (str): Embed name.
+
+        Returns:
+        tuple: (absolute path, is_fallback).
+        """
+        meta = self.metadata(name)
+        if meta is None or time.time() - meta["fetched_at"] > self.ttl:
+            self.refresh(name)
+        if meta is None:
+            return os.path.join(self.fallback_dir, self.sources[name][1]), True
+        return os.path.join(self.cache_dir, meta["file"]), False
+
+
+embed_cache = EmbedCache(EMBEDS, ttl=settings.EMBED_TTL)
+
+
+def embed_src(name, static=True):
+    """
+    Get the src to use for an embed.
+
+    Args:
+    name (str): Embed name, a key of EMBEDS.
+    static (bool): Return a URL under settings.STATIC_URL; otherwise return
+        a data URI (for when static file serving is off).
+
+    Returns:
+    str: URL or data URI.
+    """
+    path, _ = embed_cache.resolve(name)
+    if static:
+        rel = os.path.relpath(path, os.path.join(ROOT, "static")).replace(os.sep, "/")
+        return f"{settings.STATIC_URL}/{rel}"
+    mime = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    return f"data:{mime};base64,{base64.b64encode(read_file(path)).decode()}"
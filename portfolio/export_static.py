@@ -0,0 +1,383 @@
+"""
+Export the portfolio as a self-contained static site.
+
+Renders the About and Projects pages and the sidebar into one index.html
+using the same HTML builders as the Streamlit app, with navigation and the
+"My Journey" slider handled client-side. Every referenced file under
+``static/`` is copied alongside; the stylesheet, script and CV get
+content-hashed names, and all text files are precompressed (.gz, plus .br
+when the brotli module is installed) for servers that serve them directly.
+
+The Streamlit app stays the authoring and preview mode; the export can be
+served from any static file server.
+
+Usage::
+
+    python -m portfolio.export_static [--output dist]
+"""
+import argparse
+import gzip
+import hashlib
+import os
+import re
+import shutil
+import sys
+from html import escape
+
+from portfolio import settings
+from portfolio.assets import ROOT
+
+OUTPUT_DIR = "dist"
+COMPRESSIBLE = (".html", ".css", ".js", ".svg", ".json")
+STATIC_REF = re.compile(r"""static/[^"'()\s,]+""")
+
+NAV_JS = """
+(() => {
+    const pages = document.querySelectorAll('.page');
+    const links = document.querySelectorAll('.nav a');
+    function route() {
+        const id = (location.hash || '#about').slice(1);
+        const target = document.getElementById(id) ? id : 'about';
+        pages.forEach(page => { page.hidden = page.id !== target; });
+        links.forEach(link => link.classList.toggle('active', link.hash === '#' + target));
+        window.scrollTo(0, 0);
+    }
+    window.addEventListener('hashchange', route);
+    route();
+})();
+"""
+
+
+# Page layout that Streamlit otherwise provides
+LAYOUT_CSS = """
+    body { margin: 0; font-family: 'Quicksand', sans-serif; color: var(--color-secondary);
+           background-color: var(--color-background); }
+    .layout { display: grid; grid-template-columns: 18rem minmax(0, 1fr); min-height: 100vh; }
+    .sidebar { background-color: var(--color-light); padding: 2rem 1.25rem; }
+    .sidebar .avatar { display: block; width: 33%; margin: 0 auto 1.5rem; border-radius: 8px; }
+    .nav { display: flex; flex-direction: column; gap: 4px; background: var(--color-light); }
+    .nav a { padding: 10px 14px; border-radius: 8px; color: var(--color-secondary); text-decoration: none; }
+    .nav a:hover { background-color: var(--color-medium); }
+    .nav a.active { background-color: var(--color-medium); color: #fff; }
+    .socials { display: flex; gap: 24px; padding-left: 15%; }
+    .download { display: inline-block; padding: 8px 16px; border-radius: 10px; text-decoration: none;
+                background-color: var(--color-medium); color: white; }
+    .caption { font-size: 14px; color: #888; }
+    main { padding: 1rem 4rem 4rem; max-width: 76rem; }
+    .petals { width: 100%; height: 50px; border: 0; display: block; }
+    .columns { display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; }
+    hr { border: 0; border-top: 1px solid #ddd; margin: 2rem 0; }
+    @media (max-width: 760px) {
+        .layout, .columns { grid-template-columns: 1fr; }
+        main { padding: 1rem; }
+    }
+    """
+
+
+def about_html(content):
+    """
+    Render the About page.
+
+    Args:
+    content (Content): The content model.
+
+    Returns:
+    str: HTML for the page section.
+    """
+    from portfolio import ui
+    from portfolio.embeds import embed_src
+    from portfolio.markup import markdown_to_html
+    from portfolio.pages.about import language_cards_html
+    from portfolio.timeline import timeline_html
+
+    profile = content.profile
+    left, right = language_cards_html(content.languages)
+    interests = "".join(f"\n- {interest}" for interest in profile.interests)
+    return f"""
+    <p class="medium-font">Hi! I am,</p>
+    <p class="big-font">🌸{escape(profile.name)}🌸</p>
+    <p class="job-font">{escape(profile.role)}</p>
+    <h3>About Me</h3>
+    <div class="small-font">{markdown_to_html(profile.about)}</div>
+    <hr>
+    <h3>My Journey</h3>
+    {timeline_html(content)}
+    <hr>
+    <h3>Skills</h3>
+    {ui.skills_html(content.skills)}
+    <hr>
+    <h3>Language</h3>
+    <div class="columns"><div>{left}</div><div>{right}</div></div>
+    <hr>
+    <h3>Areas of Interest</h3>
+    <div class="small-font">{markdown_to_html(interests)}</div>
+    <div style="display: flex; justify-content: center;">
+        <img src="{embed_src("duolingo")}" alt="Duolingo Stats" loading="lazy">
+    </div>
+    <hr>
+    <h3>Gallery</h3>
+    {ui.gallery_html([f"./{path}" for path in profile.gallery])}
+    <p style="text-align: center; color: #888; font-style: italic;">Have a nice day!</p>
+    """
+
+
+def projects_html(content):
+    """
+    Render the Projects page.
+
+    Args:
+    content (Content): The content model.
+
+    Returns:
+    str: HTML for the page section.
+    """
+    from portfolio import ui
+    from portfolio.markup import inline_html, markdown_to_html
+    from portfolio.pages.projects import PROJECTS_CAPTION
+
+    sections = [f"<h1>Projects 🌟</h1><p class=\"caption\">{inline_html(PROJECTS_CAPTION)}</p>"]
+    for number, project in enumerate(content.projects, 1):
+        highlights = "".join(f"\n- {highlight}" for highlight in project.highlights)
+        sections.append(f"""
+        <h3>Project {number}: {escape(project.title)}, {project.year}</h3>
+        {ui.skills_html(project.skills, variant="tag")}
+        {markdown_to_html(project.description)}
+        {markdown_to_html(highlights)}
+        {ui.gallery_html([f"./{path}" for path in project.images])}
+        <br>
+        """)
+    return "".join(sections)
+
+
+def sidebar_html(home, content, cv_href):
+    """
+    Render the sidebar.
+
+    Args:
+    home (module): The imported Home module.
+    content (Content): The content model.
+    cv_href (str): URL of the exported CV.
+
+    Returns:
+    str: HTML for the sidebar.
+    """
+    from portfolio.assets import image_url
+    from portfolio.embeds import embed_src
+    from portfolio.theme import load_themes, toggle_html
+
+    profile = content.profile
+    avatar = image_url(home.AVATAR_PATH, "jpeg", 320) or home.AVATAR_PATH
+    return f"""
+    <img class="avatar" src="{avatar}" alt="">
+    <nav class="nav">
+        <a href="#about">👤 About</a>
+        <a href="#projects">💻 Projects</a>
+    </nav>
+    {toggle_html(load_themes())}
+    <h2>Contact Details</h2>
+    <p>Email: {escape(profile.email)}</p>
+    <div class="socials">
+        <a href="{profile.linkedin}" target="_blank"><img src="{embed_src("linkedin")}" width="30" height="30" alt="LinkedIn"></a>
+        <a href="{profile.github}" target="_blank"><img src="{embed_src("github")}" width="30" height="30" alt="GitHub"></a>
+    </div>
+    <hr>
+    <h3>Download CV 📄</h3>
+    <p class="caption">Download My professional CV</p>
+    <a class="download" href="{cv_href}" download="{os.path.basename(home.CV_PATH)}">Download</a>
+    <hr>
+    <p class="caption">Disclaimer: This portfolio is for streamlit demonstration purposes only.</p>
+    """
+
+
+def check_output_dir(output_dir):
+    """
+    Refuse output directories whose replacement would delete the sources.
+
+    Args:
+    output_dir (str): Directory the export would replace.
+
+    Raises:
+    ValueError: If output_dir is the repository root, contains it, or lies
+        inside static/.
+    """
+    output = os.path.realpath(output_dir)
+    root = os.path.realpath(ROOT)
+    static = os.path.join(root, "static")
+    if os.path.commonpath([output, root]) == output:
+        raise ValueError(f"refusing to replace {output_dir}: it contains the repository")
+    if os.path.commonpath([output, static]) == static:
+        raise ValueError(f"refusing to replace {output_dir}: it is static/ or inside it")
+
+
+def fetch_embeds():
+    """
+    Fetch every third-party embed synchronously.
+
+    The app serves a fallback while the first fetch runs in the background;
+    an export is written once, so it waits for the real images and keeps a
+    fallback only if its fetch fails.
+    """
+    from portfolio.embeds import EMBEDS, FETCH_ERRORS, embed_cache
+
+    for name in EMBEDS:
+        try:
+            embed_cache.fetch(name)
+        except FETCH_ERRORS as e:
+            print(f"using the fallback for {name}: {e}", file=sys.stderr)
+
+
+def write_hashed(output_dir, stem, ext, data):
+    """
+    Write data under a content-hashed name.
+
+    Args:
+    output_dir (str): Export directory.
+    stem (str): File name stem, e.g. "assets/style".
+    ext (str): Extension including the dot.
+    data (bytes): File contents.
+
+    Returns:
+    str: The path relative to output_dir.
+    """
+    rel = f"{stem}-{hashlib.sha256(data).hexdigest()[:12]}{ext}"
+    path = os.path.join(output_dir, rel)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+    return rel
+
+
+def precompress(output_dir):
+    """
+    Write .gz (and .br, if brotli is installed) next to every text file.
+
+    Args:
+    output_dir (str): Export directory.
+
+    Returns:
+    int: Number of files compressed.
+    """
+    try:
+        import brotli
+    except ImportError:
+        brotli = None
+
+    count = 0
+    for dirpath, _, filenames in os.walk(output_dir):
+        for name in filenames:
+            if not name.endswith(COMPRESSIBLE):
+                continue
+            path = os.path.join(dirpath, name)
+            with open(path, "rb") as f:
+                data = f.read()
+            with open(f"{path}.gz", "wb") as f:
+                # mtime=0 keeps the output byte-identical across exports.
+                f.write(gzip.compress(data, compresslevel=9, mtime=0))
+            if brotli is not None:
+                with open(f"{path}.br", "wb") as f:
+                    f.write(brotli.compress(data, quality=11))
+            count += 1
+    return count
+
+
+def build(output_dir=OUTPUT_DIR):
+    """
+    Export the site.
+
+    Args:
+    output_dir (str): Directory to write the site to; replaced if it exists.
+
+    Returns:
+    str: Path of the generated index.html.
+
+    Raises:
+    ValueError: If output_dir can't safely be replaced (check_output_dir).
+    """
+    check_output_dir(output_dir)
+    # Reference pre-encoded files by URL relative to the export root.
+    settings.IMAGE_MODE = "static"
+    settings.STATIC_URL = "static"
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    import Home as home
+    from portfolio.assets import read_file
+    from portfolio.pages import PAGES
+    from portfolio.content import load_content
+    from portfolio.styles import minify, stylesheet
+    from portfolio.theme import register_theme
+
+    if os.path.exists(output_dir):
+        shutil.rmtree(output_dir)
+    os.makedirs(output_dir)
+
+    # Page modules register their CSS on import; the export needs all of it.
+    for page in PAGES:
+        page.load()
+    register_theme()
+    fetch_embeds()
+    content = load_content()
+    cv_href = write_hashed(output_dir, "assets/cv", ".pdf", read_file(os.path.join(ROOT, home.CV_PATH)))
+    body = f"""
+    <div class="layout">
+        <aside class="sidebar">{sidebar_html(home, content, cv_href)}</aside>
+        <main>
+            <iframe class="petals" srcdoc="{escape(home.cherry_blossom_animation())}" aria-hidden="true" tabindex="-1"></iframe>
+            <section id="about" class="page">{about_html(content)}</section>
+            <section id="projects" class="page" hidden>{projects_html(content)}</section>
+        </main>
+    </div>
+    """
+
+    css_href = write_hashed(output_dir, "assets/style", ".css",
+                            (stylesheet() + minify(LAYOUT_CSS)).encode())
+    js_href = write_hashed(output_dir, "assets/app", ".js", NAV_JS.encode())
+    html = f"""<!doctype html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{escape(content.profile.name)}</title>
+<link rel="stylesheet" href="{css_href}">
+</head>
+<body>
+{body}
+<script src="{js_href}" defer></script>
+</body>
+</html>
+"""
+    index = os.path.join(output_dir, "index.html")
+    with open(index, "w", encoding="utf-8") as f:
+        f.write(html)
+
+    # Copy every static file the page or stylesheet refers to.
+    with open(os.path.join(output_dir, css_href), encoding="utf-8") as f:
+        refs = set(STATIC_REF.findall(html + f.read()))
+    for ref in sorted(refs):
+        source = os.path.join(ROOT, ref)
+        if os.path.isfile(source):
+            target = os.path.join(output_dir, ref)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copyfile(source, target)
+
+    precompress(output_dir)
+    return index
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Export the portfolio as a static site.")
+    parser.add_argument("--output", default=OUTPUT_DIR, help="directory to write the site to")
+    args = parser.parse_args(argv)
+
+    try:
+        index = build(args.output)
+    except ValueError as e:
+        parser.error(str(e))
+    total = sum(os.path.getsize(os.path.join(d, n)) for d, _, names in os.walk(args.output)
+                for n in names if not n.endswith((".gz", ".br")))
+    print(f"Wrote {index} ({total} bytes uncompressed)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
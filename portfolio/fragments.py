@@ -0,0 +1,28 @@
+"""
+Process-wide cache of pre-rendered HTML for static page sections.
+
+Sections such as the skills grid or the language cards only change when the
+content does, so their HTML is built once per process and reused by every
+session and rerun. Keys combine the section name with the (hashable) content
+it is rendered from, so editing it produces a new entry instead of serving
+stale markup. Colors are CSS custom properties (portfolio/theme.py), so the
+markup doesn't depend on the theme.
+"""
+from portfolio.assets import AssetCache
+
+html_cache = AssetCache(maxsize=32)
+
+
+def cached_html(name, render, *key):
+    """
+    Get a section's HTML, rendering it only on the first request.
+
+    Args:
+    name (str): Section name.
+    render (callable): Zero-argument function returning the HTML.
+    *key: Hashable values the HTML depends on, such as the content.
+
+    Returns:
+    object: Whatever render returned, usually a string.
+    """
+    return html_cache.get_or_create((name,) + key, render)
@@ -0,0 +1,54 @@
+"""
+Minimal Markdown to HTML conversion for content rendered outside Streamlit.
+
+Covers only what content.toml uses: paragraphs, "- " bullet lists, links,
+**bold** and backslash escapes. Anything else passes through as text.
+"""
+import re
+from html import escape
+
+_LINK = re.compile(r"\[([^\]]+)\]\(([^)\s]+)\)")
+_BOLD = re.compile(r"\*\*(.+?)\*\*")
+_ESCAPE = re.compile(r"\\([\\`*_{}\[\]()#+\-.!])")
+
+
+def inline_html(text):
+    """
+    Convert inline Markdown (links, bold, escapes) to HTML.
+
+    Args:
+    text (str): One line or paragraph of Markdown.
+
+    Returns:
+    str: HTML.
+    """
+    html = escape(text, quote=False)
+    html = _LINK.sub(r'<a href="\2" target="_blank">\1</a>', html)
+    html = _BOLD.sub(r"<strong>\1</strong>", html)
+    return _ESCAPE.sub(r"\1", html)
+
+
+def markdown_to_html(text):
+    """
+    Convert block-level Markdown (paragraphs and bullet lists) to HTML.
+
+    Args:
+    text (str): Markdown source.
+
+    Returns:
+    str: HTML.
+    """
+    blocks = []
+    for block in re.split(r"\n\s*\n", text.strip()):
+        lines = [line.strip() for line in block.splitlines() if line.strip()]
+        if lines and all(line.startswith("- ") for line in lines):
+            items = [f"<li>{inline_html(line[2:])}</li>" for line in lines]
+            # Bullets separated by blank lines still form one list.
+            if blocks and isinstance(blocks[-1], list):
+                blocks[-1].extend(items)
+            else:
+                blocks.append(items)
+        elif lines:
+            blocks.append(f"<p>{'<br>'.join(inline_html(line) for line in lines)}</p>")
+    return "".join(f"<ul>{''.join(block)}</ul>" if isinstance(block, list) else block
+                   for block in blocks)
@@ -0,0 +1,168 @@
+"""
+Opt-in per-session memory audit.
+
+With ``PORTFOLIO_MEMORY_AUDIT=1`` each full rerun records what the current
+session holds on the server, by source:
+
+- delta bytes emitted by the run, per element type (``markdown``,
+  ``imgs``, ...). They sit in the session's browser queue until flushed and
+  are what the client keeps in its message cache.
+- ``media``: bytes of the media files (st.image, st.download_button) the
+  session references in Streamlit's media file manager.
+- ``widget_state``: pickled size of the session state (widget values and
+  anything the app stores there).
+- ``fragments``: number of fragment callables stored for the session.
+
+Reports are kept for the most recent sessions only and shown in a sidebar
+panel. ``tests/test_memory.py`` and ``benchmarks/memory_audit.py`` drive
+hundreds of reruns through one session and check that the footprint stays
+flat.
+
+The audit reads Streamlit internals (the media file manager, session state,
+fragment storage); a source that can't be read is reported as None.
+"""
+import functools
+import pickle
+import threading
+from collections import OrderedDict
+
+import streamlit as st
+from streamlit.runtime.scriptrunner_utils.script_run_context import get_script_run_ctx
+
+from portfolio import settings
+
+ENABLED = settings.MEMORY_AUDIT
+
+# Sessions whose latest report is kept.
+MAX_SESSIONS = 256
+
+_lock = threading.Lock()
+_installed = False
+# session id -> {element type: bytes} for the run in progress
+_emitted = {}
+# session id -> latest report, oldest first
+reports = OrderedDict()
+
+
+def _session_id():
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return ctx.session_id if ctx else None
+
+
+def _instrument_queue():
+    from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
+
+    enqueue = ForwardMsgQueue.enqueue
+
+    @functools.wraps(enqueue)
+    def counting_enqueue(self, msg):
+        if msg.WhichOneof("type") == "delta" and msg.delta.WhichOneof("type") == "new_element":
+            emitted = _emitted.get(_session_id())
+            # Only full runs between begin_run() and end_run() are counted.
+            if emitted is not None:
+                kind = msg.delta.new_element.WhichOneof("type")
+                with _lock:
+                    emitted[kind] = emitted.get(kind, 0) + msg.ByteSize()
+        return enqueue(self, msg)
+
+    ForwardMsgQueue.enqueue = counting_enqueue
+
+
+def _media_bytes(session_id):
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.media_file_storage import MediaFileStorageError
+
+    manager = Runtime.instance().media_file_mgr
+    size = 0
+    for file_id in set(manager._files_by_session_and_coord.get(session_id, {}).values()):
+        try:
+            size += manager._storage.get_file(file_id).content_size
+        except MediaFileStorageError:  # deferred download, not generated yet
+            pass
+    return size
+
+
+def _widget_state_bytes():
+    state = get_script_run_ctx().session_state._state
+    size = 0
+    for key in state._keys():
+        try:
+            size += len(pickle.dumps(state[key]))
+        except Exception:  # unpicklable or stale values don't count
+            pass
+    return size
+
+
+def _fragment_count():
+    return len(get_script_run_ctx().fragment_storage._fragments)
+
+
+def _measure(source, *args):
+    try:
+        return source(*args)
+    except Exception:  # Streamlit internals moved; report the source as unknown
+        return None
+
+
+def install():
+    """Hook the forward message queue, once per process. Does nothing when disabled."""
+    global _installed
+    if not ENABLED:
+        return
+    with _lock:
+        if _installed:
+            return
+        _installed = True
+    _instrument_queue()
+
+
+def begin_run():
+    """Start counting the current session's emitted bytes afresh."""
+    if not ENABLED:
+        return
+    session_id = _session_id()
+    with _lock:
+        _emitted[session_id] = {}
+
+
+def end_run():
+    """
+    Record the current session's footprint after a full rerun.
+
+    Returns:
+    dict or None: The report, or None when the audit is disabled.
+    """
+    if not ENABLED:
+        return None
+    session_id = _session_id()
+    with _lock:
+        emitted = dict(_emitted.pop(session_id, {}))
+    report = {
+        "emitted": emitted,
+        "emitted_total": sum(emitted.values()),
+        "media": _measure(_media_bytes, session_id),
+        "widget_state": _measure(_widget_state_bytes),
+        "fragments": _measure(_fragment_count),
+    }
+    with _lock:
+        reports.pop(session_id, None)
+        reports[session_id] = report
+        while len(reports) > MAX_SESSIONS:
+            reports.popitem(last=False)
+    return report
+
+
+def debug_panel():
+    """Show the current session's latest report in a sidebar expander."""
+    if not ENABLED:
+        return
+    report = reports.get(_session_id())
+    if report is None:
+        return
+    with st.sidebar.expander("Memory audit"):
+        rows = [{"source": f"delta: {kind}", "bytes": size}
+                for kind, size in sorted(report["emitted"].items(), key=lambda item: -item[1])]
+        rows += [{"source": "media files", "bytes": report["media"]},
+                 {"source": "session state", "bytes": report["widget_state"]}]
+        st.dataframe(rows, hide_index=True)
+        st.caption(f"{report['fragments']} stored fragments")
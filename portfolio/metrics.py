@@ -0,0 +1,293 @@
+"""
+Opt-in render instrumentation.
+
+With ``PORTFOLIO_METRICS=1`` every render function wrapped with ``timed`` (and
+every ``section`` block) records its call count and wall time, and each
+``st.markdown`` call adds the size of its body to the innermost section being
+rendered. Numbers are aggregated per process, shown in a sidebar panel and,
+if ``PORTFOLIO_METRICS_PORT`` is set, served in Prometheus text format on
+``http://<host>:<port>/metrics``.
+
+When metrics are disabled ``timed`` returns the function unchanged and
+``section`` returns a shared no-op context manager, so the hot path pays
+nothing.
+
+Section times are inclusive: ``about_page`` includes the ``gallery`` call it
+makes.
+"""
+import functools
+import logging
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import streamlit as st
+
+from portfolio import settings, warmup
+
+ENABLED = settings.METRICS
+
+logger = logging.getLogger(__name__)
+
+_NOOP = nullcontext()
+_local = threading.local()
+_install_lock = threading.Lock()
+_installed = False
+
+
+class SectionStats:
+    """Counters for one render section."""
+
+    __slots__ = ("calls", "seconds", "max_seconds", "markdown_calls", "markdown_bytes")
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.markdown_calls = 0
+        self.markdown_bytes = 0
+
+
+class Registry:
+    """Thread-safe per-process aggregate of section timings and output sizes."""
+
+    def __init__(self):
+        self._sections = {}
+        self._lock = threading.Lock()
+
+    def _stats(self, name):
+        stats = self._sections.get(name)
+        if stats is None:
+            stats = self._sections[name] = SectionStats()
+        return stats
+
+    def record(self, name, seconds):
+        """
+        Record one completed call of a section.
+
+        Args:
+        name (str): Section name.
+        seconds (float): Wall time of the call.
+        """
+        with self._lock:
+            stats = self._stats(name)
+            stats.calls += 1
+            stats.seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+
+    def add_markdown(self, name, size):
+        """
+        Record one st.markdown call made while a section was rendering.
+
+        Args:
+        name (str): Section name.
+        size (int): Body size in bytes.
+        """
+        with self._lock:
+            stats = self._stats(name)
+            stats.markdown_calls += 1
+            stats.markdown_bytes += size
+
+    def snapshot(self):
+        """
+        Get a copy of the current counters.
+
+        Returns:
+        list: One dict per section, slowest (by total time) first.
+        """
+        with self._lock:
+            rows = [{"section": name, "calls": s.calls,
+                     "total_ms": round(s.seconds * 1000, 2),
+                     "mean_ms": round(s.seconds / s.calls * 1000, 2) if s.calls else 0.0,
+                     "max_ms": round(s.max_seconds * 1000, 2),
+                     "markdown_calls": s.markdown_calls,
+                     "markdown_bytes": s.markdown_bytes}
+                    for name, s in self._sections.items()]
+        return sorted(rows, key=lambda row: row["total_ms"], reverse=True)
+
+    def reset(self):
+        """Drop all counters."""
+        with self._lock:
+            self._sections.clear()
+
+
+registry = Registry()
+
+
+def _stack():
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+@contextmanager
+def _timed_section(name):
+    stack = _stack()
+    stack.append(name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        registry.record(name, time.perf_counter() - start)
+        stack.pop()
+
+
+def section(name):
+    """
+    Time a block of code as a named section.
+
+    Args:
+    name (str): Section name.
+
+    Returns:
+    contextmanager: The timing context, or a no-op when metrics are disabled.
+    """
+    return _timed_section(name) if ENABLED else _NOOP
+
+
+def timed(name=None):
+    """
+    Decorator timing every call of a render function.
+
+    Args:
+    name (str, optional): Section name. Defaults to the function name.
+
+    Returns:
+    callable: The decorator. It returns the function unchanged when metrics
+    are disabled.
+    """
+    def decorate(func):
+        if not ENABLED:
+            return func
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with _timed_section(label):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def _instrument_markdown():
+    from streamlit.delta_generator import DeltaGenerator
+
+    markdown = DeltaGenerator.markdown
+
+    @functools.wraps(markdown)
+    def counting_markdown(self, body, *args, **kwargs):
+        stack = _stack()
+        registry.add_markdown(stack[-1] if stack else "other", len(str(body).encode()))
+        return markdown(self, body, *args, **kwargs)
+
+    DeltaGenerator.markdown = counting_markdown
+    # st.markdown is a method bound at import time; rebind it to the wrapper.
+    st.markdown = st._main.markdown
+
+
+def _caches():
+    from portfolio.assets import cv_cache, disk_cache, file_cache, image_cache
+    from portfolio.fragments import html_cache
+
+    caches = {"image": image_cache, "file": file_cache, "cv": cv_cache, "html": html_cache}
+    if disk_cache is not None:
+        caches["disk"] = disk_cache
+    return caches
+
+
+def prometheus_text():
+    """
+    Render the counters in the Prometheus text exposition format.
+
+    Returns:
+    str: Metrics document.
+    """
+    rows = registry.snapshot()
+    series = [
+        ("portfolio_render_calls_total", "counter", "Completed calls per render section.",
+         "calls", 1),
+        ("portfolio_render_seconds_total", "counter", "Wall time spent per render section.",
+         "total_ms", 0.001),
+        ("portfolio_render_seconds_max", "gauge", "Slowest single call per render section.",
+         "max_ms", 0.001),
+        ("portfolio_markdown_calls_total", "counter", "st.markdown calls per render section.",
+         "markdown_calls", 1),
+        ("portfolio_markdown_bytes_total", "counter", "st.markdown body bytes per render section.",
+         "markdown_bytes", 1),
+    ]
+    lines = []
+    for metric, kind, help_text, field, scale in series:
+        lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} {kind}"]
+        lines += [f'{metric}{{section="{row["section"]}"}} {row[field] * scale:g}' for row in rows]
+    for field in ("hits", "misses", "evictions"):
+        metric = f"portfolio_cache_{field}_total"
+        lines += [f"# HELP {metric} Asset cache {field}.", f"# TYPE {metric} counter"]
+        lines += [f'{metric}{{cache="{name}"}} {getattr(cache, field)}'
+                  for name, cache in _caches().items()]
+    finished = {name: seconds for name, seconds in warmup.results.items()
+                if isinstance(seconds, float)}
+    if finished:
+        metric = "portfolio_warmup_seconds"
+        lines += [f"# HELP {metric} Time taken by each startup warm-up task.", f"# TYPE {metric} gauge"]
+        lines += [f'{metric}{{task="{name}"}} {seconds:g}' for name, seconds in finished.items()]
+    return "\n".join(lines) + "\n"
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """Serves prometheus_text() on /metrics."""
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = prometheus_text().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def install():
+    """
+    Hook st.markdown and start the metrics endpoint, once per process.
+
+    Does nothing when metrics are disabled. If the port can't be bound (taken,
+    or already used by another worker on the host), a warning is logged and
+    the process runs without an endpoint rather than failing the page; it
+    doesn't retry on later runs.
+    """
+    global _installed
+    if not ENABLED:
+        return
+    with _install_lock:
+        if _installed:
+            return
+        _installed = True
+        _instrument_markdown()
+        if not settings.METRICS_PORT:
+            return
+        try:
+            server = ThreadingHTTPServer(("127.0.0.1", settings.METRICS_PORT), MetricsHandler)
+        except OSError as e:
+            logger.warning("Metrics endpoint not started on port %d: %s", settings.METRICS_PORT, e)
+        else:
+            threading.Thread(target=server.serve_forever, name="portfolio-metrics",
+                             daemon=True).start()
+
+
+def debug_panel():
+    """Show the counters in a sidebar expander. Does nothing when metrics are disabled."""
+    if not ENABLED:
+        return
+    with st.sidebar.expander("Render metrics"):
+        st.dataframe(registry.snapshot(), hide_index=True)
+        if st.button("Reset", key="metrics_reset"):
+            registry.reset()
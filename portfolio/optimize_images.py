@@ -0,0 +1,232 @@
+"""
+Build-time image optimization pipeline.
+
+Walks ``image/``, resizes every picture to the widths it is actually rendered
+at, and writes compressed WebP and JPEG variants with content-hashed file names
+plus a manifest describing them. The manifest also carries a tiny inlined
+placeholder thumbnail and the dominant color of each image, shown while the
+real image loads. The app serves these variants instead of
+transcoding the originals on every request.
+
+Usage::
+
+    python -m portfolio.optimize_images [--source image] [--output static/img]
+
+The defaults are image/ and static/img/ in the repository, wherever the
+command is run from.
+"""
+import argparse
+import base64
+import hashlib
+import json
+import os
+import sys
+from io import BytesIO
+
+# Repository root. Defined here rather than taken from portfolio.assets,
+# which imports this module.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_DIR = os.path.join(ROOT, "image")
+OUTPUT_DIR = os.path.join(ROOT, "static", "img")
+MANIFEST_NAME = "manifest.json"
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp")
+
+# Rendered widths in CSS pixels, at 1x and 2x density. Gallery images sit in a
+# third of the wide layout; the avatar sits in a third of the sidebar.
+PROFILES = {
+    "gallery": (400, 800),
+    "avatar": (160, 320),
+}
+IMAGE_PROFILES = {
+    "maomao.jpg": "avatar",
+}
+FORMATS = {
+    "webp": {"format": "WEBP", "quality": 78, "method": 6},
+    "jpeg": {"format": "JPEG", "quality": 80, "optimize": True, "progressive": True},
+}
+EXTENSIONS = {"webp": ".webp", "jpeg": ".jpg"}
+# Longest side of the inlined placeholder thumbnail. Scaled up by the browser
+# it reads as a blur of the image.
+PLACEHOLDER_SIZE = 20
+PLACEHOLDER_FORMAT = {"format": "WEBP", "quality": 40, "method": 6}
+
+
+def file_hash(data):
+    """
+    Hash bytes for use in file names and the manifest.
+
+    Args:
+    data (bytes): Content to hash.
+
+    Returns:
+    str: First 12 hex characters of the SHA-256 digest.
+    """
+    return hashlib.sha256(data).hexdigest()[:12]
+
+
+def encode_variant(img, fmt):
+    """
+    Encode a PIL image in one of the supported output formats.
+
+    Args:
+    img (PIL.Image.Image): Image to encode.
+    fmt (str): Key of FORMATS.
+
+    Returns:
+    bytes: Encoded image.
+    """
+    options = dict(FORMATS[fmt])
+    buffered = BytesIO()
+    img.save(buffered, **options)
+    return buffered.getvalue()
+
+
+def placeholder(img):
+    """
+    Encode a tiny thumbnail of an image as a data URI.
+
+    Args:
+    img (PIL.Image.Image): Full-size RGB image.
+
+    Returns:
+    str: "data:image/webp;base64,..." URI, usually a few hundred bytes.
+    """
+    from PIL import Image
+
+    thumb = img.copy()
+    thumb.thumbnail((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE), Image.LANCZOS)
+    buffered = BytesIO()
+    thumb.save(buffered, **PLACEHOLDER_FORMAT)
+    return f"data:image/webp;base64,{base64.b64encode(buffered.getvalue()).decode()}"
+
+
+def dominant_color(img):
+    """
+    Find the most common color of an image.
+
+    Args:
+    img (PIL.Image.Image): Full-size RGB image.
+
+    Returns:
+    str: CSS hex color, e.g. "#a1b2c3".
+    """
+    from PIL import Image
+
+    quantized = img.resize((64, 64), Image.BILINEAR).quantize(colors=5, method=Image.Quantize.MEDIANCUT)
+    _, index = max(quantized.getcolors())
+    red, green, blue = quantized.getpalette()[index * 3:index * 3 + 3]
+    return f"#{red:02x}{green:02x}{blue:02x}"
+
+
+def process_image(source_path, output_dir):
+    """
+    Produce all variants of one source image.
+
+    Args:
+    source_path (str): Path to the original image.
+    output_dir (str): Directory the variants are written to.
+
+    Returns:
+    dict: Manifest entry for the image.
+    """
+    # Imported here so that portfolio.assets can read MANIFEST_NAME/OUTPUT_DIR
+    # without loading PIL.
+    from PIL import Image, ImageOps
+
+    with open(source_path, "rb") as f:
+        source_bytes = f.read()
+    name = os.path.basename(source_path)
+    stem = os.path.splitext(name)[0]
+    profile = IMAGE_PROFILES.get(name, "gallery")
+
+    img = ImageOps.exif_transpose(Image.open(source_path)).convert("RGB")
+    entry = {
+        "profile": profile,
+        "width": img.width,
+        "height": img.height,
+        "bytes": len(source_bytes),
+        "hash": file_hash(source_bytes),
+        "placeholder": placeholder(img),
+        "color": dominant_color(img),
+        "variants": [],
+    }
+
+    # Never upscale: widths above the source collapse to the source width.
+    widths = sorted({min(width, img.width) for width in PROFILES[profile]})
+    for width in widths:
+        height = round(img.height * width / img.width)
+        resized = img if width == img.width else img.resize((width, height), Image.LANCZOS)
+        for fmt in FORMATS:
+            data = encode_variant(resized, fmt)
+            digest = file_hash(data)
+            filename = f"{stem}-{width}-{digest}{EXTENSIONS[fmt]}"
+            with open(os.path.join(output_dir, filename), "wb") as f:
+                f.write(data)
+            entry["variants"].append({
+                "file": filename,
+                "format": fmt,
+                "width": width,
+                "height": height,
+                "bytes": len(data),
+                "hash": digest,
+            })
+    return entry
+
+
+def build(source_dir=SOURCE_DIR, output_dir=OUTPUT_DIR):
+    """
+    Run the pipeline over every image in source_dir.
+
+    Variants that are no longer referenced by the new manifest are removed.
+
+    Args:
+    source_dir (str): Directory containing the original images.
+    output_dir (str): Directory for variants and the manifest.
+
+    Returns:
+    dict: The manifest that was written.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = {"version": 1, "images": {}}
+    for name in sorted(os.listdir(source_dir)):
+        if not name.lower().endswith(IMAGE_EXTENSIONS):
+            continue
+        source_path = os.path.join(source_dir, name)
+        # Keyed like portfolio.assets looks images up: relative to the root.
+        key = os.path.relpath(os.path.abspath(source_path), ROOT).replace(os.sep, "/")
+        manifest["images"][key] = process_image(source_path, output_dir)
+
+    referenced = {MANIFEST_NAME}
+    for entry in manifest["images"].values():
+        referenced.update(variant["file"] for variant in entry["variants"])
+    for name in os.listdir(output_dir):
+        if name not in referenced and name.lower().endswith((".webp", ".jpg")):
+            os.remove(os.path.join(output_dir, name))
+
+    with open(os.path.join(output_dir, MANIFEST_NAME), "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return manifest
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Pre-encode gallery images.")
+    parser.add_argument("--source", default=SOURCE_DIR, help="directory of original images")
+    parser.add_argument("--output", default=OUTPUT_DIR, help="directory for variants and manifest")
+    args = parser.parse_args(argv)
+
+    manifest = build(args.source, args.output)
+    total_source = total_webp = 0
+    for key, entry in manifest["images"].items():
+        largest = max((v for v in entry["variants"] if v["format"] == "webp"),
+                      key=lambda v: v["width"])
+        total_source += entry["bytes"]
+        total_webp += largest["bytes"]
+        print(f"{key}: {entry['bytes']} B -> {largest['bytes']} B webp @ {largest['width']}px")
+    print(f"total: {total_source} B -> {total_webp} B")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+"""
+The app's pages, one module each.
+
+Home.py builds its st.navigation menu from PAGES. Each page is a tiny script
+in ``app_pages/`` that imports its module here and calls its render function,
+so a page's code, content and styles are only loaded the first time someone
+visits it (or the warm-up gets to it), and adding pages doesn't slow down the
+existing ones.
+"""
+import importlib
+from dataclasses import dataclass
+
+from portfolio import settings
+
+
+@dataclass(frozen=True, slots=True)
+class Page:
+    """One navigation entry; script is relative to the repository root."""
+    title: str
+    icon: str
+    url_path: str
+    script: str
+    module: str
+
+    def load(self):
+        """
+        Import the page's module.
+
+        Returns:
+        module: The page module; later calls return the already imported one.
+        """
+        return importlib.import_module(self.module)
+
+
+# The first page is the default.
+PAGES = (
+    Page("About", ":material/person:", "about", "app_pages/about.py", "portfolio.pages.about"),
+    Page("Projects", ":material/code:", "projects", "app_pages/projects.py", "portfolio.pages.projects"),
+)
+if settings.ANALYTICS_REPORT:
+    PAGES += (Page("Analytics", ":material/monitoring:", "analytics", "app_pages/analytics.py",
+                   "portfolio.pages.analytics"),)
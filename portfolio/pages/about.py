@@ -0,0 +1,188 @@
+"""
+The About page: intro, "My Journey" timeline, skills, languages, interests
+and the gallery.
+"""
+import streamlit as st
+
+from portfolio.assets import use_static_images
+from portfolio.content import load_content
+from portfolio.embeds import embed_src
+from portfolio.fragments import cached_html
+from portfolio.metrics import timed
+from portfolio.styles import register_style
+from portfolio.theme import frame_html, load_themes
+from portfolio.timeline import timeline_html
+from portfolio.ui import gallery, skills_html
+
+
+@timed()
+def timeline(content):
+    """
+    Render the "My Journey" timeline.
+
+    Every year's entries ship once with the page and the year slider runs in
+    the browser (portfolio/timeline.py), including the cherry blossom rain for
+    the current year, so moving it costs no server rerun. The HTML is built
+    once per process.
+
+    Args:
+    content (Content): The content model.
+    """
+    themes = load_themes()
+    html = cached_html("timeline",
+                       lambda: timeline_html(content, rain_target="window.parent.document",
+                                             head=frame_html(themes)),
+                       content.experiences, themes)
+    st.iframe(html, height="content")
+
+
+@st.fragment
+@timed()
+def skills_section(content):
+    """
+    Render the skills grid with an optional category filter.
+
+    Runs as a fragment so changing the filter only rerenders the grid.
+
+    Args:
+    content (Content): The content model.
+    """
+    categories = st.pills("Filter skills", content.skill_categories,
+                          selection_mode="multi", label_visibility="collapsed")
+    categories = tuple(categories or ())
+    st.markdown(cached_html("skills", lambda: skills_html(content.skills, categories=categories),
+                            content.skills, categories),
+                unsafe_allow_html=True)
+
+
+def language_cards_html(languages):
+    """
+    Build the language cards, split across two columns.
+
+    Args:
+    languages (tuple): Language entries from the content model.
+
+    Returns:
+    tuple: HTML for the left column and for the right column.
+    """
+    cards = [f"""
+        <div class="language-card">
+            <div class="language-name">{language.name}</div>
+            <div class="proficiency-bar" style="width: {language.score}%;"></div>
+            <div class="proficiency-text">Speaking : {language.speaking}</div>
+            <div class="proficiency-text">Writing : {language.writing}</div>
+        </div>""" for language in languages]
+    return "".join(cards[0::2]), "".join(cards[1::2])
+
+
+# Language card styling
+register_style("language-card", """
+    .language-card {
+        padding: 20px;
+        border-radius: 10px;
+        margin-bottom: 20px;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+        transition: all 0.3s ease;
+        cursor: pointer;
+        background-color: var(--color-light);
+    }
+    .language-card:hover {
+        transform: translateY(-5px);
+        box-shadow: 0 8px 12px rgba(0, 0, 0, 0.2);
+        background-color: var(--color-dark);
+    }
+    .language-name {
+        font-size: 22px;
+        font-weight: bold;
+        margin-bottom: 15px;
+        color: var(--color-secondary);
+        transition: color 0.3s ease;
+    }
+    .language-card:hover .language-name {
+        color: var(--color-accent);
+    }
+    .proficiency-bar {
+        background-color: var(--color-accent);
+        height: 20px;
+        border-radius: 10px;
+        margin-bottom: 15px;
+        transition: all 0.3s ease;
+    }
+    .language-card:hover .proficiency-bar {
+        height: 22px;
+    }
+    .proficiency-text {
+        font-size: 16px;
+        color: var(--color-primary);
+        transition: color 0.3s ease;
+    }
+    .language-card:hover .proficiency-text {
+        color: var(--color-secondary);
+    }
+""")
+
+
+@timed()
+def about_page():
+    """Render the About page content."""
+    content = load_content()
+    profile = content.profile
+
+    st.markdown('<p class="medium-font">Hi! I am,</p>', unsafe_allow_html=True)
+    st.markdown(f'<p class="big-font">🌸{profile.name}🌸</p>', unsafe_allow_html=True)
+    st.markdown(f'<p class="job-font">{profile.role}</p>', unsafe_allow_html=True)
+
+    st.subheader("About Me")
+    st.markdown(f'<div class="small-font">{profile.about}</div>', unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    st.subheader("My Journey")
+
+    timeline(content)
+
+    st.markdown("---")
+
+    st.subheader("Skills")
+
+    skills_section(content)
+
+    st.markdown("---")
+
+    st.subheader("Language")
+
+    col1, col2 = st.columns(2)
+
+    # Static sections are rendered once per process, keyed on content
+    left, right = cached_html("languages", lambda: language_cards_html(content.languages),
+                              content.languages)
+    col1.markdown(left, unsafe_allow_html=True)
+    col2.markdown(right, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    st.subheader("Areas of Interest")
+    interests = "".join(f"\n - {interest}" for interest in profile.interests)
+    st.markdown(f'<div class="small-font">\n{interests}</div>', unsafe_allow_html=True)
+
+    # From GitHub KevzPeter / Duolingo-Stats-Card, cached server-side
+    st.markdown(f"""
+        <div style="display: flex; justify-content: center;">
+            <img src="{embed_src("duolingo", use_static_images())}" alt="Duolingo Stats"/>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    st.subheader("Gallery")
+
+    gallery([f"./{path}" for path in profile.gallery])
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    st.markdown(
+        "<p style='text-align: center; color: #888; font-style: italic;'>Have a nice day!</p>",
+        unsafe_allow_html=True
+    )
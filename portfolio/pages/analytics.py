@@ -0,0 +1,40 @@
+"""The Analytics page: recorded page views and CV downloads (portfolio/analytics.py)."""
+import streamlit as st
+
+from portfolio import analytics
+from portfolio.metrics import timed
+
+
+@timed()
+def analytics_page():
+    """Render the Analytics page content."""
+    st.title("Analytics 📊")
+
+    tracker = analytics.tracker
+    if tracker is None:
+        st.caption("Analytics are off (PORTFOLIO_ANALYTICS is empty).")
+        return
+    # Show what is still queued too.
+    tracker.flush()
+
+    rows = tracker.counts()
+    views = {value: events for kind, value, events, _ in rows if kind == "page_view"}
+    downloads = sum(events for kind, _, events, _ in rows if kind == "cv_download")
+    columns = st.columns(len(views) + 1)
+    for column, (page, events) in zip(columns, sorted(views.items())):
+        column.metric(f"Views: {page}", events)
+    columns[-1].metric("CV downloads", downloads)
+
+    st.subheader("Last 30 days")
+    daily = [{"day": day, "page views": events} for day, events in tracker.daily("page_view")]
+    if daily:
+        st.bar_chart(daily, x="day", y="page views")
+    else:
+        st.caption("No page views yet.")
+
+    st.subheader("All events")
+    st.dataframe([{"event": kind, "value": value, "count": events, "sessions": sessions}
+                  for kind, value, events, sessions in rows], hide_index=True)
+    stats = tracker.stats()
+    st.caption(f"{stats['written']} events written and {stats['dropped']} dropped by this process, "
+               f"{stats['queued']} queued.")
@@ -0,0 +1,85 @@
+"""
+The Projects page: a catalog of the projects in content.toml, filterable by
+skill tag and shown a page at a time (portfolio/catalog.py).
+"""
+import streamlit as st
+
+from portfolio.catalog import matching, page
+from portfolio.content import load_content
+from portfolio.metrics import timed
+from portfolio.ui import create_skill_tags, gallery
+
+PROJECTS_CAPTION = ("Here are some of the projects I've worked on. For more projects and information, please "
+                    "[click here](https://drive.google.com/drive/folders/19y3QbREaLSkC-R5D7zhEChK0XPsMqsmT?usp=sharing)")
+
+PER_PAGE = 5
+# Session state key of the current catalog page
+PAGE_KEY = "project_page"
+
+
+def _turn_page(step):
+    st.session_state[PAGE_KEY] = st.session_state.get(PAGE_KEY, 1) + step
+
+
+def _first_page():
+    st.session_state[PAGE_KEY] = 1
+
+
+def project_section(number, project):
+    """
+    Render one project.
+
+    Args:
+    number (int): The project's 1-based position in content.toml.
+    project (Project): The project.
+    """
+    st.subheader(f"Project {number}: {project.title}, {project.year}")
+    create_skill_tags(project.skills)
+    st.write(project.description)
+    st.write("".join(f"\n - {highlight}" for highlight in project.highlights))
+    gallery([f"./{path}" for path in project.images])
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+
+@st.fragment
+@timed()
+def project_catalog(content):
+    """
+    Render the skill filter and the current page of projects.
+
+    Runs as a fragment, so filtering and paging only rerender the catalog.
+    Projects off the current page are never rendered and their images never
+    encoded.
+
+    Args:
+    content (Content): The content model.
+    """
+    skills = st.pills("Filter by skill", content.project_skills, selection_mode="multi",
+                      key="project_skills", on_change=_first_page, label_visibility="collapsed")
+    positions = matching(content.by_project_skill, skills or (), len(content.projects))
+    current = page(positions, st.session_state.get(PAGE_KEY, 1), PER_PAGE)
+    st.session_state[PAGE_KEY] = current.number
+
+    if not current.total:
+        st.caption("No projects use the selected skills.")
+    for position in current.positions:
+        project_section(position + 1, content.projects[position])
+
+    if current.count > 1:
+        previous, label, following = st.columns([1, 2, 1])
+        previous.button("← Previous", key="project_page_previous", on_click=_turn_page, args=(-1,),
+                        disabled=current.number == 1)
+        label.caption(f"Page {current.number} of {current.count} · {current.total} projects")
+        following.button("Next →", key="project_page_next", on_click=_turn_page, args=(1,),
+                         disabled=current.number == current.count)
+
+
+@timed()
+def projects_page():
+    """Render the Projects page content."""
+    st.title("Projects 🌟")
+
+    st.caption(PROJECTS_CAPTION)
+
+    project_catalog(load_content())
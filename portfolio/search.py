@@ -0,0 +1,293 @@
+"""
+In-memory full-text search over the portfolio content.
+
+Experiences, projects and skills are turned into documents and indexed once
+per content version. Every term keeps its postings ordered by impact (a
+field-weighted tf-idf score), and every document keeps its own sorted term
+list, so a query never scans the corpus:
+
+1. Each query token is matched as a prefix of the vocabulary with two
+   bisections. The token matching the fewest documents drives the query;
+   its highest-impact postings, at most MAX_CANDIDATES documents, are the
+   candidates.
+2. Every other token is checked against each candidate's own term list,
+   again by bisection, and candidates missing one are dropped (AND).
+3. Sometimes the driving token was cut off at MAX_CANDIDATES and fewer
+   than the requested number of candidates survive step 2. Then the
+   documents matching every token are found by intersecting the tokens'
+   full posting sets. A document that matches all tokens, but none of
+   them strongly, is still found.
+
+Query cost therefore depends on MAX_CANDIDATES and the number of query
+tokens, not on the corpus size. The exception is step 3, which costs in
+proportion to the tokens' posting counts. The candidates and document counts
+of recent tokens are cached per index, and shared by every session, which
+helps most with the short prefixes typing produces.
+
+Exact matches score above prefix matches, and tokens shorter than
+MIN_PREFIX only match exactly, so "a" doesn't expand to half the
+vocabulary.
+"""
+import bisect
+import heapq
+import itertools
+import math
+import re
+import threading
+from dataclasses import dataclass
+from operator import itemgetter
+
+from portfolio.assets import AssetCache
+
+# Score multiplier per field a term appears in.
+FIELD_WEIGHTS = {"title": 3.0, "tags": 2.0, "body": 1.0}
+# Score multiplier for a term matched by prefix rather than exactly.
+PREFIX_WEIGHT = 0.5
+MIN_PREFIX = 2
+# Most terms the driving token expands to; the most frequent are kept.
+MAX_EXPANSIONS = 32
+# Most documents a query scores.
+MAX_CANDIDATES = 128
+# Tokens whose candidates and document counts are remembered. Search-as-you-
+# type sends the same short prefixes over and over, and they are the costliest.
+CANDIDATE_CACHE_SIZE = 1024
+
+_TOKEN = re.compile(r"\w+")
+_MARKUP = re.compile(r"\[([^\]]*)\]\([^)]*\)|[*_`\\]")
+
+
+@dataclass(frozen=True, slots=True)
+class Document:
+    """A searchable entry; page is the url path of the page that shows it."""
+    kind: str
+    title: str
+    page: str
+    body: str = ""
+    tags: tuple = ()
+
+
+@dataclass(frozen=True, slots=True)
+class Result:
+    """A ranked match."""
+    document: Document
+    score: float
+
+
+def tokenize(text):
+    """
+    Split text into lowercase word tokens, dropping Markdown link targets.
+
+    Args:
+    text (str): Plain text or inline Markdown.
+
+    Returns:
+    list: Tokens in order.
+    """
+    return _TOKEN.findall(_MARKUP.sub(r"\1", text).lower())
+
+
+class SearchIndex:
+    """
+    Impact-ordered inverted index with prefix matching.
+
+    Args:
+    documents (iterable): Document entries to index.
+    """
+
+    def __init__(self, documents):
+        self.documents = tuple(documents)
+        # term -> {document number: field-weighted term frequency}
+        postings = {}
+        for number, document in enumerate(self.documents):
+            fields = {"title": document.title, "body": document.body, "tags": " ".join(document.tags)}
+            for field, text in fields.items():
+                for token in tokenize(text):
+                    weights = postings.setdefault(token, {})
+                    weights[number] = weights.get(number, 0.0) + FIELD_WEIGHTS[field]
+        total = len(self.documents)
+        # term -> {document number: score}, with idf folded in
+        self._postings = {
+            term: {number: weight * math.log(1 + total / len(weights)) for number, weight in weights.items()}
+            for term, weights in postings.items()
+        }
+        # term -> [(score, document number)], best first
+        self._impacts = {term: sorted(((score, number) for number, score in scores.items()),
+                                      key=lambda item: (-item[0], item[1]))
+                         for term, scores in self._postings.items()}
+        self._terms = sorted(self._postings)
+        # _cumulative[i] is the number of postings of the first i terms
+        self._cumulative = list(itertools.accumulate((len(self._postings[term]) for term in self._terms),
+                                                     initial=0))
+        # document number -> its sorted distinct terms
+        document_terms = [[] for _ in self.documents]
+        for term in self._terms:
+            for number in self._postings[term]:
+                document_terms[number].append(term)
+        self._document_terms = [tuple(terms) for terms in document_terms]
+        self._candidate_cache = AssetCache(maxsize=CANDIDATE_CACHE_SIZE)
+        self._frequency_cache = AssetCache(maxsize=CANDIDATE_CACHE_SIZE)
+
+    def __len__(self):
+        return len(self.documents)
+
+    def _range(self, token):
+        """Get the slice of the sorted vocabulary a token is a prefix of."""
+        start = bisect.bisect_left(self._terms, token)
+        return start, bisect.bisect_left(self._terms, token + "\uffff", start)
+
+    def _expand(self, token):
+        """Get the (term, multiplier) pairs a query token matches in the vocabulary."""
+        if len(token) < MIN_PREFIX:
+            return [(token, 1.0)] if token in self._postings else []
+        start, end = self._range(token)
+        terms = self._terms[start:end]
+        if len(terms) > MAX_EXPANSIONS:
+            terms = heapq.nlargest(MAX_EXPANSIONS, terms, key=lambda term: len(self._postings[term]))
+        return [(term, 1.0 if term == token else PREFIX_WEIGHT) for term in terms]
+
+    def _candidates(self, token):
+        """
+        Get a copy of the best-scoring documents for a token, best first, and
+        whether they are all the documents the token matches.
+        """
+        candidates, complete = self._candidate_cache.get_or_create(token, lambda: self._top_documents(token))
+        return dict(candidates), complete
+
+    def _top_documents(self, token):
+        """Get the best-scoring documents for a token, best first, and whether none were cut off."""
+        terms = self._expand(token)
+        # Cut off if a term has postings past the head taken from it, or if
+        # MAX_EXPANSIONS left out some of the terms the prefix matches.
+        complete = all(len(self._impacts[term]) <= MAX_CANDIDATES for term, _ in terms)
+        if len(token) >= MIN_PREFIX:
+            start, end = self._range(token)
+            complete = complete and len(terms) == end - start
+        if len(terms) == 1:
+            term, multiplier = terms[0]
+            return {number: score * multiplier for score, number in self._impacts[term][:MAX_CANDIDATES]}, complete
+        # A document in the overall top MAX_CANDIDATES is in the top
+        # MAX_CANDIDATES of the term it scores best on, so the heads suffice.
+        candidates = {}
+        for term, multiplier in terms:
+            for score, number in self._impacts[term][:MAX_CANDIDATES]:
+                score *= multiplier
+                if score > candidates.get(number, 0.0):
+                    candidates[number] = score
+        complete = complete and len(candidates) <= MAX_CANDIDATES
+        return dict(heapq.nlargest(MAX_CANDIDATES, candidates.items(), key=itemgetter(1))), complete
+
+    def _documents(self, token):
+        """Get the set of documents a token matches."""
+        if len(token) < MIN_PREFIX:
+            return set(self._postings.get(token, ()))
+        start, end = self._range(token)
+        return set().union(*(self._postings[term] for term in self._terms[start:end]))
+
+    def _matching(self, tokens):
+        """Get every document matching all tokens with its score, unlike _candidates."""
+        numbers = set.intersection(*(self._documents(token) for token in tokens))
+        # In document order, so ties rank by position in the corpus.
+        return {number: sum(self._score(number, token) for token in tokens) for number in sorted(numbers)}
+
+    def _require(self, scores, tokens):
+        """Drop the documents missing any of the tokens from scores, adding the tokens' scores."""
+        for token in tokens:
+            for number in list(scores):
+                score = self._score(number, token)
+                if score:
+                    scores[number] += score
+                else:
+                    del scores[number]
+        return scores
+
+    def _frequency(self, token):
+        """Count the documents a token matches."""
+        if len(token) < MIN_PREFIX:
+            return len(self._postings.get(token, ()))
+        start, end = self._range(token)
+        if end - start <= 1:
+            # A single term's postings are distinct documents.
+            return self._cumulative[end] - self._cumulative[start]
+        # Terms sharing the prefix share documents, so their postings overcount.
+        return self._frequency_cache.get_or_create(token, lambda: len(self._documents(token)))
+
+    def _score(self, number, token):
+        """Score a token against one document's terms; 0 if none match."""
+        if len(token) < MIN_PREFIX:
+            return self._postings.get(token, {}).get(number, 0.0)
+        terms = self._document_terms[number]
+        best = 0.0
+        for i in range(bisect.bisect_left(terms, token), len(terms)):
+            term = terms[i]
+            if not term.startswith(token):
+                break
+            best = max(best, self._postings[term][number] * (1.0 if term == token else PREFIX_WEIGHT))
+        return best
+
+    def search(self, query, limit=10):
+        """
+        Find the documents matching every token of a query.
+
+        Args:
+        query (str): Free text; each word is matched as a prefix.
+        limit (int): Maximum number of results.
+
+        Returns:
+        list: Result entries, best first.
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return []
+        driver = min(tokens, key=self._frequency) if len(tokens) > 1 else tokens[0]
+        others = [token for token in tokens if token != driver]
+        scores, complete = self._candidates(driver)
+        scores = self._require(scores, others)
+        if len(scores) < limit and not complete:
+            # Matches outside the driver's strongest ones were never looked at.
+            scores = self._matching(tokens)
+        # Ties keep candidate order, i.e. the driving token's impact order.
+        best = heapq.nlargest(limit, scores.items(), key=itemgetter(1))
+        return [Result(self.documents[number], round(score, 4)) for number, score in best]
+
+
+def content_documents(content):
+    """
+    Turn the content model into search documents.
+
+    Args:
+    content (Content): The content model.
+
+    Returns:
+    list: Document entries for every experience, project and skill.
+    """
+    documents = [Document("experience", f"{e.month} {e.year}", "about", body=e.text)
+                 for e in content.experiences]
+    documents += [Document("project", p.title, "projects",
+                           body=" ".join((p.description,) + p.highlights),
+                           tags=p.skills + (str(p.year),))
+                  for p in content.projects]
+    documents += [Document("skill", s.name, "about", tags=(s.category,) if s.category else ())
+                  for s in content.skills]
+    return documents
+
+
+_built = {"content": None, "index": None}
+_lock = threading.Lock()
+
+
+def search_index(content):
+    """
+    Get the search index for a content version, building it on first use.
+
+    Args:
+    content (Content): The content model. A new version (content.toml
+        edited) gets a new index.
+
+    Returns:
+    SearchIndex: The index, shared by every session.
+    """
+    with _lock:
+        if _built["content"] is not content:
+            _built["index"] = SearchIndex(content_documents(content))
+            _built["content"] = content
+        return _built["index"]
@@ -0,0 +1,55 @@
+"""
+Runtime settings, read once from environment variables at import time.
+
+PORTFOLIO_IMAGE_MODE
+    "static" serves gallery images by URL from the pre-encoded variants in
+    static/img/, "inline" embeds them as base64 data URIs. Defaults to
+    "static" when Streamlit's static file serving is enabled.
+PORTFOLIO_STATIC_URL
+    Base URL that static/ is reachable at. Defaults to Streamlit's own
+    "app/static"; point it at a CDN or ``python -m portfolio.static_server``
+    to get long-lived cache headers.
+PORTFOLIO_EMBED_TTL
+    Seconds a fetched third-party embed (Duolingo card, social icons) is
+    served before it is refetched in the background. Defaults to 3600.
+PORTFOLIO_METRICS
+    "1" times each render section and counts st.markdown bytes (see
+    portfolio/metrics.py). Off by default.
+PORTFOLIO_METRICS_PORT
+    With metrics on, serve them in Prometheus text format on
+    http://127.0.0.1:<port>/metrics. Unset means no endpoint. Each Streamlit
+    process binds its own endpoint, so give every worker on a host its own
+    port; a process that can't bind it logs a warning and serves none.
+PORTFOLIO_MEMORY_AUDIT
+    "1" records each session's server-side footprint by source after every
+    full rerun (see portfolio/memory.py). Off by default.
+PORTFOLIO_DISK_CACHE
+    SQLite file for the on-disk asset cache shared by all Streamlit processes
+    on the host (see portfolio/disk_cache.py), relative to the repository
+    root. Defaults to ".cache/assets.sqlite3"; empty disables it.
+PORTFOLIO_DISK_CACHE_MB
+    Size cap of the on-disk asset cache in megabytes. Defaults to 64.
+PORTFOLIO_ANALYTICS
+    SQLite file that page views and CV downloads are recorded in (see
+    portfolio/analytics.py), relative to the repository root. Defaults to
+    ".cache/analytics.sqlite3"; empty disables analytics.
+PORTFOLIO_ANALYTICS_REPORT
+    "1" adds an Analytics page with the recorded counts. Off by default.
+PORTFOLIO_WARMUP
+    "1" fills the image, CV, content and embed caches in a background thread
+    on the first run in each process (see portfolio/warmup.py). Off by
+    default.
+"""
+import os
+
+IMAGE_MODE = os.environ.get("PORTFOLIO_IMAGE_MODE", "")
+STATIC_URL = os.environ.get("PORTFOLIO_STATIC_URL", "app/static").rstrip("/")
+EMBED_TTL = float(os.environ.get("PORTFOLIO_EMBED_TTL", "3600"))
+METRICS = os.environ.get("PORTFOLIO_METRICS", "") not in ("", "0")
+METRICS_PORT = int(os.environ.get("PORTFOLIO_METRICS_PORT", "0"))
+MEMORY_AUDIT = os.environ.get("PORTFOLIO_MEMORY_AUDIT", "") not in ("", "0")
+DISK_CACHE = os.environ.get("PORTFOLIO_DISK_CACHE", os.path.join(".cache", "assets.sqlite3"))
+DISK_CACHE_MB = float(os.environ.get("PORTFOLIO_DISK_CACHE_MB", "64"))
+WARMUP = os.environ.get("PORTFOLIO_WARMUP", "") not in ("", "0")
+ANALYTICS = os.environ.get("PORTFOLIO_ANALYTICS", os.path.join(".cache", "analytics.sqlite3"))
+ANALYTICS_REPORT = os.environ.get("PORTFOLIO_ANALYTICS_REPORT", "") not in ("", "0")
@@ -0,0 +1,70 @@
+"""
+Minimal static file server for static/ with long-lived cache headers.
+
+Streamlit's own app/static route only supports revalidation (ETag), so every
+page view still costs a round trip per image. Files whose names carry a
+content hash never change, so this server marks them immutable for a year.
+
+Usage::
+
+    python -m portfolio.static_server [--port 8502] [--directory static]
+    PORTFOLIO_STATIC_URL=http://localhost:8502 streamlit run Home.py
+"""
+import argparse
+import functools
+import re
+import sys
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+# e.g. exo-800-d499caadf6ff.webp
+HASHED_NAME = re.compile(r"-[0-9a-f]{12}\.[a-z0-9]+$")
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+class CachingHandler(SimpleHTTPRequestHandler):
+    """Request handler adding Cache-Control and CORS headers."""
+
+    def end_headers(self):
+        path = self.path.split("?", 1)[0]
+        if HASHED_NAME.search(path):
+            self.send_header("Cache-Control", IMMUTABLE)
+        else:
+            self.send_header("Cache-Control", "no-cache")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        super().end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(directory="static", host="127.0.0.1", port=8502):
+    """
+    Serve a directory until interrupted.
+
+    Args:
+    directory (str): Directory to serve.
+    host (str): Interface to bind.
+    port (int): Port to bind.
+    """
+    handler = functools.partial(CachingHandler, directory=directory)
+    with ThreadingHTTPServer((host, port), handler) as server:
+        print(f"Serving {directory}/ on http://{host}:{port}")
+        server.serve_forever()
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Serve static/ with cache headers.")
+    parser.add_argument("--directory", default="static")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    args = parser.parse_args(argv)
+    try:
+        serve(args.directory, args.host, args.port)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
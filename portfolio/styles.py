@@ -0,0 +1,84 @@
+"""
+Registry of named CSS fragments, injected as one minified stylesheet.
+
+Components register the CSS they need under a name instead of emitting their
+own <style> block each time they render, so a page carries each rule once no
+matter how many components use it. Registering the same name again replaces
+the fragment, which keeps re-executing the app script idempotent.
+"""
+import re
+import threading
+
+import streamlit as st
+
+_fragments = {}
+_lock = threading.Lock()
+_cache = {"key": None, "css": ""}
+
+_COMMENTS = re.compile(r"/\*.*?\*/", re.S)
+_WHITESPACE = re.compile(r"\s+")
+_PUNCTUATION = re.compile(r"\s*([{}:;,>])\s*")
+_IMPORTS = re.compile(r"""@import\s+(?:url\([^)]*\)|"[^"]*"|'[^']*')[^;]*;""")
+
+
+def register_style(name, css):
+    """
+    Register a CSS fragment under a name.
+
+    Args:
+    name (str): Unique fragment name, e.g. "skill-tags".
+    css (str): CSS rules, with or without a surrounding <style> tag.
+    """
+    css = css.strip()
+    if css.startswith("<style>"):
+        css = css[len("<style>"):]
+    if css.endswith("</style>"):
+        css = css[:-len("</style>")]
+    with _lock:
+        _fragments[name] = css
+
+
+def minify(css):
+    """
+    Strip comments and redundant whitespace from CSS.
+
+    Args:
+    css (str): CSS source.
+
+    Returns:
+    str: Minified CSS.
+    """
+    css = _COMMENTS.sub("", css)
+    css = _WHITESPACE.sub(" ", css)
+    css = _PUNCTUATION.sub(r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+def stylesheet():
+    """
+    Build the combined stylesheet of all registered fragments.
+
+    @import rules are hoisted to the top, where CSS requires them. The
+    minified result is cached until a fragment changes.
+
+    Returns:
+    str: Minified CSS.
+    """
+    with _lock:
+        key = tuple(_fragments.items())
+        if _cache["key"] != key:
+            css = "\n".join(_fragments.values())
+            imports = _IMPORTS.findall(css)
+            _cache["css"] = minify("\n".join(imports + [_IMPORTS.sub("", css)]))
+            _cache["key"] = key
+        return _cache["css"]
+
+
+def inject_styles():
+    """
+    Emit the combined stylesheet into the page.
+
+    Streamlit drops any element that a rerun does not emit again, so this is
+    called once near the top of every run rather than once per session.
+    """
+    st.markdown(f"<style>{stylesheet()}</style>", unsafe_allow_html=True)
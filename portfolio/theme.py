@@ -0,0 +1,282 @@
+"""
+Color themes as CSS custom properties, switched in the browser.
+
+The palettes are defined in themes.toml. The shared stylesheet defines each
+one once as a block of --color-<name> custom properties, and component CSS
+and markup only use var(--color-<name>). The HTML is therefore the same
+whatever theme is showing, and no cache depends on the palette.
+
+The browser picks the block. If the visitor chose a theme with the sidebar
+toggle, it is set as the data-theme attribute on <html> and remembered in
+localStorage. Otherwise prefers-color-scheme decides. Switching never reruns
+the script or resends any HTML.
+
+Custom properties don't cross into iframes, so iframes (the timeline) embed
+frame_html(). It carries the same blocks and follows the parent page's
+data-theme.
+"""
+import json
+import os
+import threading
+from dataclasses import dataclass
+from html import escape
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import toml as tomllib
+
+from portfolio.assets import ROOT, file_key
+from portfolio.styles import register_style
+
+THEMES_PATH = os.path.join(ROOT, "themes.toml")
+
+# Colors every theme defines, available to CSS as var(--color-<name>).
+COLOR_NAMES = ("primary", "secondary", "accent", "background", "text", "light", "medium", "dark")
+# localStorage key of the visitor's choice
+STORAGE_KEY = "portfolio-theme"
+
+
+@dataclass(frozen=True, slots=True)
+class Theme:
+    """One palette; colors are (name, CSS color) pairs in COLOR_NAMES order."""
+    name: str
+    label: str
+    colors: tuple
+
+
+@dataclass(frozen=True, slots=True)
+class Themes:
+    """
+    All themes, in file order.
+
+    default is the name of the theme shown unless the visitor's system
+    prefers a dark color scheme, in which case the one named by dark is.
+    """
+    themes: tuple
+    default: str
+    dark: str
+
+
+def parse_themes(data):
+    """
+    Build a Themes object from parsed TOML data.
+
+    Args:
+    data (dict): Parsed themes.toml.
+
+    Returns:
+    Themes: The themes.
+
+    Raises:
+    ValueError: If a theme lacks a color, or default or dark names an undefined theme.
+    """
+    themes = []
+    for name, entry in data["themes"].items():
+        missing = [color for color in COLOR_NAMES if color not in entry]
+        if missing:
+            raise ValueError(f"Theme {name!r} does not set {', '.join(missing)}")
+        themes.append(Theme(name, entry.get("label", name),
+                            tuple((color, entry[color]) for color in COLOR_NAMES)))
+    names = [theme.name for theme in themes]
+    default = data.get("default", names[0])
+    dark = data.get("dark", default)
+    for key, name in (("default", default), ("dark", dark)):
+        if name not in names:
+            raise ValueError(f"{key} theme {name!r} is not defined")
+    return Themes(tuple(themes), default, dark)
+
+
+_loaded = {"key": None, "themes": None}
+_lock = threading.Lock()
+
+
+def load_themes(path=THEMES_PATH):
+    """
+    Get the themes, re-parsing the file only when it has changed.
+
+    Args:
+    path (str): Path to the TOML themes file.
+
+    Returns:
+    Themes: The themes.
+    """
+    key = file_key(path)
+    with _lock:
+        if _loaded["key"] != key:
+            with open(path, encoding="utf-8") as f:
+                _loaded["themes"] = parse_themes(tomllib.loads(f.read()))
+            _loaded["key"] = key
+        return _loaded["themes"]
+
+
+def theme_css(themes):
+    """
+    Build the custom property blocks of every theme.
+
+    Args:
+    themes (Themes): The themes.
+
+    Returns:
+    str: CSS.
+    """
+    by_name = {theme.name: theme for theme in themes.themes}
+
+    def properties(theme):
+        return " ".join(f"--color-{color}: {value};" for color, value in theme.colors)
+
+    blocks = [f":root {{ {properties(by_name[themes.default])} }}"]
+    if themes.dark != themes.default:
+        blocks.append("@media (prefers-color-scheme: dark) { "
+                      f":root:not([data-theme]) {{ {properties(by_name[themes.dark])} }} }}")
+    blocks += [f':root[data-theme="{theme.name}"] {{ {properties(theme)} }}' for theme in themes.themes]
+    return "\n".join(blocks)
+
+
+_registered = {"themes": None}
+
+
+def register_theme():
+    """
+    Register the current themes.toml as the "theme" stylesheet fragment.
+
+    Called on every run so palette edits show up on the next rerun; the CSS
+    is only rebuilt when the file has changed.
+    """
+    themes = load_themes()
+    if _registered["themes"] is not themes:
+        register_style("theme", theme_css(themes))
+        _registered["themes"] = themes
+
+
+register_style("theme-toggle", """
+    .theme-toggle {
+        background-color: var(--color-light);
+        color: var(--color-secondary);
+        border: 2px solid var(--color-primary);
+        border-radius: 20px;
+        padding: 6px 16px;
+        font: inherit;
+        cursor: pointer;
+    }
+    .theme-toggle:hover {
+        background-color: var(--color-medium);
+    }
+""")
+
+
+def toggle_html(themes):
+    """
+    Build the theme toggle: a button cycling through the themes.
+
+    The script also restores a choice stored by an earlier visit. Picking the
+    theme the system preference would give anyway clears the stored choice,
+    so the page follows the system again.
+
+    Args:
+    themes (Themes): The themes.
+
+    Returns:
+    str: HTML with its own <script>, for st.html with JavaScript enabled or
+        a static page.
+    """
+    config = json.dumps({
+        "names": [theme.name for theme in themes.themes],
+        "labels": {theme.name: theme.label for theme in themes.themes},
+        "default": themes.default,
+        "dark": themes.dark,
+    }).replace("</", "<\\/")
+    html = f"""
+    <button class="theme-toggle" type="button">{escape(themes.themes[0].label)}</button>
+    <script>
+    (() => {{
+        const THEMES = {config};
+        const KEY = {json.dumps(STORAGE_KEY)};
+        const root = document.documentElement;
+        const system = window.matchMedia('(prefers-color-scheme: dark)');
+
+        function automatic() {{
+            return system.matches ? THEMES.dark : THEMES.default;
+        }}
+
+        function current() {{
+            return root.dataset.theme || automatic();
+        }}
+
+        function next() {{
+            const names = THEMES.names;
+            return names[(names.indexOf(current()) + 1) % names.length];
+        }}
+
+        function label() {{
+            for (const button of document.querySelectorAll('.theme-toggle')) {{
+                button.textContent = THEMES.labels[current()];
+                button.title = 'Switch to ' + THEMES.labels[next()];
+            }}
+        }}
+
+        function choose(name) {{
+            try {{
+                if (name === automatic()) localStorage.removeItem(KEY);
+                else localStorage.setItem(KEY, name);
+            }} catch (e) {{
+                // Storage can be disabled; the choice then lasts for this page.
+            }}
+            if (name === automatic()) delete root.dataset.theme;
+            else root.dataset.theme = name;
+            label();
+        }}
+
+        let stored = null;
+        try {{
+            stored = localStorage.getItem(KEY);
+        }} catch (e) {{}}
+        if (THEMES.names.includes(stored)) root.dataset.theme = stored;
+        // Reruns and page switches can mount the button again; bind it once.
+        for (const button of document.querySelectorAll('.theme-toggle:not([data-bound])')) {{
+            button.dataset.bound = '';
+            button.addEventListener('click', () => choose(next()));
+        }}
+        system.addEventListener('change', label);
+        label();
+    }})();
+    </script>
+    """
+    # Line breaks stay so the script's automatic semicolon insertion is unaffected.
+    return "\n".join(line.strip() for line in html.strip().splitlines())
+
+
+# Mirrors the embedding page's data-theme onto the frame's own <html>.
+FOLLOW_PARENT_JS = """
+(() => {
+    let parent;
+    try {
+        if (window.parent === window) return;
+        parent = window.parent.document.documentElement;
+    } catch (e) {
+        // A sandboxed or cross-origin frame follows prefers-color-scheme only.
+        return;
+    }
+    const root = document.documentElement;
+    function sync() {
+        if (parent.dataset.theme) root.dataset.theme = parent.dataset.theme;
+        else delete root.dataset.theme;
+    }
+    new MutationObserver(sync).observe(parent, {attributes: true, attributeFilter: ['data-theme']});
+    sync();
+})();
+"""
+
+
+def frame_html(themes):
+    """
+    Build the theme support for HTML shown in an iframe.
+
+    Args:
+    themes (Themes): The themes.
+
+    Returns:
+    str: A <style> with every theme's custom properties and a <script>
+        that follows the parent page's theme.
+    """
+    return f"<style>{theme_css(themes)}</style><script>{FOLLOW_PARENT_JS.strip()}</script>"
@@ -0,0 +1,150 @@
+"""
+Client-side "My Journey" timeline.
+
+Ships every year's entries once as JSON (they are tiny) and switches years
+in the browser, so moving the slider costs no server round trip. The
+cherry blossom rain for the current year is played client-side as well.
+"""
+import json
+
+from portfolio.markup import markdown_to_html
+
+
+def timeline_data(content):
+    """
+    Pre-render the timeline entries.
+
+    Args:
+    content (Content): The content model.
+
+    Returns:
+    dict: Year (as a string) to a list of {"month", "html"} entries.
+    """
+    return {
+        str(year): [{"month": e.month, "html": markdown_to_html(e.text)} for e in entries]
+        for year, entries in content.by_year.items()
+    }
+
+
+def timeline_html(content, rain_target="document", head=""):
+    """
+    Build the self-contained timeline widget.
+
+    Args:
+    content (Content): The content model.
+    rain_target (str): JS expression for the document the rain overlay is
+        attached to, e.g. "window.parent.document" from inside an iframe.
+    head (str): HTML placed before the widget. In an iframe this has to
+        define the theme's color properties (theme.frame_html()), which
+        don't cross the frame boundary.
+
+    Returns:
+    str: HTML with its own <style> and <script>.
+    """
+    # "</" is escaped so entry text can never close the <script> tag.
+    data = json.dumps(timeline_data(content)).replace("</", "<\\/")
+    html = f"""
+    {head}
+    <style>
+        .timeline label {{ color: var(--color-text); }}
+        .timeline input[type=range] {{ width: 100%; accent-color: var(--color-accent); }}
+        .timeline-year {{ font-weight: bold; color: var(--color-secondary); margin: 4px 0 12px; }}
+        /* Every year's panel shares one grid cell, so the widget is always as
+           tall as the longest year and switching years never shifts the page
+           (or resizes the iframe it is embedded in). */
+        .timeline-entries {{ display: grid; }}
+        .timeline-panel {{ grid-area: 1 / 1; visibility: hidden; }}
+        .timeline-panel.active {{ visibility: visible; }}
+        .timeline-entry, .timeline-empty {{
+            background-color: var(--color-light);
+            padding: 10px;
+            border-radius: 5px;
+            margin-bottom: 10px;
+        }}
+        .timeline-entry strong, .timeline-empty {{ color: var(--color-secondary); }}
+        .timeline-entry div {{ color: var(--color-accent); }}
+        .timeline-entry p, .timeline-entry ul {{ margin: 0.4em 0 0; }}
+        .timeline-hint {{ text-align: center; color: #888; font-style: italic; }}
+    </style>
+    <div class="timeline">
+        <label for="timeline-year">Select Year</label>
+        <input type="range" id="timeline-year" min="0" step="1">
+        <div class="timeline-year" aria-live="polite"></div>
+        <div class="timeline-entries"></div>
+        <p class="timeline-hint">Check out this year's journey for cute suprise!</p>
+    </div>
+    <script>
+    (() => {{
+        const DATA = {data};
+        const years = Object.keys(DATA);
+        const root = document.currentScript.previousElementSibling;
+        const slider = root.querySelector('input');
+        const label = root.querySelector('.timeline-year');
+        const list = root.querySelector('.timeline-entries');
+        slider.max = years.length - 1;
+        slider.value = 0;
+
+        function rain() {{
+            let doc;
+            try {{
+                doc = {rain_target};
+                doc.body;
+            }} catch (e) {{
+                // A sandboxed or cross-origin frame can't reach its parent.
+                doc = document;
+            }}
+            if (window.matchMedia('(prefers-reduced-motion: reduce)').matches) return;
+            const layer = doc.createElement('div');
+            layer.style.cssText = 'position:fixed;inset:0;pointer-events:none;overflow:hidden;z-index:999999';
+            for (let i = 0; i < 40; i++) {{
+                const drop = doc.createElement('span');
+                drop.textContent = '🌸';
+                drop.style.cssText = 'position:absolute;top:-5%;font-size:15px;left:' + Math.random() * 100 + '%';
+                drop.animate([{{top: '-5%'}}, {{top: '105%'}}], {{
+                    duration: 5000 + Math.random() * 3000,
+                    delay: Math.random() * 2000,
+                    fill: 'forwards',
+                }});
+                layer.appendChild(drop);
+            }}
+            doc.body.appendChild(layer);
+            setTimeout(() => layer.remove(), 10000);
+        }}
+
+        const panels = years.map((year) => {{
+            const panel = document.createElement('div');
+            panel.className = 'timeline-panel';
+            if (!DATA[year].length) {{
+                const empty = document.createElement('div');
+                empty.className = 'timeline-empty';
+                empty.textContent = '💤 No specific experiences recorded for ' + year + '.';
+                panel.appendChild(empty);
+            }}
+            for (const entry of DATA[year]) {{
+                const item = document.createElement('div');
+                item.className = 'timeline-entry';
+                item.innerHTML = '<strong></strong><div></div>';
+                item.firstChild.textContent = entry.month + ':';
+                item.lastChild.innerHTML = entry.html;
+                panel.appendChild(item);
+            }}
+            list.appendChild(panel);
+            return panel;
+        }});
+
+        function show() {{
+            label.textContent = years[slider.value];
+            panels.forEach((panel, i) => panel.classList.toggle('active', i === Number(slider.value)));
+        }}
+
+        slider.addEventListener('input', show);
+        slider.addEventListener('change', () => {{
+            if (Number(years[slider.value]) === new Date().getFullYear()) rain();
+        }});
+        show();
+    }})();
+    </script>
+    """
+    # Drop the source indentation; line breaks stay so the script's automatic
+    # semicolon insertion is unaffected.
+    return "\n".join(line.strip() for line in html.strip().splitlines())
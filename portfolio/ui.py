@@ -0,0 +1,245 @@
+"""
+Components shared by the app's pages.
+
+Everything here is imported by the Home.py shell and by every page module,
+so it only holds what more than one page uses: the image and gallery
+helpers and the skills grid, together with the CSS they register. Colors
+come from the theme's custom properties (portfolio/theme.py).
+"""
+from html import escape
+
+import streamlit as st
+
+from portfolio import settings
+from portfolio.assets import cached_image, image_url, manifest_entry, use_static_images
+from portfolio.metrics import timed
+from portfolio.styles import register_style
+
+
+register_style("image", """
+    .img-container {
+        transition: transform 0.3s ease, box-shadow 0.3s ease;
+        max-width: 100%;
+        width: 100%;
+        height: auto;
+        border-radius: 10px;
+        overflow: hidden;
+        box-shadow: 0 4px 8px 0 rgba(0, 0, 0, 0.2);
+        display: flex;
+        justify-content: center;
+        align-items: center;
+    }
+    .img-container:hover {
+        transform: translateY(-5px);
+        box-shadow: 0 10px 20px rgba(0,0,0,0.2);
+    }
+    .rounded-img {
+        width: 100%;
+        height: auto;
+        object-fit: cover;
+        border-radius: 15px;
+        transition: all 0.3s ease;
+    }
+    .rounded-img:hover {
+        filter: brightness(1.1);
+    }
+""")
+
+
+def _placeholder_attrs(entry):
+    """
+    Build the <img> attributes that stand in for an image while it loads.
+
+    The blurred thumbnail (or, for manifests built before placeholders
+    existed, nothing) is painted as the element's background, which the image
+    covers once it has loaded. width/height give the element its aspect ratio
+    before then.
+
+    Args:
+    entry (dict or None): Manifest entry of the image.
+
+    Returns:
+    str: Attribute string starting with a space, or "" without an entry.
+    """
+    if entry is None:
+        return ""
+    largest = max(entry["variants"], key=lambda v: v["width"])
+    attrs = f' width="{largest["width"]}" height="{largest["height"]}"'
+    if "placeholder" in entry:
+        attrs += (f' style="background: {entry["color"]} url({entry["placeholder"]}) '
+                  'center / cover no-repeat;"')
+    return attrs
+
+
+def _gallery_item(image_path, sizes):
+    """
+    Build the HTML for one gallery image.
+
+    Args:
+    image_path (str): Path to the image file.
+    sizes (str): Value of the img sizes attribute.
+
+    Returns:
+    str: A lazily loaded <picture> when the image has pre-encoded variants
+        and static serving is on, otherwise an inline data URI image.
+    """
+    entry = manifest_entry(image_path) if use_static_images() else None
+    if entry is None:
+        return f'<div class="img-container"><img src="{cached_image(image_path)}" class="rounded-img"></div>'
+
+    def srcset(fmt):
+        return ", ".join(f"{settings.STATIC_URL}/img/{v['file']} {v['width']}w"
+                         for v in entry["variants"] if v["format"] == fmt)
+
+    # The placeholder attributes reserve the box before the image arrives so
+    # the grid doesn't shift, and show a blurred preview in it meanwhile.
+    fallback = image_url(image_path, "jpeg")
+    alt = image_path.rsplit("/", 1)[-1].rsplit(".", 1)[0].replace("_", " ")
+    return (
+        '<div class="img-container"><picture>'
+        f'<source type="image/webp" srcset="{srcset("webp")}" sizes="{sizes}">'
+        f'<img src="{fallback}" srcset="{srcset("jpeg")}" sizes="{sizes}"'
+        f'{_placeholder_attrs(entry)} alt="{alt}" '
+        'loading="lazy" decoding="async" class="rounded-img">'
+        '</picture></div>'
+    )
+
+
+@timed()
+def gallery(image_paths, columns=3):
+    """
+    Render images as a responsive, lazily loaded grid.
+
+    Args:
+    image_paths (list): Paths to the image files.
+    columns (int): Number of columns on wide screens; narrow screens get a
+        single column.
+    """
+    st.markdown(gallery_html(image_paths, columns), unsafe_allow_html=True)
+
+
+def gallery_html(image_paths, columns=3):
+    """
+    Build the HTML for a gallery grid.
+
+    Args:
+    image_paths (list): Paths to the image files.
+    columns (int): Number of columns on wide screens.
+
+    Returns:
+    str: HTML for the grid.
+    """
+    sizes = f"(max-width: 640px) 100vw, {100 // columns}vw"
+    items = "".join(_gallery_item(path, sizes) for path in image_paths)
+    return f'<div class="gallery" style="--gallery-columns: {columns};">{items}</div>'
+
+
+register_style("gallery", """
+    .gallery {
+        display: grid;
+        grid-template-columns: repeat(var(--gallery-columns, 3), minmax(0, 1fr));
+        gap: 1rem;
+        align-items: start;
+    }
+    @media (max-width: 640px) {
+        .gallery {
+            grid-template-columns: 1fr;
+        }
+    }
+""")
+
+
+def create_skill_tags(skills, title=None):
+    """
+    Create skill tags with styling.
+
+    Args:
+    skills (list): List of skill names.
+    title (str, optional): Title for the skills section.
+    """
+    if title:
+        st.subheader(title)
+
+    st.markdown(skills_html(skills, variant="tag"), unsafe_allow_html=True)
+
+
+register_style("skill-tags", """
+    .skill-container {
+        display: flex;
+        flex-wrap: wrap;
+        gap: 8px;
+        margin-bottom: 15px;
+    }
+    .skill-tag {
+        background-color: var(--color-light);
+        color: var(--color-secondary);
+        padding: 5px 10px;
+        border-radius: 15px;
+        font-size: 0.8em;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        transition: all 0.3s ease;
+    }
+    .skill-tag:hover {
+        background-color: var(--color-medium);
+        box-shadow: 0 4px 8px rgba(0,0,0,0.15);
+        transform: translateY(-2px);
+    }
+""")
+
+
+# variant -> (container class, item class)
+SKILL_VARIANTS = {
+    "card": ("skill-grid", "skill-card"),
+    "tag": ("skill-container", "skill-tag"),
+}
+
+register_style("skill-grid", """
+    .skill-grid {
+        display: grid;
+        grid-template-columns: repeat(auto-fill, minmax(9rem, 1fr));
+        gap: 20px;
+    }
+    .skill-card {
+        background: var(--color-light);
+        padding: 20px;
+        border-radius: 10px;
+        box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2);
+        text-align: center;
+        border: 2px solid var(--color-primary);
+        font-size: 14px;
+        color: var(--color-secondary);
+    }
+    .skill-card:nth-child(even) {
+        background: var(--color-background);
+    }
+""")
+
+
+def skills_html(skills, variant="card", categories=None):
+    """
+    Build a skills grid in a single HTML block.
+
+    Both the About page cards and the project skill tags go through here;
+    styling comes from shared classes rather than per-item inline styles.
+
+    Args:
+    skills (iterable): Skill entries, or plain skill names.
+    variant (str): "card" for the About page grid, "tag" for compact tags.
+    categories (iterable, optional): Only include skills in these
+        categories. Plain names have no category and are always included.
+
+    Returns:
+    str: HTML for the grid.
+    """
+    container, item = SKILL_VARIANTS[variant]
+    wanted = set(categories) if categories else None
+    items = []
+    for skill in skills:
+        if isinstance(skill, str):
+            label = skill
+        elif wanted is None or skill.category in wanted:
+            label = f"{skill.name} {skill.icon}".strip()
+        else:
+            continue
+        items.append(f'<div class="{item}">{escape(label)}</div>')
+    return f'<div class="{container}">{"".join(items)}</div>'
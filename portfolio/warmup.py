@@ -0,0 +1,55 @@
+"""
+Optional background warm-up of the process-wide caches.
+
+Streamlit only runs Home.py when a session connects, so after a deploy or
+scale-up the first visitor pays for parsing content.toml, reading the CV,
+loading the manifests and encoding images, and the first visit to each page
+pays for that page's assets. With ``PORTFOLIO_WARMUP=1`` the first script run
+in a process hands a list of cache fills to a daemon thread, which runs them
+while the first page renders, so later reruns and the other page find the
+caches hot.
+"""
+import threading
+import time
+
+from portfolio import settings
+
+_lock = threading.Lock()
+_started = False
+
+# name -> seconds taken, or the exception's repr if the task failed
+results = {}
+
+
+def _run(tasks):
+    for name, task in tasks:
+        start = time.perf_counter()
+        try:
+            task()
+        except Exception as e:  # a failed fill only means a cold cache
+            results[name] = repr(e)
+        else:
+            results[name] = round(time.perf_counter() - start, 4)
+
+
+def start(get_tasks):
+    """
+    Run the warm-up tasks in a background thread, once per process.
+
+    Args:
+    get_tasks (callable): Returns the (name, zero-argument callable) pairs
+        to run, in order. Only called when the warm-up actually starts.
+
+    Returns:
+    bool: True if this call started the warm-up, False if it is disabled or
+    already started.
+    """
+    global _started
+    if not settings.WARMUP or _started:
+        return False
+    with _lock:
+        if _started:
+            return False
+        _started = True
+    threading.Thread(target=_run, args=(get_tasks(),), name="portfolio-warmup", daemon=True).start()
+    return True
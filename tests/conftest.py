@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Let the tests import Home.py and the portfolio package without installing.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
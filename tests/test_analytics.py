@@ -0,0 +1,88 @@
+"""Page view counting, and Tracker flushes while another process holds the write lock."""
+import os
+import sqlite3
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from portfolio import analytics, assets, embeds
+from portfolio.analytics import Tracker
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def tracker(tmp_path, monkeypatch):
+    monkeypatch.setattr(analytics, "MIN_BACKOFF", 0.0)
+    # The writer thread never wakes on its own, so the test drives every flush.
+    tracker = Tracker(str(tmp_path / "analytics.sqlite3"), interval=3600)
+    tracker.flush()
+    tracker._connection().execute("PRAGMA busy_timeout = 50")
+    return tracker
+
+
+def hold_write_lock(path):
+    other = sqlite3.connect(path, isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")
+    return other
+
+
+def test_lock_timeout_keeps_the_batch(tracker):
+    for page in ("about", "projects", "contact"):
+        tracker.track("page_view", page)
+    other = hold_write_lock(tracker.path)
+
+    assert tracker.flush() == 0
+    assert tracker.stats() == {"queued": 3, "written": 0, "dropped": 0, "errors": 0, "busy": 1}
+    assert not tracker.disabled
+
+    other.rollback()
+    other.close()
+    assert tracker.flush() == 3
+    assert [value for kind, value, events, sessions in tracker.counts()] == ["about", "contact", "projects"]
+    assert [row[0] for row in tracker._connection().execute("SELECT value FROM events ORDER BY rowid")] == [
+        "about", "projects", "contact"]
+
+
+def test_flush_waits_for_the_backoff(tracker, monkeypatch):
+    monkeypatch.setattr(analytics, "MIN_BACKOFF", 60.0)
+    tracker.track("page_view", "about")
+    other = hold_write_lock(tracker.path)
+    assert tracker.flush() == 0
+    other.rollback()
+    other.close()
+
+    assert tracker.flush() == 0
+    tracker._retry_at = 0.0
+    assert tracker.flush() == 1
+
+
+def test_other_errors_disable_the_tracker(tmp_path):
+    path = tmp_path / "analytics.sqlite3"
+    path.write_bytes(b"not a database" * 100)
+    tracker = Tracker(str(path), interval=3600)
+    tracker.track("page_view", "about")
+
+    assert tracker.flush() == 0
+    assert tracker.disabled
+    assert tracker.stats()["dropped"] == 1
+
+
+def test_reruns_on_the_same_page_count_once(tmp_path, monkeypatch):
+    tracker = Tracker(str(tmp_path / "analytics.sqlite3"), interval=3600)
+    monkeypatch.setattr(analytics, "tracker", tracker)
+    monkeypatch.setattr(assets, "disk_cache", None)
+    monkeypatch.setattr(embeds.embed_cache, "refresh", lambda name: None)
+    monkeypatch.chdir(ROOT)
+    at = AppTest.from_file(os.path.join(ROOT, "Home.py"), default_timeout=120)
+
+    at.run()
+    at.run()
+    at.pills[0].set_value([at.pills[0].options[0]]).run()
+    at.switch_page("app_pages/projects.py").run()
+    at.switch_page("app_pages/about.py").run()
+    assert not at.exception
+
+    tracker.flush()
+    views = {value: events for kind, value, events, sessions in tracker.counts() if kind == "page_view"}
+    assert views == {"about": 2, "projects": 1}
@@ -0,0 +1,110 @@
+"""DiskCache under a write lock held by another process, and on a broken database."""
+import itertools
+import os
+import sqlite3
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from portfolio import disk_cache
+from portfolio.disk_cache import DiskCache
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache, "MIN_BACKOFF", 0.0)
+    cache = DiskCache(str(tmp_path / "assets.sqlite3"), timeout=0.05)
+    cache.set("warm", "up")
+    return cache
+
+
+def hold_write_lock(path):
+    """Take the write lock the way another Streamlit process's set() does."""
+    other = sqlite3.connect(path, isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")
+    return other
+
+
+def test_lock_timeout_is_a_miss_and_retried(cache):
+    other = hold_write_lock(cache.path)
+    cache.set("key", "value")
+    assert cache.busy == 1
+    assert cache.errors == 0
+    assert not cache.disabled
+
+    other.rollback()
+    other.close()
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+    assert cache.stats()["entries"] == 2
+
+
+def test_lookups_during_the_backoff_are_misses(cache, monkeypatch):
+    monkeypatch.setattr(disk_cache, "MIN_BACKOFF", 60.0)
+    other = hold_write_lock(cache.path)
+    cache.set("key", "value")
+    other.rollback()
+    other.close()
+
+    assert cache.get("warm") is None
+    assert cache.misses == 1
+    cache.set("key", "value")
+    assert cache.busy == 1
+
+    cache._retry_at = 0.0
+    assert cache.get("warm") == "up"
+
+
+def test_backoff_doubles_while_the_lock_is_held(cache, monkeypatch):
+    monkeypatch.setattr(disk_cache, "MIN_BACKOFF", 1.0)
+    other = hold_write_lock(cache.path)
+    for backoff in (1.0, 2.0, 4.0):
+        cache._retry_at = 0.0
+        cache.set("key", "value")
+        assert cache._backoff == backoff
+
+    other.rollback()
+    other.close()
+    cache._retry_at = 0.0
+    cache.set("key", "value")
+    assert cache._backoff == 0.0
+
+
+def test_other_errors_disable_the_cache(tmp_path):
+    path = tmp_path / "assets.sqlite3"
+    path.write_bytes(b"not a database" * 100)
+    cache = DiskCache(str(path))
+
+    assert cache.get("key") is None
+    assert cache.errors == 1
+    assert cache.disabled
+    assert os.path.getsize(path) == 1400
+
+
+def test_least_recently_used_entries_are_evicted_over_the_cap(tmp_path, monkeypatch):
+    cache = DiskCache(str(tmp_path / "assets.sqlite3"), max_bytes=1000)
+    # Every access is a TOUCH_INTERVAL and more after the previous one.
+    clock = itertools.count(1000, 100)
+    monkeypatch.setattr(disk_cache, "time", SimpleNamespace(time=lambda: next(clock), monotonic=time.monotonic))
+    for key in "abcd":
+        cache.set(key, b"x" * 300)
+    assert cache.stats()["entries"] == 3
+    assert cache.get("a") is None
+
+    # Reading b re-stamps it, so c is now the least recently used.
+    assert cache.get("b") == b"x" * 300
+    cache.set("e", b"x" * 300)
+
+    assert [cache.get(key) is not None for key in "bcde"] == [True, False, True, True]
+    assert cache.evictions == 2
+    assert cache.stats()["bytes"] == 900
+
+
+def test_value_larger_than_the_cap_is_not_stored(tmp_path):
+    cache = DiskCache(str(tmp_path / "assets.sqlite3"), max_bytes=100)
+    cache.set("small", "x" * 50)
+    cache.set("big", "x" * 101)
+
+    assert cache.get("big") is None
+    assert cache.get("small") == "x" * 50
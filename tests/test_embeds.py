@@ -0,0 +1,200 @@
+"""EmbedCache against a local stand-in for the upstream hosts."""
+import os
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from portfolio.embeds import EmbedCache, sanitize_svg
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\0" * 32
+
+
+class Upstream(BaseHTTPRequestHandler):
+    """Serves server.responses[path] = (status, content type, body) and counts requests."""
+
+    def do_GET(self):
+        self.server.requests += 1
+        status, content_type, body = self.server.responses[self.path]
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def upstream():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Upstream)
+    server.requests = 0
+    server.responses = {"/icon": (200, "image/png", PNG)}
+    server.url = f"http://127.0.0.1:{server.server_port}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def garbage_upstream():
+    """A raw socket that answers every request with something that isn't HTTP."""
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+
+    def serve():
+        while True:
+            try:
+                connection, _ = listener.accept()
+            except OSError:
+                return
+            with connection:
+                connection.recv(4096)
+                connection.sendall(b"garbage\r\n\r\n")
+
+    threading.Thread(target=serve, daemon=True).start()
+    yield f"http://127.0.0.1:{listener.getsockname()[1]}"
+    listener.close()
+
+
+def make_cache(tmp_path, url, **kwargs):
+    fallback_dir = tmp_path / "fallback"
+    fallback_dir.mkdir(exist_ok=True)
+    (fallback_dir / "icon.svg").write_text("<svg/>")
+    return EmbedCache({"icon": (url, "icon.svg")}, cache_dir=str(tmp_path / "embeds"),
+                      fallback_dir=str(fallback_dir), timeout=2, **kwargs)
+
+
+def wait_for_refresh(cache, name="icon"):
+    for thread in threading.enumerate():
+        if thread.name == f"embed-refresh-{name}":
+            thread.join(5)
+    assert name not in cache._refreshing
+
+
+def test_fresh_copy_is_served_without_refetching(tmp_path, upstream):
+    cache = make_cache(tmp_path, f"{upstream.url}/icon")
+    meta = cache.fetch("icon")
+
+    path, is_fallback = cache.resolve("icon")
+    wait_for_refresh(cache)
+
+    assert not is_fallback
+    assert path == os.path.join(cache.cache_dir, meta["file"])
+    with open(path, "rb") as f:
+        assert f.read() == PNG
+    assert upstream.requests == 1
+
+
+def test_stale_copy_is_served_while_it_is_refetched(tmp_path, upstream):
+    cache = make_cache(tmp_path, f"{upstream.url}/icon", ttl=60)
+    old = cache.fetch("icon")
+    # Age the copy past the TTL, and change what upstream serves.
+    meta_path = cache._meta_path("icon")
+    with open(meta_path, "w") as f:
+        f.write(f'{{"file": "{old["file"]}", "content_type": "image/png", "fetched_at": {time.time() - 120}}}')
+    upstream.responses["/icon"] = (200, "image/png", PNG + b"new")
+
+    path, is_fallback = cache.resolve("icon")
+    assert not is_fallback
+    assert path.endswith(old["file"])
+
+    wait_for_refresh(cache)
+    path, is_fallback = cache.resolve("icon")
+    assert not is_fallback
+    with open(path, "rb") as f:
+        assert f.read() == PNG + b"new"
+    assert not os.path.exists(os.path.join(cache.cache_dir, old["file"]))
+
+
+def test_upstream_down_serves_the_fallback_and_backs_off(tmp_path):
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    cache = make_cache(tmp_path, f"http://127.0.0.1:{port}/icon", retry_after=60)
+
+    path, is_fallback = cache.resolve("icon")
+    assert is_fallback
+    assert path.endswith("icon.svg")
+
+    wait_for_refresh(cache)
+    assert cache._failed_at["icon"] is not None
+    assert cache.refresh("icon") is None  # still within retry_after
+    assert cache.resolve("icon")[1]
+
+
+def test_non_image_response_is_rejected(tmp_path, upstream):
+    upstream.responses["/icon"] = (200, "text/html", b"<html>rate limited</html>")
+    cache = make_cache(tmp_path, f"{upstream.url}/icon")
+
+    with pytest.raises(OSError):
+        cache.fetch("icon")
+
+    assert cache.resolve("icon")[1]
+    wait_for_refresh(cache)
+    assert cache._failed_at["icon"] is not None
+    assert cache.metadata("icon") is None
+
+
+def test_protocol_error_does_not_stop_later_refreshes(tmp_path, garbage_upstream):
+    cache = make_cache(tmp_path, f"{garbage_upstream}/icon", retry_after=0)
+
+    cache.refresh("icon").join(5)
+
+    assert "icon" not in cache._refreshing
+    assert cache._failed_at["icon"] is not None
+    thread = cache.refresh("icon")
+    assert thread is not None
+    thread.join(5)
+
+
+SCRIPTED_SVG = b"""<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink"
+    xmlns:html="http://www.w3.org/1999/xhtml" viewBox="0 0 10 10" onload="alert(1)">
+<script>alert(2)</script><html:script>alert(3)</html:script>
+<foreignObject><html:iframe src="https://example.com"/></foreignObject>
+<a xlink:href=" java&#10;script:alert(4)"><rect width="5" height="5" fill="#fff" ONCLICK="alert(5)"/></a>
+<set attributeName="href" to="javascript:alert(6)"/><use href="#card"/><text x="1">Stats</text></svg>"""
+
+
+def test_svg_is_stored_without_script(tmp_path, upstream):
+    upstream.responses["/icon"] = (200, "image/svg+xml", SCRIPTED_SVG)
+    cache = make_cache(tmp_path, f"{upstream.url}/icon")
+
+    meta = cache.fetch("icon")
+    with open(os.path.join(cache.cache_dir, meta["file"]), "rb") as f:
+        stored = f.read()
+
+    for unsafe in (b"script", b"alert", b"onload", b"onclick", b"foreignObject", b"iframe", b"<set"):
+        assert unsafe not in stored.lower()
+    assert b'<use href="#card" />' in stored
+    assert b'<text x="1">Stats</text>' in stored
+    assert cache.resolve("icon") == (os.path.join(cache.cache_dir, meta["file"]), False)
+
+
+@pytest.mark.parametrize("svg", [
+    b'<!DOCTYPE svg [<!ENTITY x "y">]><svg xmlns="http://www.w3.org/2000/svg">&x;</svg>',
+    b"<svg xmlns='http://www.w3.org/2000/svg'><rect></svg>",
+    b"<html><script>alert(1)</script></html>",
+])
+def test_unsafe_svg_is_rejected(svg):
+    with pytest.raises(ValueError):
+        sanitize_svg(svg)
+
+
+def test_svg_cached_before_sanitizing_is_refetched(tmp_path, upstream):
+    cache = make_cache(tmp_path, f"{upstream.url}/icon")
+    os.makedirs(cache.cache_dir)
+    with open(os.path.join(cache.cache_dir, "icon-old.svg"), "wb") as f:
+        f.write(SCRIPTED_SVG)
+    with open(cache._meta_path("icon"), "w") as f:
+        f.write(f'{{"file": "icon-old.svg", "content_type": "image/svg+xml", "fetched_at": {time.time()}}}')
+
+    assert cache.metadata("icon") is None
+    assert cache.resolve("icon")[1]
+    wait_for_refresh(cache)
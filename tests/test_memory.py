@@ -0,0 +1,51 @@
+"""A session's server-side footprint stays flat over hundreds of reruns."""
+import os
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from portfolio import analytics, assets, embeds, memory
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RERUNS = 300
+# Enough filter changes to visit every skill category before measuring.
+WARMUP_RUNS = 20
+
+
+def footprint(report):
+    return report["emitted_total"] + (report["media"] or 0) + (report["widget_state"] or 0)
+
+
+@pytest.fixture
+def audited(monkeypatch):
+    """Turn the memory audit on, and keep the app off the network and shared caches."""
+    monkeypatch.setattr(memory, "ENABLED", True)
+    monkeypatch.setattr(analytics, "tracker", None)
+    monkeypatch.setattr(assets, "disk_cache", None)
+    monkeypatch.setattr(embeds.embed_cache, "refresh", lambda name: None)
+    monkeypatch.chdir(ROOT)
+    memory.install()
+
+
+def test_session_footprint_stays_flat(audited):
+    at = AppTest.from_file(os.path.join(ROOT, "Home.py"), default_timeout=120)
+    categories = None
+
+    def rerun(i):
+        nonlocal categories
+        if categories is None or i % 2 == 0:
+            at.run()
+        else:
+            at.pills[0].set_value([categories[i % len(categories)]]).run()
+        assert not at.exception, at.exception[0].message
+        categories = list(at.pills[0].options)
+        return next(reversed(memory.reports.values()))
+
+    # The filter changes which skills are emitted, so compare against the
+    # largest footprint seen while the warm-up went through the categories.
+    warmup_largest = max(footprint(rerun(i)) for i in range(WARMUP_RUNS))
+    reports = [rerun(i) for i in range(WARMUP_RUNS, WARMUP_RUNS + RERUNS)]
+
+    assert max(footprint(report) for report in reports) <= warmup_largest
+    assert all(report["media"] == 0 for report in reports)
+    assert reports[-1]["fragments"] == reports[0]["fragments"]
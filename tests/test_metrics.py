@@ -0,0 +1,42 @@
+"""The metrics endpoint when its port is already taken, and the cache counters it serves."""
+import logging
+import socket
+
+from portfolio import metrics, settings
+
+
+def test_taken_port_logs_a_warning_instead_of_failing(monkeypatch, caplog):
+    with socket.socket() as taken:
+        taken.bind(("127.0.0.1", 0))
+        taken.listen()
+        monkeypatch.setattr(settings, "METRICS_PORT", taken.getsockname()[1])
+        monkeypatch.setattr(metrics, "ENABLED", True)
+        monkeypatch.setattr(metrics, "_installed", False)
+        monkeypatch.setattr(metrics, "_instrument_markdown", lambda: None)
+
+        with caplog.at_level(logging.WARNING, logger="portfolio.metrics"):
+            metrics.install()
+            metrics.install()
+
+    assert metrics._installed
+    assert [record.getMessage().split(":")[0] for record in caplog.records] == [
+        f"Metrics endpoint not started on port {settings.METRICS_PORT}"]
+
+
+def test_cv_reads_are_counted_apart_from_other_files(tmp_path, monkeypatch):
+    from portfolio import assets
+
+    monkeypatch.setattr(assets, "cv_cache", assets.AssetCache(maxsize=1))
+    monkeypatch.setattr(assets, "file_cache", assets.AssetCache(maxsize=8))
+    cv = tmp_path / "cv.pdf"
+    cv.write_bytes(b"%PDF")
+    icon = tmp_path / "icon.svg"
+    icon.write_bytes(b"<svg/>")
+
+    for _ in range(3):
+        assets.read_file(str(cv), assets.cv_cache)
+        assets.read_file(str(icon))
+
+    assert 'portfolio_cache_misses_total{cache="cv"} 1' in metrics.prometheus_text().splitlines()
+    assert assets.cv_cache.hits == 2
+    assert assets.file_cache.misses == 1
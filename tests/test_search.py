@@ -0,0 +1,126 @@
+"""Tokenizing, prefix matching, ranking and AND semantics of the search index."""
+import threading
+
+import pytest
+
+from portfolio.search import MAX_CANDIDATES, Document, SearchIndex, search_index, tokenize
+
+
+def titles(results):
+    return [result.document.title for result in results]
+
+
+def test_tokenize_lowercases_and_drops_link_targets():
+    assert tokenize("Built a **Flask** API, see [the repo](https://github.com/x/y).") == [
+        "built", "a", "flask", "api", "see", "the", "repo"]
+    assert tokenize("") == []
+
+
+def test_words_match_as_prefixes():
+    index = SearchIndex([Document("project", "Streamlit portfolio", "projects"),
+                         Document("project", "Spring service", "projects")])
+
+    assert titles(index.search("stream")) == ["Streamlit portfolio"]
+    assert titles(index.search("SPR")) == ["Spring service"]
+    assert index.search("streams") == []
+
+
+def test_short_tokens_only_match_exactly():
+    index = SearchIndex([Document("skill", "C", "about"), Document("skill", "Canva", "about")])
+
+    assert titles(index.search("c")) == ["C"]
+    assert titles(index.search("ca")) == ["Canva"]
+
+
+def test_exact_matches_rank_above_prefix_matches():
+    index = SearchIndex([Document("project", "Javascript widgets", "projects"),
+                         Document("project", "Java service", "projects")])
+
+    assert titles(index.search("java")) == ["Java service", "Javascript widgets"]
+
+
+def test_title_and_tag_matches_rank_above_body_matches():
+    index = SearchIndex([Document("project", "Scheduler", "projects", body="written in python"),
+                         Document("project", "Python CLI", "projects"),
+                         Document("project", "Dashboard", "projects", tags=("Python",))])
+
+    assert titles(index.search("python")) == ["Python CLI", "Dashboard", "Scheduler"]
+
+
+def test_every_word_must_match():
+    index = SearchIndex([Document("project", "Flask API", "projects", body="python backend"),
+                         Document("project", "Django site", "projects", body="python web app"),
+                         Document("project", "Spring service", "projects", body="java backend")])
+
+    assert titles(index.search("python backend")) == ["Flask API"]
+    assert titles(index.search("backend python")) == ["Flask API"]
+    assert index.search("python java") == []
+    assert index.search("   ") == []
+
+
+def test_weak_match_of_common_words_is_not_lost():
+    # Both words drive more than MAX_CANDIDATES documents, and the one
+    # document having both only mentions them in its body.
+    documents = [Document("project", f"django app {i}", "projects") for i in range(MAX_CANDIDATES + 172)]
+    documents += [Document("project", f"python tool {i}", "projects") for i in range(MAX_CANDIDATES + 172)]
+    documents.append(Document("project", "Other", "projects", body="python and django"))
+    index = SearchIndex(documents)
+
+    assert titles(index.search("python django")) == ["Other"]
+    assert titles(index.search("django python")) == ["Other"]
+    assert titles(index.search("pyth djan")) == ["Other"]
+
+
+def test_documents_matching_several_terms_of_a_prefix_count_once(monkeypatch):
+    # 200 postings for "djan", but only 100 documents: every candidate was
+    # seen, so a short result list needs no fallback to the full postings.
+    documents = [Document("project", f"django djangonaut {i}", "projects") for i in range(100)]
+    documents.append(Document("project", "django rest", "projects"))
+    index = SearchIndex(documents)
+    monkeypatch.setattr(index, "_matching", lambda tokens: pytest.fail("fell back to _matching"))
+
+    assert index._frequency("djan") == 101
+    assert titles(index.search("djan rest")) == ["django rest"]
+
+
+def test_concurrent_queries_share_the_candidate_cache():
+    index = SearchIndex([Document("project", f"project {word}", "projects")
+                         for word in ("alpha", "beta", "gamma", "delta")])
+    expected = {query: titles(SearchIndex(index.documents).search(query))
+                for query in ("al", "be", "project", "pro ga", "de")}
+    failures = []
+
+    def run():
+        for _ in range(200):
+            for query, titles_expected in expected.items():
+                if titles(index.search(query)) != titles_expected:
+                    failures.append(query)
+
+    threads = [threading.Thread(target=run) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert failures == []
+    assert index._candidate_cache.stats()["misses"] <= 8 * len(expected)
+
+
+def test_limit_keeps_the_best_results():
+    index = SearchIndex([Document("project", f"python tool {i}", "projects") for i in range(20)]
+                        + [Document("project", "Python", "projects", tags=("Python",))])
+
+    results = index.search("python", limit=3)
+
+    assert len(results) == 3
+    assert titles(results)[0] == "Python"
+    assert results[0].score >= results[1].score >= results[2].score
+
+
+def test_index_is_shared_per_content_version():
+    from portfolio.content import load_content
+
+    content = load_content()
+
+    assert search_index(content) is search_index(content)
+    assert search_index(content).search("python")